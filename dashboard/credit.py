@@ -1,31 +1,284 @@
 # credit.py
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
-from sqlalchemy import create_engine
+from sqlalchemy import text
+from data import get_db_engine, leer_tabla_con_version, version_tabla
+from figuras import figura_cacheada
+from instrumentacion import fragmento, medir
 
 #Funciones de Carga de Datos con Caché
 
-@st.cache_resource
-def get_db_engine(DB_USER, DB_PASS, DB_HOST, DB_PORT):
-    """Crea y cachea la conexión a la base de datos Gold."""
+@medir(cache=st.cache_data(max_entries=256))
+def load_bureau_cliente(_engine, sk_id_curr, version):
+    """
+    Consulta, usando el índice por SK_ID_CURR, los créditos de un cliente en 'bureau'.
+    'version' (la de 'bureau' en gold_manifest) invalida la caché al reconstruir gold.
+    """
+    query = text("SELECT SK_ID_CURR, CREDIT_TYPE, CREDIT_ACTIVE FROM bureau WHERE SK_ID_CURR = :sk_id_curr")
     try:
-        # Asegúrate de que esta cadena de conexión sea correcta para tu sistema
-        engine = create_engine(f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/gold")
-        return engine
+        return pd.read_sql(query, _engine, params={"sk_id_curr": int(sk_id_curr)})
     except Exception as e:
-        st.error(f"Error de conexión a la base de datos: {e}")
-        return None
+        st.error(f"No se pudo consultar la tabla 'bureau'. Error: {e}")
+        return pd.DataFrame(columns=['SK_ID_CURR', 'CREDIT_TYPE', 'CREDIT_ACTIVE'])
+
+@medir(cache=st.cache_data(max_entries=4))
+def load_rango_bureau(_engine, version):
+    """Consulta el rango de SK_ID_CURR de 'bureau' (una vez por versión de la tabla)."""
+    rango = pd.read_sql("SELECT MIN(SK_ID_CURR) AS id_min, MAX(SK_ID_CURR) AS id_max FROM bureau", _engine)
+    return int(rango['id_min'].iloc[0]), int(rango['id_max'].iloc[0])
+
+@medir
+def load_bureau_resumen(_engine):
+    """
+    Obtiene de la caché compartida las distribuciones globales de 'bureau' materializadas
+    en la construcción de gold, y el rango de IDs de cliente.
 
-@st.cache_data
-def load_gold_data(_engine, table_name="gold_active_customer_profile"):
-    """Carga una tabla específica desde la base de datos."""
+    Retorno: diccionario con 'estado' y 'tipo' (DataFrames), 'id_min' / 'id_max' y
+    'versiones' (las de los dos resúmenes, para la caché de figuras); vacío si las
+    tablas no están disponibles.
+    """
+    estado, version_estado = leer_tabla_con_version(_engine, "bureau_estado_resumen")
+    tipo, version_tipo = leer_tabla_con_version(_engine, "bureau_tipo_resumen")
+    resumenes = {'estado': estado, 'tipo': tipo}
+    if any(resumen.empty for resumen in resumenes.values()):
+        return {}
     try:
-        df = pd.read_sql(f"SELECT * FROM {table_name}", _engine)
-        return df
+        id_min, id_max = load_rango_bureau(_engine, version_tabla(_engine, "bureau"))
+        return {
+            **resumenes, 'id_min': id_min, 'id_max': id_max,
+            'versiones': (version_estado, version_tipo),
+        }
     except Exception as e:
-        st.error(f"No se pudo cargar la tabla '{table_name}'. Error: {e}")
-        return pd.DataFrame()
+        st.error(f"No se pudieron cargar los resúmenes de 'bureau'. Error: {e}")
+        return {}
+
+@medir(cache=st.cache_resource(max_entries=2))
+def preparar_ranking_riesgo(_df, version):
+    """
+    Precalcula un índice global de la cartera ordenado de mayor a menor RISK_SCORE,
+    junto con las columnas usadas por los filtros como arreglos de NumPy. Se reconstruye
+    cuando cambia la versión de la tabla en gold.
+
+    Retorno: diccionario con el orden global ('orden'), las puntuaciones ('score')
+    y los valores de saldo ('balance') y préstamos ('prestamos') por posición.
+    """
+    df = _df
+    score = df['RISK_SCORE'].to_numpy(dtype=float)
+    return {
+        'orden': np.argsort(-score, kind='stable'),
+        'score': score,
+        'balance': df['AVG_BALANCE_TDC'].to_numpy(dtype=float),
+        'prestamos': df['TOTAL_LOANS_WITH_INSTALLMENTS'].to_numpy(dtype=float),
+    }
+
+def _cumple_filtros(ranking, posiciones, filtros):
+    """Evalúa los filtros de la barra lateral solo sobre las posiciones indicadas."""
+    (saldo_min, saldo_max), (prestamos_min, prestamos_max) = filtros
+    balance = ranking['balance'][posiciones]
+    prestamos = ranking['prestamos'][posiciones]
+    return (
+        (balance >= saldo_min) & (balance <= saldo_max) &
+        (prestamos >= prestamos_min) & (prestamos <= prestamos_max)
+    )
+
+@medir(cache=st.cache_data(max_entries=128))
+def top_k_riesgo(_ranking, version, filtros, k=10):
+    """
+    Devuelve las posiciones (en el orden de la tabla gold) de los K clientes con mayor
+    RISK_SCORE que cumplen los filtros, ordenadas de mayor a menor riesgo.
+
+    El resultado se cachea por tupla de filtros. En vistas sin filtrar o poco filtradas
+    se recorre el índice global ordenado en bloques crecientes hasta encontrar K clientes;
+    si el filtro es muy selectivo y el recorrido supera un cuarto de la cartera, se usa
+    argpartition (O(n)) sobre la vista filtrada en lugar de ordenar toda la cartera.
+    """
+    orden = _ranking['orden']
+    score = _ranking['score']
+    total = len(orden)
+
+    # 1. Recorrido del índice global ordenado
+    seleccionados = []
+    encontrados = 0
+    inicio = 0
+    bloque = max(4 * k, 256)
+    while inicio < total // 4:
+        posiciones = orden[inicio:inicio + bloque]
+        posiciones = posiciones[_cumple_filtros(_ranking, posiciones, filtros)]
+        seleccionados.append(posiciones)
+        encontrados += len(posiciones)
+        if encontrados >= k:
+            return np.concatenate(seleccionados)[:k]
+        inicio += bloque
+        bloque *= 2
+
+    # 2. Selección parcial sobre la vista filtrada
+    candidatos = np.flatnonzero(_cumple_filtros(_ranking, slice(None), filtros))
+    if len(candidatos) > k:
+        candidatos = candidatos[np.argpartition(-score[candidatos], k - 1)[:k]]
+    return candidatos[np.argsort(-score[candidatos], kind='stable')]
+
+# Métricas de riesgo de la matriz de correlación y columnas usadas por los KPIs
+COLUMNAS_CORRELACION = [
+    'FRAC_LATE_INSTALLMENTS',
+    'AVG_DAYS_LATE',
+    'MAX_DAYS_LATE',
+    'AVG_UTILIZATION_RATIO_TDC',
+    'AVG_DPD_TDC',
+    'MAX_DPD_TDC',
+    'RISK_SCORE'
+]
+COLUMNAS_KPI = ['AVG_BALANCE_TDC', 'CON_ATRASOS']
+
+# Categorías de antigüedad de 'credit_perfil_riesgo', en el orden en que se grafican
+ORDEN_ANTIGUEDAD = ['Nuevo (1 Préstamo)', 'Principiante (2-3)', 'Intermedio (4-5)', 'Experimentado (6-10)', 'Veterano (10+)']
+# Categorías de morosidad (DPD_CATEGORY) de 'credit_perfil_riesgo', en el orden en que se grafican
+ORDEN_MOROSIDAD = ['Puntual (0 meses)', 'Ocasional (1-2)', 'Recurrente (3-5)', 'Crónico (5+)']
+
+# Celdas objetivo de la rejilla del filtro de saldo (ver 'paso_saldo')
+CELDAS_SALDO = 100
+
+def paso_saldo(saldo_max):
+    """
+    Paso del slider de saldo promedio: la potencia de 10 que deja entre 100 y 1.000 celdas
+    entre 0 y el saldo máximo. Las estadísticas suficientes se agrupan en esa misma rejilla.
+    """
+    if not np.isfinite(saldo_max) or saldo_max <= CELDAS_SALDO:
+        return 1
+    return int(10 ** np.floor(np.log10(saldo_max / CELDAS_SALDO)))
+
+def clave_saldo(balance, paso):
+    """
+    Celda de la rejilla del slider de saldo: 2*k para un saldo igual a k*paso y 2*k + 1 para
+    uno entre k*paso y (k + 1)*paso. Con extremos múltiplos del paso, el filtro
+    saldo_min <= saldo <= saldo_max equivale a 2*saldo_min/paso <= clave <= 2*saldo_max/paso.
+    Los saldos nulos quedan fuera de cualquier rango, como en el filtro de pandas.
+    """
+    celda = np.floor(balance / paso)
+    celda -= celda * paso > balance  # la división puede redondear hacia arriba justo bajo un múltiplo
+    clave = 2 * celda + (balance != celda * paso)
+    return np.where(np.isnan(balance), np.iinfo(np.int64).max, clave).astype(np.int64)
+
+@medir
+def construir_estadisticas_suficientes(df, columnas, paso):
+    """
+    Precalcula estadísticas suficientes (n, Σx, Σxy) de las columnas indicadas por bin de la
+    rejilla de los filtros de la barra lateral: número de préstamos (entero) y celda de saldo
+    del slider (ver 'clave_saldo'). El resultado es exacto para cualquier posición de los
+    sliders, y el número de bins depende de la rejilla (préstamos x ~2*CELDAS_SALDO a
+    2*10*CELDAS_SALDO) y no del número de clientes; a cambio, el slider de saldo avanza en
+    pasos de 'paso' en lugar de 1. Las columnas se centran en su media global para conservar
+    precisión numérica en Σxy.
+
+    Retorno: diccionario con el paso, las claves de cada bin y la matriz de sumas por bin.
+    """
+    balance = df['AVG_BALANCE_TDC'].to_numpy(dtype=float)
+    prestamos = df['TOTAL_LOANS_WITH_INSTALLMENTS'].to_numpy(dtype=float)
+    X = df[columnas].to_numpy(dtype=float)
+    centro = X.mean(axis=0)
+    X = X - centro
+
+    claves, bin_de_fila = np.unique(
+        np.column_stack([prestamos, clave_saldo(balance, paso)]), axis=0, return_inverse=True)
+    bin_de_fila = bin_de_fila.ravel()
+
+    # Sumas por bin: filas, Σx_i y Σx_i*x_j (triángulo superior)
+    i_sup, j_sup = np.triu_indices(len(columnas))
+    sumas = np.empty((len(claves), 1 + len(columnas) + len(i_sup)))
+    sumas[:, 0] = np.bincount(bin_de_fila, minlength=len(claves))
+    for k in range(len(columnas)):
+        sumas[:, 1 + k] = np.bincount(bin_de_fila, weights=X[:, k], minlength=len(claves))
+    for k, (i, j) in enumerate(zip(i_sup, j_sup)):
+        sumas[:, 1 + len(columnas) + k] = np.bincount(bin_de_fila, weights=X[:, i] * X[:, j], minlength=len(claves))
+
+    return {
+        'columnas': list(columnas),
+        'centro': centro,
+        'paso': paso,
+        'bin_prestamos': claves[:, 0],
+        'bin_saldo': claves[:, 1],
+        'sumas': sumas,
+    }
+
+@medir(cache=st.cache_resource(max_entries=2))
+def preparar_estadisticas_suficientes(_df, version):
+    """Construye una vez por versión de la tabla el almacén de estadísticas suficientes de la cartera."""
+    df = _df.assign(CON_ATRASOS=(_df['FRAC_LATE_INSTALLMENTS'] > 0).astype(float))
+    paso = paso_saldo(df['AVG_BALANCE_TDC'].max())
+    return construir_estadisticas_suficientes(df, COLUMNAS_CORRELACION + COLUMNAS_KPI, paso)
+
+@medir(cache=st.cache_data(max_entries=128))
+def resumir_estadisticas(_estadisticas, version, filtros):
+    """
+    Ensambla, sumando bins, el número de clientes, las medias, las varianzas y la
+    matriz de correlación de la cartera filtrada, sin pasar por las filas originales.
+
+    Retorno: diccionario con 'n', 'media' y 'varianza' (pd.Series) y 'correlacion'
+    (pd.DataFrame), equivalentes a los de pandas sobre el DataFrame filtrado.
+    """
+    (saldo_min, saldo_max), (prestamos_min, prestamos_max) = filtros
+    columnas = _estadisticas['columnas']
+    paso = _estadisticas['paso']
+    bin_prestamos = _estadisticas['bin_prestamos']
+    bin_saldo = _estadisticas['bin_saldo']
+    seleccion = (
+        (bin_prestamos >= prestamos_min) & (bin_prestamos <= prestamos_max) &
+        (bin_saldo >= 2 * (saldo_min // paso)) & (bin_saldo <= 2 * (saldo_max // paso))
+    )
+    total = _estadisticas['sumas'][seleccion].sum(axis=0)
+
+    # La primera columna de sumas cuenta filas, por lo que su total es n
+    p = len(columnas)
+    n = total[0]
+    suma = total[1:1 + p]
+    productos = np.zeros((p, p))
+    i_sup, j_sup = np.triu_indices(p)
+    productos[i_sup, j_sup] = total[1 + p:]
+    productos[j_sup, i_sup] = total[1 + p:]
+
+    # E[x²] - E[x]² pierde dígitos si la columna es casi constante en el filtro: una varianza
+    # del orden del error de redondeo de E[x²] se trata como cero (columna constante), igual
+    # que pandas devuelve NaN en la correlación
+    segundo_momento = np.diag(productos)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        media_centrada = suma / n
+        covarianza = productos / n - np.outer(media_centrada, media_centrada)
+        diagonal = np.diag(covarianza).copy()
+        diagonal[diagonal <= 64 * np.finfo(float).eps * segundo_momento / n] = 0.0
+        np.fill_diagonal(covarianza, diagonal)
+        desviacion = np.sqrt(diagonal)
+        denominador = np.outer(desviacion, desviacion)
+        correlacion = np.where(denominador > 0, np.clip(covarianza / denominador, -1, 1), np.nan)
+        varianza = np.diag(covarianza) * n / (n - 1)
+    np.fill_diagonal(correlacion, np.where(desviacion > 0, 1.0, np.nan))
+
+    return {
+        'n': int(n),
+        'media': pd.Series(_estadisticas['centro'] + media_centrada, index=columnas),
+        'varianza': pd.Series(varianza, index=columnas),
+        'correlacion': pd.DataFrame(correlacion, index=columnas, columns=columnas),
+    }
+
+@medir
+def preparar_datos(engine):
+    """
+    Lee el perfil de riesgo precalculado en el esquema 'dashboard' y obtiene (o construye,
+    una vez por versión) el ranking de riesgo y las estadísticas suficientes de la cartera.
+
+    Retorno: diccionario con 'df', 'version', 'ranking' y 'estadisticas'; vacío si la
+    tabla no está disponible.
+    """
+    df, version = leer_tabla_con_version(engine, "credit_perfil_riesgo")
+    if df.empty:
+        return {}
+    return {
+        'df': df,
+        'version': version,
+        'ranking': preparar_ranking_riesgo(df, version),
+        'estadisticas': preparar_estadisticas_suficientes(df, version),
+    }
 
 
 # Función para crear una tarjeta de KPI
@@ -55,6 +308,344 @@ def crear_kpi_box(title, value, color):
     """
     return html_content
 
+# Gráficos globales de bureau (se sirven desde la caché de figuras)
+
+@medir
+def construir_estado_global(estado):
+    """Barras de la distribución general del estado de los créditos en bureau."""
+    estado_global = estado.copy()
+    estado_global.columns = ['Estado', 'Frecuencia']
+
+    return px.bar(
+        estado_global,
+        x='Estado',
+        y='Frecuencia',
+        color='Estado',
+        title='Distribución General de Estado de Créditos',
+        text_auto=True
+    )
+
+@medir
+def construir_tipo_global(tipo, top_n):
+    """Torta de los 'top_n' tipos de crédito más frecuentes en bureau."""
+    tipo_global = tipo.nlargest(top_n, 'FRECUENCIA')
+    tipo_global.columns = ['Tipo', 'Frecuencia']
+
+    return px.pie(
+        tipo_global,
+        names='Tipo',
+        values='Frecuencia',
+        title=f'Top {top_n} Tipos de Crédito (Global)',
+        hole=0  # pastel completo
+    )
+
+#Pestañas de la página, cada una como fragmento que se vuelve a ejecutar por separado
+
+@fragmento
+def pestana_cuotas(df_filtered):
+    """Pestaña 1: comportamiento en cuotas de la cartera filtrada."""
+    
+    col1, col2 = st.columns(2)
+    
+    # Visualización 1: Frecuencia de Atrasos
+    with col1:
+        st.markdown("<h3 style='text-align: center; color: white;'>Frecuencia de Atrasos</h3>", unsafe_allow_html=True)
+        fig_freq = px.histogram(
+            df_filtered, 
+            x='FRAC_LATE_INSTALLMENTS',
+            nbins=30, # Agrupar en 30 barras para mejor visualización
+            labels={'FRAC_LATE_INSTALLMENTS': 'Proporción de Pagos Atrasados del Cliente'},
+            color_discrete_sequence=['#d8ddf9']
+        )
+        fig_freq.update_layout(
+            yaxis_title="Número de Clientes",
+            bargap=0.1
+        )
+        st.plotly_chart(fig_freq, use_container_width=True)
+        st.info("""
+        **Análisis:** Este gráfico muestra qué tan a menudo los clientes pagan tarde. 
+        - Un pico grande en `0.0` indica que la mayoría de los clientes son puntuales.
+        - Barras en el extremo derecho representan clientes crónicos que casi siempre pagan tarde.
+        """)
+
+    # Visualización 2: Severidad de los Atrasos
+    with col2:
+        st.markdown("<h3 style='text-align: center; color: white;'>Severidad de los Atrasos</h3>", unsafe_allow_html=True)
+        # Filtramos para ver solo los clientes que tienen al menos un atraso
+        df_con_atrasos = df_filtered[df_filtered['MAX_DAYS_LATE'] > 0]
+        
+        fig_sever = px.histogram(
+            df_con_atrasos, 
+            x='MAX_DAYS_LATE',
+            nbins=30,
+            labels={'MAX_DAYS_LATE': 'Máximo de Días de Atraso del Cliente'},
+            color_discrete_sequence=['#dc3545'] # Rojo para indicar severidad
+        )
+        fig_sever.update_layout(
+            yaxis_title="Número de Clientes",
+            bargap=0.1
+        )
+        st.plotly_chart(fig_sever, use_container_width=True)
+        st.info("""
+        **Análisis:** De los clientes que se atrasan, este gráfico muestra la gravedad de su peor atraso.
+        - Picos cerca de `0` indican atrasos menores (pocos días).
+        - Barras hacia la derecha (`>30`, `>60` días) señalan eventos de alto riesgo.
+        """)
+
+@fragmento
+def pestana_tarjetas(df_filtered):
+    """Pestaña 2: comportamiento en tarjetas de crédito de la cartera filtrada."""
+
+    col1, col2 = st.columns(2)
+    
+    # Visualización 3: Distribución de la Utilización de Crédito
+    with col1:
+        st.markdown("<h3 style='text-align: center; color: white;'>Utilización de Línea de Crédito</h3>", unsafe_allow_html=True)
+        # Filtramos para ver solo clientes con utilización > 0 para un gráfico más claro
+        df_con_utilizacion = df_filtered[df_filtered['AVG_UTILIZATION_RATIO_TDC'] > 0]
+
+        fig_util = px.histogram(
+            df_con_utilizacion, 
+            x='AVG_UTILIZATION_RATIO_TDC',
+            nbins=30,
+            labels={'AVG_UTILIZATION_RATIO_TDC': 'Ratio de Utilización Promedio'},
+            color_discrete_sequence=['#17a2b8'] # Color cian/azul claro
+        )
+        fig_util.update_layout(
+            yaxis_title="Número de Clientes",
+            bargap=0.1
+        )
+        st.plotly_chart(fig_util, use_container_width=True)
+        st.info("""
+        **Análisis:** Muestra qué porcentaje de su límite de crédito usan los clientes.
+        - `Utilización > 70%` (0.7) a menudo se asocia con un mayor estrés financiero y riesgo de impago.
+        - Picos a la izquierda indican un uso saludable y conservador del crédito.
+        """)
+
+    # Visualización 4: Persistencia de la Morosidad en TDC
+    with col2:
+        st.markdown("<h3 style='text-align: center; color: white;'>Persistencia de Morosidad (DPD)</h3>", unsafe_allow_html=True)
+        
+        # Contamos cuántos clientes caen en cada categoría de morosidad (precalculada como
+        # texto), en el orden de las categorías y con todas ellas aunque no tengan clientes
+        dpd_counts = (
+            df_filtered['DPD_CATEGORY'].value_counts()
+            .reindex(ORDEN_MOROSIDAD, fill_value=0)
+            .rename_axis('DPD_CATEGORY')
+            .reset_index(name='count')
+        )
+
+        fig_dpd = px.bar(
+            dpd_counts, 
+            x='DPD_CATEGORY', 
+            y='count',
+            title='', # El título ya está en el markdown
+            labels={'count': 'Número de Clientes', 'DPD_CATEGORY': 'Categoría de Morosidad'},
+            color='DPD_CATEGORY', # Colorear por categoría
+            color_discrete_map={ # Mapa de colores personalizado
+                'Puntual (0 meses)': '#28a745',
+                'Ocasional (1-2)': '#ffc107',
+                'Recurrente (3-5)': '#fd7e14',
+                'Crónico (5+)': '#dc3545'
+            }
+        )
+        fig_dpd.update_layout(xaxis={'categoryorder':'total descending'}) # Ordenar de mayor a menor
+        st.plotly_chart(fig_dpd, use_container_width=True)
+        
+        st.info("""
+        **Análisis:** Clasifica a los clientes por la cantidad de meses que han estado en mora (DPD > 0).
+        - `Puntual:` El segmento más saludable.
+        - `Ocasional:` Pueden ser errores o problemas puntuales.
+        - `Recurrente/Crónico:` El segmento de mayor riesgo que requiere atención inmediata.
+        """)
+
+@fragmento
+def pestana_segmentacion(df_filtered, df, ranking_riesgo, version, filtros):
+    """Pestaña 3: matriz riesgo/valor, top 10 de riesgo y detalle por cliente."""
+    
+    st.markdown("<h3 style='text-align: center; color: white;'>Matriz de Riesgo vs. Valor del Cliente</h3>", unsafe_allow_html=True)
+    fig_scatter = px.scatter(
+        df_filtered, 
+        x='AVG_UTILIZATION_RATIO_TDC', 
+        y='TOTAL_INSTALLMENTS_PAID', 
+        color='RISK_SCORE', 
+        color_continuous_scale=px.colors.sequential.OrRd, 
+        hover_name=df_filtered['SK_ID_CURR'], 
+        hover_data={'SK_ID_CURR': False, 'RISK_SCORE': ':.2f'}, 
+        labels={
+            'AVG_UTILIZATION_RATIO_TDC': 'RIESGO (Utilización de Crédito)', 
+            'TOTAL_INSTALLMENTS_PAID': 'VALOR (Experiencia del Cliente)', 
+            'RISK_SCORE': 'Puntuación de Riesgo'
+        }
+    )
+    fig_scatter.update_traces(marker=dict(size=8, opacity=0.7))
+    st.plotly_chart(fig_scatter, use_container_width=True)
+
+    # Visualización 3: Buscador de Clientes
+    st.markdown("<h3 style='text-align: center; color: white;'>Diagnóstico Individual de Cliente</h3>", unsafe_allow_html=True)
+    list_of_clients = sorted(df_filtered['SK_ID_CURR'].unique())
+    selected_client_id = st.selectbox("Selecciona un ID de Cliente para analizar:", options=list_of_clients, key='client_selector')
+    if selected_client_id:
+        client_data = df_filtered[df_filtered['SK_ID_CURR'] == selected_client_id].iloc[0]
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Puntuación de Riesgo", f"{client_data['RISK_SCORE']:.2f}")
+        m2.metric("% Utilización TDC", f"{client_data['AVG_UTILIZATION_RATIO_TDC']:.1%}")
+        m3.metric("% Cuotas Atrasadas", f"{client_data['FRAC_LATE_INSTALLMENTS']:.1%}")
+        m4.metric("Peor Atraso (Días)", f"{max(client_data['MAX_DAYS_LATE'], client_data['MAX_DPD_TDC']):.0f}")
+
+    st.info("""
+    **Segmentos Estratégicos:**
+    1.  `Arriba a la Izquierda (Bajo Riesgo, Alto Valor):` **Clientes Estrella.** (Fidelizar)
+    2.  `Arriba a la Derecha (Alto Riesgo, Alto Valor):` **Clientes Clave en Riesgo.** (Monitorear)
+    3.  `Abajo a la Izquierda (Bajo Riesgo, Bajo Valor):` **Nuevos o Inactivos.** (Activar)
+    4.  `Abajo a la Derecha (Alto Riesgo, Bajo Valor):` **Clientes Problemáticos.** (Gestionar)
+    """)
+    
+    st.markdown("---")
+    
+    # --- Parte 2: Tabla "Top 10" mejorada y más clara ---
+    st.markdown("<h3 style='text-align: center; color: white;'>Top 10 Clientes de Mayor Riesgo</h3>", unsafe_allow_html=True)
+    top_10_riesgo = df.iloc[top_k_riesgo(ranking_riesgo, version, filtros, k=10)]
+    
+    # Añadimos la columna 'MAX_DAYS_LATE' para dar contexto completo
+    display_columns = {
+        'SK_ID_CURR': 'ID Cliente',
+        'RISK_SCORE': 'Puntuación de Riesgo',
+        'FRAC_LATE_INSTALLMENTS': '% Cuotas Atrasadas',
+        'AVG_UTILIZATION_RATIO_TDC': '% Utilización TDC',
+        'MAX_DAYS_LATE': 'Peor Atraso Cuotas (Días)', # La columna que faltaba
+        'MAX_DPD_TDC': 'Peor Atraso TDC (Días)'
+    }
+
+    # Aplicar formato y estilo mejorados
+    st.dataframe(
+        top_10_riesgo[display_columns.keys()]
+        .rename(columns=display_columns)
+        .style
+        .format({
+            'Puntuación de Riesgo': '{:.2f}',
+            '% Cuotas Atrasadas': '{:.1%}',
+            '% Utilización TDC': '{:.1%}',
+            'Peor Atraso Cuotas (Días)': '{:.0f}', # Sin decimales
+            'Peor Atraso TDC (Días)': '{:.0f}'      # Sin decimales
+        })
+        .background_gradient(cmap='OrRd', subset=['Puntuación de Riesgo'], vmin=0.5, vmax=1.0)
+        .apply(
+            lambda x: ['background-color: #552222' if v > 0 else '' for v in x],
+            subset=['Peor Atraso Cuotas (Días)', 'Peor Atraso TDC (Días)']
+        ) # Resaltar en rojo oscuro cualquier celda de atraso > 0
+    )
+
+@fragmento
+def pestana_avanzado(df_filtered, resumen):
+    """Pestaña 4: matriz de correlación y riesgo por antigüedad."""
+    # --- Visualización 1: Matriz de Correlación ---
+    st.markdown("<h3 style='text-align: center; color: white;'>Matriz de Correlación de Métricas Clave</h3>", unsafe_allow_html=True)
+
+    # Matriz ensamblada desde las estadísticas suficientes de la cartera filtrada
+    corr_matrix = resumen['correlacion'].loc[COLUMNAS_CORRELACION, COLUMNAS_CORRELACION]
+
+    # Crear el mapa de calor con Plotly Express
+    fig_corr = px.imshow(
+        corr_matrix,
+        text_auto=True,  # Mostrar los valores de correlación en las celdas
+        aspect="auto",
+        color_continuous_scale='RdBu_r', # Rojo (negativo) - Blanco (cero) - Azul (positivo)
+        zmin=-1, zmax=1 # Forzar la escala de color de -1 a 1
+    )
+    st.plotly_chart(fig_corr, use_container_width=True)
+
+    st.info("""
+    **Análisis:** Esta matriz muestra la relación entre las métricas de riesgo.
+    - `Valores cercanos a -1.0 (azul oscuro):` Fuerte correlación negativa (cuando una sube, la otra baja).
+    - `Valores cercanos a  1.0 (rojo oscuro):` Fuerte correlación positiva (cuando una sube, la otra también)..
+    - `Valores cercanos a 0 (blanco):` Poca o ninguna correlación lineal.
+    """)
+
+    # --- Visualización 2: Riesgo por Antigüedad ---
+    st.markdown("<h3 style='text-align: center; color: white;'>Perfil de Riesgo por Antigüedad del Cliente</h3>", unsafe_allow_html=True)
+
+    # Calcular el riesgo promedio por categoría de antigüedad (precalculada), de menor a mayor antigüedad
+    risk_by_tenure = (
+        df_filtered.groupby('TENURE_CATEGORY')['RISK_SCORE'].mean()
+        .reindex(ORDEN_ANTIGUEDAD).dropna().reset_index()
+    )
+
+    fig_tenure = px.bar(
+        risk_by_tenure,
+        x='TENURE_CATEGORY',
+        y='RISK_SCORE',
+        color='RISK_SCORE',
+        color_continuous_scale='YlOrRd',
+        labels={'RISK_SCORE': 'Puntuación de Riesgo Promedio', 'TENURE_CATEGORY': 'Antigüedad del Cliente (Nro. de Préstamos)'}
+    )
+    st.plotly_chart(fig_tenure, use_container_width=True)
+
+    st.info("""
+    **Análisis:** Este gráfico revela si el riesgo promedio varía según la cantidad de préstamos que un cliente ha tenido. Permite responder si la lealtad o la experiencia se correlacionan con un mejor o peor comportamiento de pago.
+    """)
+
+@fragmento
+def pestana_bureau(engine):
+    """Pestaña 5: créditos de un cliente en bureau y distribuciones globales."""
+    resumen_bureau = load_bureau_resumen(engine)
+    if not resumen_bureau:
+        st.warning("No se encontraron datos en la tabla 'bureau'.")
+        return
+    # Entrada manual del ID
+    id_input = st.number_input("Ingrese el ID del cliente (SK_ID_CURR)", 
+                            min_value=resumen_bureau['id_min'], 
+                            max_value=resumen_bureau['id_max'], step=1)
+
+    # Consulta indexada de los créditos del cliente
+    df_filtrado = load_bureau_cliente(engine, id_input, version_tabla(engine, "bureau"))
+    st.dataframe(df_filtrado[['SK_ID_CURR', 'CREDIT_TYPE', 'CREDIT_ACTIVE']])
+
+    # Mostrar tabla del cliente
+    if not df_filtrado.empty:
+        st.markdown(f"## Información para el cliente **{id_input}**")
+        st.dataframe(df_filtrado[['SK_ID_CURR', 'CREDIT_TYPE', 'CREDIT_ACTIVE']])
+
+        # Métricas
+        total_creditos = len(df_filtrado)
+        creditos_activos = df_filtrado[df_filtrado['CREDIT_ACTIVE'] == 'Active'].shape[0]
+        creditos_cerrados = df_filtrado[df_filtrado['CREDIT_ACTIVE'] == 'Closed'].shape[0]
+        tipos_credito_unicos = df_filtrado['CREDIT_TYPE'].nunique()
+
+        st.markdown("---")
+        st.subheader("📌 Métricas del Cliente")
+
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Créditos Totales", total_creditos)
+        m2.metric("Activos", creditos_activos)
+        m3.metric("Cerrados", creditos_cerrados)
+        m4.metric("Tipos de Crédito", tipos_credito_unicos)
+
+    else:
+        st.warning("⚠️ No se encontró información para el ID ingresado.")
+
+    # ==============================
+    # GRÁFICOS GLOBALES
+    # ==============================
+    st.markdown("---")
+    st.subheader("📊 Distribución General de Créditos")
+
+    # Gráficos globales: se construyen una vez por versión de los resúmenes de bureau
+    version_estado, version_tipo = resumen_bureau['versiones']
+    fig_estado_global = figura_cacheada(
+        "bureau_estado_global", version_estado, (), lambda: construir_estado_global(resumen_bureau['estado'])
+    )
+    fig_tipo_global = figura_cacheada(
+        "bureau_tipo_global", version_tipo, (4,), lambda: construir_tipo_global(resumen_bureau['tipo'], 4)
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(fig_estado_global, use_container_width=True)
+
+    with col2:
+        st.plotly_chart(fig_tipo_global, use_container_width=True)
+
 #Función Principal de la Página
 
 def app(DB_USER, DB_PASS, DB_HOST, DB_PORT):
@@ -70,22 +661,21 @@ def app(DB_USER, DB_PASS, DB_HOST, DB_PORT):
         st.error("La conexión a la base de datos ha fallado. La aplicación no puede continuar.")
         st.stop()
 
-    df = load_gold_data(engine, "gold_active_customer_profile")
-    if df.empty:
-        st.warning("No se encontraron datos en la tabla 'gold_active_customer_profile'.")
+    datos = preparar_datos(engine)
+    if not datos:
+        st.warning("No se encontraron datos en la tabla 'dashboard.credit_perfil_riesgo'. Ejecuta scripts/precompute_dashboard.py después de construir gold.")
         st.stop()
 
-    df['RISK_SCORE'] = (
-        (df['FRAC_LATE_INSTALLMENTS'].rank(pct=True) * 0.20) +
-        (df['AVG_UTILIZATION_RATIO_TDC'].rank(pct=True) * 0.30) +
-        (df['MAX_DAYS_LATE'].rank(pct=True) * 0.25) +
-        (df['MAX_DPD_TDC'].rank(pct=True) * 0.25)
-    )
+    df, version = datos['df'], datos['version']
+    ranking_riesgo = datos['ranking']
+    estadisticas = datos['estadisticas']
 
     # --- Barra Lateral con Filtros (Sin cambios) ---
     with st.sidebar.expander("🔍 Filtros de Cartera"):
-        max_avg_balance = int(df['AVG_BALANCE_TDC'].max())
-        selected_balance = st.slider('Filtrar por Saldo Promedio en TDC:', min_value=0, max_value=max_avg_balance, value=(0, max_avg_balance))
+        # El slider de saldo avanza en el paso de la rejilla de las estadísticas suficientes
+        paso = estadisticas['paso']
+        max_avg_balance = int(np.ceil(df['AVG_BALANCE_TDC'].max() / paso)) * paso
+        selected_balance = st.slider('Filtrar por Saldo Promedio en TDC:', min_value=0, max_value=max_avg_balance, value=(0, max_avg_balance), step=paso)
         max_loans = int(df['TOTAL_LOANS_WITH_INSTALLMENTS'].max())
         selected_loans = st.slider('Filtrar por Nro. Total de Préstamos:', min_value=0, max_value=max_loans, value=(0, max_loans))
 
@@ -97,6 +687,9 @@ def app(DB_USER, DB_PASS, DB_HOST, DB_PORT):
         (df['TOTAL_LOANS_WITH_INSTALLMENTS'] <= selected_loans[1])
     ]
 
+    filtros = (tuple(selected_balance), tuple(selected_loans))
+    resumen = resumir_estadisticas(estadisticas, version, filtros)
+
     st.markdown("---")
 
     #Título de la sección con estilo personalizado
@@ -108,7 +701,7 @@ def app(DB_USER, DB_PASS, DB_HOST, DB_PORT):
 
 
     # --- KPI 1: Total de Clientes Activos (Verde) ---
-    total_clientes_valor = f"{len(df_filtered):,}"
+    total_clientes_valor = f"{resumen['n']:,}"
     kpi1_html = crear_kpi_box(
         title="👥 Total Clientes Activos", 
         value=total_clientes_valor, 
@@ -117,10 +710,9 @@ def app(DB_USER, DB_PASS, DB_HOST, DB_PORT):
     kpi1.markdown(kpi1_html, unsafe_allow_html=True)
 
     # --- KPI 2: Tasa de Clientes con Atrasos (Rojo) ---
-    total_clientes = len(df_filtered)
-    clientes_con_atrasos = df_filtered[df_filtered['FRAC_LATE_INSTALLMENTS'] > 0].shape[0]
+    total_clientes = resumen['n']
     if total_clientes > 0:
-        tasa_atrasos = (clientes_con_atrasos / total_clientes) * 100
+        tasa_atrasos = resumen['media']['CON_ATRASOS'] * 100
     else:
         tasa_atrasos = 0
     tasa_atrasos_valor = f"{tasa_atrasos:.1f}%"
@@ -134,7 +726,7 @@ def app(DB_USER, DB_PASS, DB_HOST, DB_PORT):
 
     # --- KPI 3: Utilización Promedio de TDC (Verde) ---
     #Redondeo a entero
-    utilizacion_promedio = df_filtered['AVG_UTILIZATION_RATIO_TDC'].mean() * 100
+    utilizacion_promedio = resumen['media']['AVG_UTILIZATION_RATIO_TDC'] * 100
     utilizacion_valor = f"{utilizacion_promedio:.0f}" # .0f para redondear a entero
     kpi3_html = crear_kpi_box(
         title="💳 Utilización Promedio TDC", 
@@ -146,7 +738,7 @@ def app(DB_USER, DB_PASS, DB_HOST, DB_PORT):
 
     # --- KPI 4: Deuda Promedio en TDC (Rojo) ---
     #Formateo a dos decimales
-    deuda_promedio = df_filtered['AVG_BALANCE_TDC'].mean()
+    deuda_promedio = resumen['media']['AVG_BALANCE_TDC']
     deuda_valor = f"${deuda_promedio:,.2f}" # .2f para dos cifras decimales
     kpi4_html = crear_kpi_box(
         title="💰 Deuda Promedio en TDC", 
@@ -167,344 +759,18 @@ def app(DB_USER, DB_PASS, DB_HOST, DB_PORT):
 
     # --- Contenido de la Pestaña 1: Comportamiento en Cuotas ---
     with tab1:
-        
-        col1, col2 = st.columns(2)
-        
-        # Visualización 1: Frecuencia de Atrasos
-        with col1:
-            st.markdown("<h3 style='text-align: center; color: white;'>Frecuencia de Atrasos</h3>", unsafe_allow_html=True)
-            fig_freq = px.histogram(
-                df_filtered, 
-                x='FRAC_LATE_INSTALLMENTS',
-                nbins=30, # Agrupar en 30 barras para mejor visualización
-                labels={'FRAC_LATE_INSTALLMENTS': 'Proporción de Pagos Atrasados del Cliente'},
-                color_discrete_sequence=['#d8ddf9']
-            )
-            fig_freq.update_layout(
-                yaxis_title="Número de Clientes",
-                bargap=0.1
-            )
-            st.plotly_chart(fig_freq, use_container_width=True)
-            st.info("""
-            **Análisis:** Este gráfico muestra qué tan a menudo los clientes pagan tarde. 
-            - Un pico grande en `0.0` indica que la mayoría de los clientes son puntuales.
-            - Barras en el extremo derecho representan clientes crónicos que casi siempre pagan tarde.
-            """)
-
-        # Visualización 2: Severidad de los Atrasos
-        with col2:
-            st.markdown("<h3 style='text-align: center; color: white;'>Severidad de los Atrasos</h3>", unsafe_allow_html=True)
-            # Filtramos para ver solo los clientes que tienen al menos un atraso
-            df_con_atrasos = df_filtered[df_filtered['MAX_DAYS_LATE'] > 0]
-            
-            fig_sever = px.histogram(
-                df_con_atrasos, 
-                x='MAX_DAYS_LATE',
-                nbins=30,
-                labels={'MAX_DAYS_LATE': 'Máximo de Días de Atraso del Cliente'},
-                color_discrete_sequence=['#dc3545'] # Rojo para indicar severidad
-            )
-            fig_sever.update_layout(
-                yaxis_title="Número de Clientes",
-                bargap=0.1
-            )
-            st.plotly_chart(fig_sever, use_container_width=True)
-            st.info("""
-            **Análisis:** De los clientes que se atrasan, este gráfico muestra la gravedad de su peor atraso.
-            - Picos cerca de `0` indican atrasos menores (pocos días).
-            - Barras hacia la derecha (`>30`, `>60` días) señalan eventos de alto riesgo.
-            """)
+        pestana_cuotas(df_filtered)
 
     # --- Contenido de la Pestaña 2: Comportamiento en Tarjetas de Crédito ---
     with tab2:
-
-        col1, col2 = st.columns(2)
-        
-        # Visualización 3: Distribución de la Utilización de Crédito
-        with col1:
-            st.markdown("<h3 style='text-align: center; color: white;'>Utilización de Línea de Crédito</h3>", unsafe_allow_html=True)
-            # Filtramos para ver solo clientes con utilización > 0 para un gráfico más claro
-            df_con_utilizacion = df_filtered[df_filtered['AVG_UTILIZATION_RATIO_TDC'] > 0]
-
-            fig_util = px.histogram(
-                df_con_utilizacion, 
-                x='AVG_UTILIZATION_RATIO_TDC',
-                nbins=30,
-                labels={'AVG_UTILIZATION_RATIO_TDC': 'Ratio de Utilización Promedio'},
-                color_discrete_sequence=['#17a2b8'] # Color cian/azul claro
-            )
-            fig_util.update_layout(
-                yaxis_title="Número de Clientes",
-                bargap=0.1
-            )
-            st.plotly_chart(fig_util, use_container_width=True)
-            st.info("""
-            **Análisis:** Muestra qué porcentaje de su límite de crédito usan los clientes.
-            - `Utilización > 70%` (0.7) a menudo se asocia con un mayor estrés financiero y riesgo de impago.
-            - Picos a la izquierda indican un uso saludable y conservador del crédito.
-            """)
-
-        # Visualización 4: Persistencia de la Morosidad en TDC
-        with col2:
-            st.markdown("<h3 style='text-align: center; color: white;'>Persistencia de Morosidad (DPD)</h3>", unsafe_allow_html=True)
-            
-            # Creamos categorías para la morosidad para que el gráfico sea más legible
-            df_dpd = df_filtered.copy()
-            df_dpd['DPD_CATEGORY'] = pd.cut(
-                df_dpd['TOTAL_MONTHS_WITH_DPD_TDC'],
-                bins=[-1, 0, 2, 5, 100],
-                labels=['Puntual (0 meses)', 'Ocasional (1-2)', 'Recurrente (3-5)', 'Crónico (5+)']
-            )
-            
-            # Contamos cuántos clientes caen en cada categoría
-            dpd_counts = df_dpd['DPD_CATEGORY'].value_counts().reset_index()
-
-            fig_dpd = px.bar(
-                dpd_counts, 
-                x='DPD_CATEGORY', 
-                y='count',
-                title='', # El título ya está en el markdown
-                labels={'count': 'Número de Clientes', 'DPD_CATEGORY': 'Categoría de Morosidad'},
-                color='DPD_CATEGORY', # Colorear por categoría
-                color_discrete_map={ # Mapa de colores personalizado
-                    'Puntual (0 meses)': '#28a745',
-                    'Ocasional (1-2)': '#ffc107',
-                    'Recurrente (3-5)': '#fd7e14',
-                    'Crónico (5+)': '#dc3545'
-                }
-            )
-            fig_dpd.update_layout(xaxis={'categoryorder':'total descending'}) # Ordenar de mayor a menor
-            st.plotly_chart(fig_dpd, use_container_width=True)
-            
-            st.info("""
-            **Análisis:** Clasifica a los clientes por la cantidad de meses que han estado en mora (DPD > 0).
-            - `Puntual:` El segmento más saludable.
-            - `Ocasional:` Pueden ser errores o problemas puntuales.
-            - `Recurrente/Crónico:` El segmento de mayor riesgo que requiere atención inmediata.
-            """)
+        pestana_tarjetas(df_filtered)
 
     # --- Pestaña 3: Segmentación y Riesgo (Versión Mejorada) ---
     with tab3:
-        
-        st.markdown("<h3 style='text-align: center; color: white;'>Matriz de Riesgo vs. Valor del Cliente</h3>", unsafe_allow_html=True)
-        fig_scatter = px.scatter(
-            df_filtered, 
-            x='AVG_UTILIZATION_RATIO_TDC', 
-            y='TOTAL_INSTALLMENTS_PAID', 
-            color='RISK_SCORE', 
-            color_continuous_scale=px.colors.sequential.OrRd, 
-            hover_name=df_filtered['SK_ID_CURR'], 
-            hover_data={'SK_ID_CURR': False, 'RISK_SCORE': ':.2f'}, 
-            labels={
-                'AVG_UTILIZATION_RATIO_TDC': 'RIESGO (Utilización de Crédito)', 
-                'TOTAL_INSTALLMENTS_PAID': 'VALOR (Experiencia del Cliente)', 
-                'RISK_SCORE': 'Puntuación de Riesgo'
-            }
-        )
-        fig_scatter.update_traces(marker=dict(size=8, opacity=0.7))
-        st.plotly_chart(fig_scatter, use_container_width=True)
-
-        # Visualización 3: Buscador de Clientes
-        st.markdown("<h3 style='text-align: center; color: white;'>Diagnóstico Individual de Cliente</h3>", unsafe_allow_html=True)
-        list_of_clients = sorted(df_filtered['SK_ID_CURR'].unique())
-        selected_client_id = st.selectbox("Selecciona un ID de Cliente para analizar:", options=list_of_clients, key='client_selector')
-        if selected_client_id:
-            client_data = df_filtered[df_filtered['SK_ID_CURR'] == selected_client_id].iloc[0]
-            m1, m2, m3, m4 = st.columns(4)
-            m1.metric("Puntuación de Riesgo", f"{client_data['RISK_SCORE']:.2f}")
-            m2.metric("% Utilización TDC", f"{client_data['AVG_UTILIZATION_RATIO_TDC']:.1%}")
-            m3.metric("% Cuotas Atrasadas", f"{client_data['FRAC_LATE_INSTALLMENTS']:.1%}")
-            m4.metric("Peor Atraso (Días)", f"{max(client_data['MAX_DAYS_LATE'], client_data['MAX_DPD_TDC']):.0f}")
-
-        st.info("""
-        **Segmentos Estratégicos:**
-        1.  `Arriba a la Izquierda (Bajo Riesgo, Alto Valor):` **Clientes Estrella.** (Fidelizar)
-        2.  `Arriba a la Derecha (Alto Riesgo, Alto Valor):` **Clientes Clave en Riesgo.** (Monitorear)
-        3.  `Abajo a la Izquierda (Bajo Riesgo, Bajo Valor):` **Nuevos o Inactivos.** (Activar)
-        4.  `Abajo a la Derecha (Alto Riesgo, Bajo Valor):` **Clientes Problemáticos.** (Gestionar)
-        """)
-        
-        st.markdown("---")
-        
-        # --- Parte 2: Tabla "Top 10" mejorada y más clara ---
-        st.markdown("<h3 style='text-align: center; color: white;'>Top 10 Clientes de Mayor Riesgo</h3>", unsafe_allow_html=True)
-        top_10_riesgo = df_filtered.sort_values('RISK_SCORE', ascending=False).head(10)
-        
-        # Añadimos la columna 'MAX_DAYS_LATE' para dar contexto completo
-        display_columns = {
-            'SK_ID_CURR': 'ID Cliente',
-            'RISK_SCORE': 'Puntuación de Riesgo',
-            'FRAC_LATE_INSTALLMENTS': '% Cuotas Atrasadas',
-            'AVG_UTILIZATION_RATIO_TDC': '% Utilización TDC',
-            'MAX_DAYS_LATE': 'Peor Atraso Cuotas (Días)', # La columna que faltaba
-            'MAX_DPD_TDC': 'Peor Atraso TDC (Días)'
-        }
+        pestana_segmentacion(df_filtered, df, ranking_riesgo, version, filtros)
 
-        # Aplicar formato y estilo mejorados
-        st.dataframe(
-            top_10_riesgo[display_columns.keys()]
-            .rename(columns=display_columns)
-            .style
-            .format({
-                'Puntuación de Riesgo': '{:.2f}',
-                '% Cuotas Atrasadas': '{:.1%}',
-                '% Utilización TDC': '{:.1%}',
-                'Peor Atraso Cuotas (Días)': '{:.0f}', # Sin decimales
-                'Peor Atraso TDC (Días)': '{:.0f}'      # Sin decimales
-            })
-            .background_gradient(cmap='OrRd', subset=['Puntuación de Riesgo'], vmin=0.5, vmax=1.0)
-            .apply(
-                lambda x: ['background-color: #552222' if v > 0 else '' for v in x],
-                subset=['Peor Atraso Cuotas (Días)', 'Peor Atraso TDC (Días)']
-            ) # Resaltar en rojo oscuro cualquier celda de atraso > 0
-        )
     with tab4:
-        # --- Visualización 1: Matriz de Correlación ---
-        st.markdown("<h3 style='text-align: center; color: white;'>Matriz de Correlación de Métricas Clave</h3>", unsafe_allow_html=True)
-
-        # Seleccionar solo las columnas numéricas más relevantes para la correlación
-        correlation_cols = [
-            'FRAC_LATE_INSTALLMENTS',
-            'AVG_DAYS_LATE',
-            'MAX_DAYS_LATE',
-            'AVG_UTILIZATION_RATIO_TDC',
-            'AVG_DPD_TDC',
-            'MAX_DPD_TDC',
-            'RISK_SCORE'
-        ]
-        corr_matrix = df_filtered[correlation_cols].corr()
-
-        # Crear el mapa de calor con Plotly Express
-        fig_corr = px.imshow(
-            corr_matrix,
-            text_auto=True,  # Mostrar los valores de correlación en las celdas
-            aspect="auto",
-            color_continuous_scale='RdBu_r', # Rojo (negativo) - Blanco (cero) - Azul (positivo)
-            zmin=-1, zmax=1 # Forzar la escala de color de -1 a 1
-        )
-        st.plotly_chart(fig_corr, use_container_width=True)
-
-        st.info("""
-        **Análisis:** Esta matriz muestra la relación entre las métricas de riesgo.
-        - `Valores cercanos a -1.0 (azul oscuro):` Fuerte correlación negativa (cuando una sube, la otra baja).
-        - `Valores cercanos a  1.0 (rojo oscuro):` Fuerte correlación positiva (cuando una sube, la otra también)..
-        - `Valores cercanos a 0 (blanco):` Poca o ninguna correlación lineal.
-        """)
-
-        # --- Visualización 2: Riesgo por Antigüedad ---
-        st.markdown("<h3 style='text-align: center; color: white;'>Perfil de Riesgo por Antigüedad del Cliente</h3>", unsafe_allow_html=True)
-
-        # Crear categorías (bins) para la antigüedad del cliente
-        df_antiguedad = df_filtered.copy()
-        df_antiguedad['TENURE_CATEGORY'] = pd.cut(
-            df_antiguedad['TOTAL_LOANS_WITH_INSTALLMENTS'],
-            bins=[0, 1, 3, 5, 10, 100],
-            labels=['Nuevo (1 Préstamo)', 'Principiante (2-3)', 'Intermedio (4-5)', 'Experimentado (6-10)', 'Veterano (10+)'],
-            right=True # Incluye el borde derecho
-        )
-
-        # Calcular el riesgo promedio por categoría
-        risk_by_tenure = df_antiguedad.groupby('TENURE_CATEGORY', observed=True)['RISK_SCORE'].mean().reset_index()
-
-        fig_tenure = px.bar(
-            risk_by_tenure,
-            x='TENURE_CATEGORY',
-            y='RISK_SCORE',
-            color='RISK_SCORE',
-            color_continuous_scale='YlOrRd',
-            labels={'RISK_SCORE': 'Puntuación de Riesgo Promedio', 'TENURE_CATEGORY': 'Antigüedad del Cliente (Nro. de Préstamos)'}
-        )
-        st.plotly_chart(fig_tenure, use_container_width=True)
-
-        st.info("""
-        **Análisis:** Este gráfico revela si el riesgo promedio varía según la cantidad de préstamos que un cliente ha tenido. Permite responder si la lealtad o la experiencia se correlacionan con un mejor o peor comportamiento de pago.
-        """)
+        pestana_avanzado(df_filtered, resumen)
 
     with tab5:
-        df_tab5 = load_gold_data(engine, "bureau")
-        if df_tab5.empty:
-            st.warning("No se encontraron datos en la tabla 'gold_active_customer_profile'.")
-            st.stop()
-        # Entrada manual del ID
-        id_input = st.number_input("Ingrese el ID del cliente (SK_ID_CURR)", 
-                                min_value=int(df_tab5['SK_ID_CURR'].min()), 
-                                max_value=int(df_tab5['SK_ID_CURR'].max()), step=1)
-
-        # Filtrar datos por cliente
-        df_filtrado = df_tab5[df_tab5['SK_ID_CURR'] == id_input]
-        st.dataframe(df_filtrado[['SK_ID_CURR', 'CREDIT_TYPE', 'CREDIT_ACTIVE']])
-
-        # Mostrar tabla del cliente
-        if not df_filtrado.empty:
-            st.markdown(f"## Información para el cliente **{id_input}**")
-            st.dataframe(df_filtrado[['SK_ID_CURR', 'CREDIT_TYPE', 'CREDIT_ACTIVE']])
-
-            # Métricas
-            total_creditos = len(df_filtrado)
-            creditos_activos = df_filtrado[df_filtrado['CREDIT_ACTIVE'] == 'Active'].shape[0]
-            creditos_cerrados = df_filtrado[df_filtrado['CREDIT_ACTIVE'] == 'Closed'].shape[0]
-            tipos_credito_unicos = df_filtrado['CREDIT_TYPE'].nunique()
-
-            st.markdown("---")
-            st.subheader("📌 Métricas del Cliente")
-
-            m1, m2, m3, m4 = st.columns(4)
-            m1.metric("Créditos Totales", total_creditos)
-            m2.metric("Activos", creditos_activos)
-            m3.metric("Cerrados", creditos_cerrados)
-            m4.metric("Tipos de Crédito", tipos_credito_unicos)
-
-        else:
-            st.warning("⚠️ No se encontró información para el ID ingresado.")
-
-        # ==============================
-        # GRÁFICOS GLOBALES
-        # ==============================
-        st.markdown("---")
-        st.subheader("📊 Distribución General de Créditos")
-
-        # Estado de crédito global - gráfico de barras
-        estado_global = df_tab5['CREDIT_ACTIVE'].value_counts().reset_index()
-        estado_global.columns = ['Estado', 'Frecuencia']
-
-        fig_estado_global = px.bar(
-            estado_global,
-            x='Estado',
-            y='Frecuencia',
-            color='Estado',
-            title='Distribución General de Estado de Créditos',
-            text_auto=True
-        )
-
-        # Tipo de crédito global - torta top 4
-        tipo_global = df_tab5['CREDIT_TYPE'].value_counts().nlargest(4).reset_index()
-        tipo_global.columns = ['Tipo', 'Frecuencia']
-
-        fig_tipo_global = px.pie(
-            tipo_global,
-            names='Tipo',
-            values='Frecuencia',
-            title='Top 4 Tipos de Crédito (Global)',
-            hole=0  # pastel completo
-        )
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.plotly_chart(fig_estado_global, use_container_width=True)
-
-        with col2:
-            st.plotly_chart(fig_tipo_global, use_container_width=True)
-        df_tab5= pd.read_sql("select * from bureau", engine)
-                  
-        # --- Tabla de Frecuencias (Activos y Cerrados) ---
-        creditos_activos = df_tab5[df_tab5['CREDIT_ACTIVE'] == 'Active']
-        creditos_cerrados = df_tab5[df_tab5['CREDIT_ACTIVE'] == 'Closed']
-
-        frecuencia_activos = creditos_activos['CREDIT_TYPE'].value_counts()
-        frecuencia_cerrados = creditos_cerrados['CREDIT_TYPE'].value_counts()
-
-        frecuencia_comparada = pd.concat(
-            [frecuencia_activos, frecuencia_cerrados],
-            axis=1,
-            keys=['Activos', 'Cerrados']
-        ).fillna(0).astype(int)
+        pestana_bureau(engine)
@@ -0,0 +1,391 @@
+# dashboard/data.py
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import streamlit as st
+
+from instrumentacion import registrar
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from scripts.engines import crear_engine
+
+# Capa de acceso a datos compartida por todas las páginas del dashboard:
+# un único pool de conexiones a gold y una única caché de tablas para todo el proceso,
+# compartida entre páginas y sesiones sin copiar los datos.
+
+#Configuración del pool de conexiones
+POOL_SIZE = 5
+MAX_OVERFLOW = 10
+POOL_RECYCLE = 1800  # segundos; MySQL cierra las conexiones inactivas (wait_timeout)
+
+#Cada cuánto se consulta gold_manifest para detectar tablas reconstruidas
+INTERVALO_SONDEO = 30  # segundos
+
+# Snapshots locales de la caché (Feather sin comprimir, para abrirlos con memory-map al reiniciar).
+# Solo se guardan tablas del registro con fila en gold_manifest (incluidos los agregados del
+# esquema 'dashboard'); los modelos ya son pickles locales y no se duplican.
+DIRECTORIO_SNAPSHOTS = Path(__file__).resolve().parent / ".cache" / "snapshots"
+
+# Trayectorias de cuotas de pos_cash_balance_gold en arreglos .npy (las genera scripts/clean_EDA.py)
+DIRECTORIO_TRAYECTORIAS_POS = Path(__file__).resolve().parent.parent / "data" / "gold_artifacts" / "pos_trayectorias"
+
+# Copy-on-Write: las páginas reciben vistas de la tabla compartida y pandas solo copia
+# una columna cuando alguna página la modifica (siempre activo desde pandas 3.0).
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+@dataclass(frozen=True)
+class TablaGold:
+    """Entrada del registro de tablas gold que leen las páginas."""
+    nombre: str
+    columnas: tuple = ()          # proyección; vacío = todas las columnas
+    orden: tuple = ()             # columnas por las que se ordena al cargar
+    ttl: Optional[int] = None     # segundos de vigencia en caché; None = sin vencimiento
+    esquema: Optional[str] = None # base de datos de la tabla; None = gold
+
+    def consulta(self):
+        proyeccion = ", ".join(self.columnas) if self.columnas else "*"
+        origen = f"{self.esquema}.{self.nombre}" if self.esquema else self.nombre
+        return f"SELECT {proyeccion} FROM {origen}"
+
+
+TABLAS = {tabla.nombre: tabla for tabla in [
+    # Análisis Crediticio (esquema 'dashboard', precalculado por scripts/precompute_dashboard.py)
+    TablaGold("credit_perfil_riesgo", esquema="dashboard", columnas=(
+        "SK_ID_CURR", "FRAC_LATE_INSTALLMENTS", "AVG_DAYS_LATE", "MAX_DAYS_LATE",
+        "TOTAL_INSTALLMENTS_PAID", "TOTAL_LOANS_WITH_INSTALLMENTS", "AVG_BALANCE_TDC",
+        "AVG_UTILIZATION_RATIO_TDC", "AVG_DPD_TDC", "MAX_DPD_TDC", "TOTAL_MONTHS_WITH_DPD_TDC",
+        "RISK_SCORE", "DPD_CATEGORY", "TENURE_CATEGORY"
+    )),
+    TablaGold("bureau_estado_resumen", ttl=3600),
+    TablaGold("bureau_tipo_resumen", ttl=3600),
+    # Historial de Aplicantes
+    TablaGold("previous_application_gold", orden=("SK_ID_CURR", "SK_ID_PREV")),
+    TablaGold("previous_application_cubo", ttl=3600),
+    TablaGold("previous_application_histograma", ttl=3600),
+    # Modelos
+    TablaGold("risk_level_data", columnas=(
+        "NAME_INCOME_TYPE", "NAME_EDUCATION_TYPE", "NAME_FAMILY_STATUS", "NAME_HOUSING_TYPE", "OCCUPATION_TYPE"
+    )),
+    TablaGold("model_gold_id"),
+] + [
+    TablaGold(f"{tabla}_{sufijo}", ttl=3600)
+    for tabla in ["risk_level_data", "model_gold_id"]
+    for sufijo in ["box_stats", "box_outliers", "frecuencias"]
+]}
+
+
+@st.cache_resource
+def get_db_engine(DB_USER, DB_PASS, DB_HOST, DB_PORT):
+    """
+    Crea y cachea el único engine (con su pool de conexiones) a la base de datos Gold,
+    en el backend de HOME_CREDIT_DB (ver scripts/engines.py).
+    """
+    try:
+        engine = crear_engine(
+            "gold", DB_USER, DB_PASS, DB_HOST, DB_PORT,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_pre_ping=True,
+            pool_recycle=POOL_RECYCLE
+        )
+        return engine
+    except Exception as e:
+        st.error(f"Error de conexión a la base de datos: {e}")
+        return None
+
+
+@st.cache_resource
+def _almacen_tablas():
+    """Caché de tablas compartida por todas las sesiones del proceso."""
+    return {
+        "tablas": {},                              # nombre -> {'df', 'version', 'cargada'}
+        "bloqueos": defaultdict(threading.Lock),   # un bloqueo por tabla para cargarla una sola vez
+        "bloqueo": threading.Lock(),
+        "recargando": set(),                       # tablas con una recarga en segundo plano en curso
+        "manifiesto": {},                          # nombre -> CHECKSUM según gold_manifest
+        "manifiesto_leido": float("-inf"),
+        "calentamiento": {},                       # nombre -> segundos que tardó en precargarse
+        "aciertos": 0,
+        "fallos": 0,
+        "recargas": 0,
+    }
+
+
+def _leer_manifiesto(_engine):
+    """
+    Versiones de gold_manifest (y del gold_manifest de cada esquema derivado, como 'dashboard'),
+    consultadas como mucho una vez cada INTERVALO_SONDEO segundos.
+    """
+    almacen = _almacen_tablas()
+    with almacen["bloqueo"]:
+        if time.monotonic() - almacen["manifiesto_leido"] < INTERVALO_SONDEO:
+            return almacen["manifiesto"]
+        almacen["manifiesto_leido"] = time.monotonic()
+        manifiesto = dict(almacen["manifiesto"])
+
+    esquemas = sorted({tabla.esquema for tabla in TABLAS.values() if tabla.esquema})
+    for origen in ["gold_manifest"] + [f"{esquema}.gold_manifest" for esquema in esquemas]:
+        try:
+            df_manifiesto = pd.read_sql(f"SELECT TABLA, CHECKSUM FROM {origen}", _engine)
+        except Exception:
+            # Sin manifiesto (gold anterior a este esquema) se conserva la última versión conocida
+            continue
+        manifiesto.update(zip(df_manifiesto["TABLA"], df_manifiesto["CHECKSUM"]))
+
+    with almacen["bloqueo"]:
+        almacen["manifiesto"] = manifiesto
+    return manifiesto
+
+
+def version_tabla(_engine, nombre):
+    """Versión vigente de una tabla en gold (su CHECKSUM en gold_manifest; '' si no figura)."""
+    return _leer_manifiesto(_engine).get(nombre, "")
+
+
+def _vigente(tabla, entrada):
+    return tabla.ttl is None or time.monotonic() - entrada["cargada"] < tabla.ttl
+
+
+def _ruta_snapshot(tabla, version):
+    """Archivo de snapshot de una tabla para una versión de gold y la consulta del registro."""
+    consulta = hashlib.sha256(tabla.consulta().encode()).hexdigest()[:8]
+    return DIRECTORIO_SNAPSHOTS / f"{tabla.nombre}-{version[:16]}-{consulta}.feather"
+
+
+def _leer_snapshot(tabla, version):
+    """Abre con memory-map el snapshot de la versión indicada; None si no existe o no se puede leer."""
+    ruta = _ruta_snapshot(tabla, version)
+    if not version or not ruta.exists():
+        return None
+    try:
+        return feather.read_table(ruta, memory_map=True)
+    except Exception as e:
+        print(f"No se pudo leer el snapshot de '{tabla.nombre}': {e}")
+        return None
+
+
+def _escribir_snapshot(tabla, version, tabla_arrow):
+    """Guarda el snapshot de una versión de la tabla y borra los de versiones anteriores."""
+    if not version:
+        return
+    ruta = _ruta_snapshot(tabla, version)
+    try:
+        DIRECTORIO_SNAPSHOTS.mkdir(parents=True, exist_ok=True)
+        temporal = ruta.with_suffix(".tmp")
+        feather.write_feather(tabla_arrow, temporal, compression="uncompressed")
+        os.replace(temporal, ruta)
+    except OSError as e:
+        print(f"No se pudo guardar el snapshot de '{tabla.nombre}': {e}")
+        return
+
+    for anterior in DIRECTORIO_SNAPSHOTS.glob(f"{tabla.nombre}-*.feather"):
+        if anterior != ruta:
+            try:
+                anterior.unlink()
+            except OSError:
+                # En Windows no se puede borrar un archivo aún mapeado; se borrará en otra carga
+                pass
+
+
+def _snapshot_coincide(_engine, tabla, tabla_arrow):
+    """
+    Comprobación barata en la base de datos antes de usar un snapshot: misma cantidad de filas
+    y mismas columnas que la tabla actual. Detecta tablas reescritas sin actualizar
+    gold_manifest, cuya versión (y por tanto su snapshot) no cambió.
+    """
+    origen = f"{tabla.esquema}.{tabla.nombre}" if tabla.esquema else tabla.nombre
+    try:
+        filas = pd.read_sql(f"SELECT COUNT(*) AS FILAS FROM {origen}", _engine)["FILAS"].iloc[0]
+        columnas = list(pd.read_sql(f"{tabla.consulta()} LIMIT 0", _engine).columns)
+    except Exception as e:
+        print(f"No se pudo validar el snapshot de '{tabla.nombre}': {e}")
+        return False
+    return int(filas) == tabla_arrow.num_rows and columnas == tabla_arrow.column_names
+
+
+def _cargar(_engine, tabla, version):
+    # Si hay un snapshot local de la misma versión (y la tabla en la base sigue teniendo sus
+    # filas y columnas) se abre con memory-map en lugar de leer la tabla completa de gold
+    tabla_arrow = _leer_snapshot(tabla, version)
+    if tabla_arrow is not None and not _snapshot_coincide(_engine, tabla, tabla_arrow):
+        print(f"El snapshot de '{tabla.nombre}' no coincide con la tabla en la base de datos; se vuelve a leer.")
+        tabla_arrow = None
+    origen = "snapshot"
+    if tabla_arrow is None:
+        df = pd.read_sql(tabla.consulta(), _engine)
+        if tabla.orden:
+            df = df.sort_values(list(tabla.orden), kind="stable", ignore_index=True)
+        tabla_arrow = pa.Table.from_pandas(df, preserve_index=False)
+        del df
+        _escribir_snapshot(tabla, version, tabla_arrow)
+        origen = "base de datos"
+
+    # Se pasa por Arrow para deduplicar los textos repetidos (categorías) y dejar cada
+    # columna en su propio bloque, de modo que una modificación copie solo esa columna.
+    df_compartido = tabla_arrow.to_pandas(split_blocks=True, self_destruct=True, deduplicate_objects=True)
+    return {"df": df_compartido, "version": version, "cargada": time.monotonic(), "origen": origen}
+
+
+def _recargar_en_segundo_plano(_engine, tabla, version):
+    """Carga la nueva versión de una tabla y solo entonces la reemplaza en la caché."""
+    almacen = _almacen_tablas()
+    try:
+        entrada = _cargar(_engine, tabla, version)
+        with almacen["bloqueos"][tabla.nombre]:
+            almacen["tablas"][tabla.nombre] = entrada
+        with almacen["bloqueo"]:
+            almacen["recargas"] += 1
+    except Exception as e:
+        print(f"No se pudo recargar la tabla '{tabla.nombre}': {e}")
+    finally:
+        with almacen["bloqueo"]:
+            almacen["recargando"].discard(tabla.nombre)
+
+
+def leer_tabla_con_version(_engine, nombre):
+    """
+    Devuelve una tabla del registro como DataFrame junto con la versión que se sirvió.
+
+    La primera lectura abre el snapshot local de la versión vigente o, si no existe,
+    consulta la base de datos y lo escribe; se guarda una única copia de la tabla
+    para todo el proceso; cada llamada recibe una vista (copia superficial) de esa copia,
+    sin duplicar los datos, y Copy-on-Write copia una columna solo si la página la
+    modifica, así que la tabla compartida nunca cambia. Si gold_manifest
+    indica una versión nueva (o vence el TTL), se sigue sirviendo la versión en caché
+    mientras la nueva se carga en un hilo y se reemplaza al terminar.
+    """
+    inicio = time.perf_counter()
+    tabla = TABLAS[nombre]
+    version = version_tabla(_engine, nombre)
+    almacen = _almacen_tablas()
+    with almacen["bloqueo"]:
+        bloqueo_tabla = almacen["bloqueos"][nombre]
+
+    with bloqueo_tabla:
+        entrada = almacen["tablas"].get(nombre)
+        acierto = entrada is not None
+        if entrada is None:
+            try:
+                entrada = _cargar(_engine, tabla, version)
+            except Exception as e:
+                st.error(f"No se pudo cargar la tabla '{nombre}'. Error: {e}")
+                return pd.DataFrame(), ""
+            almacen["tablas"][nombre] = entrada
+        elif entrada["version"] != version or not _vigente(tabla, entrada):
+            with almacen["bloqueo"]:
+                recargar = nombre not in almacen["recargando"]
+                almacen["recargando"].add(nombre)
+            if recargar:
+                threading.Thread(
+                    target=_recargar_en_segundo_plano, args=(_engine, tabla, version), daemon=True
+                ).start()
+
+    with almacen["bloqueo"]:
+        almacen["aciertos" if acierto else "fallos"] += 1
+    registrar(__name__, f"leer_tabla[{nombre}]", time.perf_counter() - inicio, entrada["df"], acierto)
+
+    return entrada["df"].copy(deep=False), entrada["version"]
+
+
+def leer_tabla(_engine, nombre):
+    """Devuelve una tabla del registro como DataFrame (ver 'leer_tabla_con_version')."""
+    return leer_tabla_con_version(_engine, nombre)[0]
+
+
+@st.cache_resource(max_entries=1)
+def _abrir_trayectorias(checksum):
+    """Abre con memory-map los arreglos del almacén de trayectorias (una vez por versión)."""
+    arreglos = {}
+    for ruta in DIRECTORIO_TRAYECTORIAS_POS.glob("*.npy"):
+        try:
+            arreglos[ruta.stem] = np.load(ruta, mmap_mode="r")
+        except ValueError:
+            # Algunas versiones de numpy no pueden mapear un arreglo vacío (POS gold sin filas)
+            arreglos[ruta.stem] = np.load(ruta)
+    return arreglos
+
+
+def abrir_trayectorias_pos(_engine):
+    """
+    Devuelve el almacén de trayectorias de cuotas de pos_cash_balance_gold: arreglos de
+    offsets por cliente (curr_ids, curr_offsets) y por crédito (prev_ids, prev_offsets) y
+    de valores (months_balance, cnt_instalment_future), abiertos con memory-map, de modo
+    que leer un cliente solo toca sus rebanadas y no la tabla completa.
+
+    Retorno: diccionario de arreglos, o None si el almacén no existe o no corresponde a
+    la versión de pos_cash_balance_gold en gold_manifest.
+    """
+    inicio = time.perf_counter()
+    try:
+        with open(DIRECTORIO_TRAYECTORIAS_POS / "manifiesto.json") as f:
+            checksum = json.load(f)["CHECKSUM"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+    version = version_tabla(_engine, "pos_cash_balance_gold")
+    if version and version != checksum:
+        print("Las trayectorias de cuotas no corresponden a la versión vigente de pos_cash_balance_gold.")
+        return None
+
+    trayectorias = _abrir_trayectorias(checksum)
+    registrar(__name__, "abrir_trayectorias_pos", time.perf_counter() - inicio)
+    return trayectorias
+
+
+def calentar_cache(_engine):
+    """
+    Precarga en la caché compartida todas las tablas del registro.
+    Pensada para correr en un hilo al arrancar el dashboard: las páginas que se abran
+    mientras tanto esperan a que termine la carga de su tabla en lugar de repetirla.
+
+    Retorno: True si se cargaron todas las tablas.
+    """
+    almacen = _almacen_tablas()
+    completo = True
+    for nombre in TABLAS:
+        inicio = time.monotonic()
+        if leer_tabla(_engine, nombre).empty:
+            print(f"No se pudo precargar la tabla '{nombre}'.")
+            completo = False
+            continue
+        almacen["calentamiento"][nombre] = round(time.monotonic() - inicio, 3)
+    return completo
+
+
+def estadisticas_cache():
+    """
+    Aciertos, fallos, recargas, segundos de precarga por tabla y detalle (filas, bytes,
+    versión, antigüedad y origen: snapshot o base de datos) de cada tabla en caché.
+    """
+    almacen = _almacen_tablas()
+    ahora = time.monotonic()
+    return {
+        "aciertos": almacen["aciertos"],
+        "fallos": almacen["fallos"],
+        "recargas": almacen["recargas"],
+        "calentamiento": dict(almacen["calentamiento"]),
+        "tablas": {
+            nombre: {
+                "filas": len(entrada["df"]),
+                "bytes": int(entrada["df"].memory_usage(index=False).sum()),
+                "version": entrada["version"][:12],
+                "antiguedad_s": round(ahora - entrada["cargada"], 1),
+                "origen": entrada["origen"],
+            }
+            for nombre, entrada in list(almacen["tablas"].items())
+        },
+    }
@@ -0,0 +1,62 @@
+# diagnostico.py
+import json
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from data import estadisticas_cache
+from figuras import estadisticas_figuras
+from instrumentacion import exportar_metricas
+
+# Página oculta de diagnóstico (se abre con ?diagnostico en la URL): tiempos por página y
+# función de cargas, transformaciones y gráficos, y estado de las cachés de tablas y figuras.
+
+def app(DB_USER, DB_PASS, DB_HOST, DB_PORT):
+    st.markdown("<h1 style='color: #d8ddf9; font-family: Courier New; text-align: center;'>Diagnóstico del Dashboard</h1>", unsafe_allow_html=True)
+
+    metricas = exportar_metricas()
+    cache = estadisticas_cache()
+    figuras = estadisticas_figuras()
+
+    st.download_button(
+        "⬇️ Exportar métricas (JSON)",
+        data=json.dumps({"fecha": pd.Timestamp.now().isoformat(), "funciones": metricas, "cache": cache, "figuras": figuras}, indent=2, default=str),
+        file_name=f"metricas_dashboard_{pd.Timestamp.now():%Y%m%d_%H%M%S}.json",
+        mime="application/json",
+    )
+
+    # --- Caché compartida de tablas ---
+    st.markdown("<h2 style='color: #d8ddf9; font-family: Courier New;'>Caché de tablas</h2>", unsafe_allow_html=True)
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Aciertos", cache["aciertos"])
+    c2.metric("Fallos", cache["fallos"])
+    c3.metric("Recargas", cache["recargas"])
+    if cache["tablas"]:
+        st.dataframe(pd.DataFrame.from_dict(cache["tablas"], orient="index"))
+
+    # --- Caché de figuras ---
+    st.markdown("<h2 style='color: #d8ddf9; font-family: Courier New;'>Caché de figuras</h2>", unsafe_allow_html=True)
+    f1, f2, f3, f4 = st.columns(4)
+    f1.metric("Aciertos", figuras["aciertos"])
+    f2.metric("Fallos", figuras["fallos"])
+    f3.metric("Desalojos", figuras["desalojos"])
+    f4.metric("Ocupado", f"{figuras['bytes'] / 1024**2:.1f} / {figuras['presupuesto_bytes'] / 1024**2:.0f} MB")
+
+    # --- Métricas por página ---
+    if not metricas:
+        st.info("Aún no hay llamadas registradas; abre alguna página del dashboard.")
+        return
+
+    for pagina, funciones in metricas.items():
+        st.markdown(f"<h2 style='color: #d8ddf9; font-family: Courier New;'>{pagina}</h2>", unsafe_allow_html=True)
+        resumen = pd.DataFrame.from_dict(funciones, orient="index").drop(columns="duraciones_ms")
+        st.dataframe(resumen.sort_values("p95_ms", ascending=False))
+
+        duraciones = pd.DataFrame(
+            [(funcion, d) for funcion, m in funciones.items() for d in m["duraciones_ms"]],
+            columns=["Función", "Duración (ms)"]
+        )
+        fig = px.histogram(duraciones, x="Duración (ms)", color="Función", nbins=40, barmode="overlay", log_y=True)
+        fig.update_layout(yaxis_title="Llamadas")
+        st.plotly_chart(fig, use_container_width=True, key=f"histograma_{pagina}")
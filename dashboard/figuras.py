@@ -0,0 +1,93 @@
+# dashboard/figuras.py
+import io
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+# Caché de figuras de gráficos cuyos datos no cambian entre ejecuciones, compartida por
+# todas las sesiones del proceso. La clave es (id del gráfico, versión de los datos,
+# parámetros); al superar el presupuesto de bytes se desalojan las figuras usadas hace
+# más tiempo (LRU). Las figuras de matplotlib se guardan como PNG ya renderizado, así que
+# un acierto evita la agregación, el dibujo y savefig. Las de plotly se guardan como
+# objeto: un acierto evita la agregación y la construcción de la figura, pero
+# st.plotly_chart la sigue serializando a JSON en cada render (su API no acepta una
+# especificación ya serializada).
+
+#Presupuesto de memoria de la caché de figuras
+PRESUPUESTO_BYTES = 64 * 1024 * 1024
+
+# Mismas opciones con las que st.pyplot renderiza las figuras de matplotlib
+OPCIONES_PNG = {"format": "png", "bbox_inches": "tight", "dpi": 200}
+
+
+@st.cache_resource
+def _cache_figuras():
+    return {
+        "bloqueo": threading.Lock(),
+        "figuras": OrderedDict(),   # clave -> (figura o PNG, bytes)
+        "bytes": 0,
+        "aciertos": 0,
+        "fallos": 0,
+        "desalojos": 0,
+    }
+
+
+def _preparar(figura):
+    """Renderiza a PNG (y cierra) una figura de matplotlib; devuelve (valor a cachear, bytes)."""
+    if hasattr(figura, "savefig"):
+        import matplotlib.pyplot as plt
+
+        buffer = io.BytesIO()
+        figura.savefig(buffer, **OPCIONES_PNG)
+        plt.close(figura)
+        png = buffer.getvalue()
+        return png, len(png)
+    return figura, len(figura.to_json())
+
+
+def figura_cacheada(id_grafico, version, parametros, construir):
+    """
+    Devuelve la figura de 'id_grafico' para una versión de los datos y unos parámetros
+    (tupla hashable). Solo en un fallo se llama a 'construir()', que hace la agregación
+    y devuelve una figura de plotly o de matplotlib.
+
+    Retorno: la go.Figure (no debe modificarse: es compartida; Streamlit la serializa en
+    cada render) o los bytes PNG de la figura de matplotlib, para mostrar con
+    st.plotly_chart o st.image respectivamente.
+    """
+    clave = (id_grafico, version, parametros)
+    cache = _cache_figuras()
+    with cache["bloqueo"]:
+        if clave in cache["figuras"]:
+            cache["figuras"].move_to_end(clave)
+            cache["aciertos"] += 1
+            return cache["figuras"][clave][0]
+        cache["fallos"] += 1
+
+    valor, tamano = _preparar(construir())
+
+    with cache["bloqueo"]:
+        if clave not in cache["figuras"]:
+            cache["figuras"][clave] = (valor, tamano)
+            cache["bytes"] += tamano
+        # Desalojo LRU; la figura recién agregada se conserva aunque supere el presupuesto
+        while cache["bytes"] > PRESUPUESTO_BYTES and len(cache["figuras"]) > 1:
+            _, (_, tamano_desalojado) = cache["figuras"].popitem(last=False)
+            cache["bytes"] -= tamano_desalojado
+            cache["desalojos"] += 1
+    return valor
+
+
+def estadisticas_figuras():
+    """Aciertos, fallos, desalojos, figuras y bytes ocupados de la caché de figuras."""
+    cache = _cache_figuras()
+    with cache["bloqueo"]:
+        return {
+            "aciertos": cache["aciertos"],
+            "fallos": cache["fallos"],
+            "desalojos": cache["desalojos"],
+            "figuras": len(cache["figuras"]),
+            "bytes": cache["bytes"],
+            "presupuesto_bytes": PRESUPUESTO_BYTES,
+        }
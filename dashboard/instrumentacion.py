@@ -0,0 +1,138 @@
+# dashboard/instrumentacion.py
+import functools
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Instrumentación de cargas, transformaciones y gráficos del dashboard: cada función
+# decorada registra duración, filas y bytes del resultado y, si usa caché de Streamlit,
+# si fue acierto o fallo. Las métricas se agrupan por página (módulo) y función.
+
+#Duraciones guardadas por función para los histogramas (las más recientes)
+MAX_MUESTRAS = 500
+
+# Marca por hilo de que el cuerpo de una función cacheada se ejecutó (fallo de caché)
+_local = threading.local()
+
+
+@st.cache_resource
+def _registro():
+    """Métricas compartidas por todas las sesiones del proceso."""
+    return {"bloqueo": threading.Lock(), "funciones": {}}
+
+
+def _tamano(resultado):
+    """Filas y bytes de un resultado: DataFrame, Series, arreglo o un diccionario/tupla de ellos."""
+    if isinstance(resultado, pd.DataFrame):
+        return len(resultado), int(resultado.memory_usage(index=False).sum())
+    if isinstance(resultado, pd.Series):
+        return len(resultado), int(resultado.memory_usage(index=False))
+    if isinstance(resultado, np.ndarray):
+        return len(resultado), int(resultado.nbytes)
+    if isinstance(resultado, (dict, tuple, list)):
+        valores = resultado.values() if isinstance(resultado, dict) else resultado
+        medidas = [
+            _tamano(valor) for valor in valores
+            if isinstance(valor, (pd.DataFrame, pd.Series, np.ndarray))
+        ]
+        return max((filas for filas, _ in medidas), default=0), sum(bytes_ for _, bytes_ in medidas)
+    return 0, 0
+
+
+def registrar(pagina, funcion, segundos, resultado=None, acierto=None):
+    """Agrega una llamada a las métricas de (pagina, funcion)."""
+    filas, bytes_ = _tamano(resultado)
+    registro = _registro()
+    with registro["bloqueo"]:
+        metricas = registro["funciones"].setdefault((pagina, funcion), {
+            "llamadas": 0, "aciertos": 0, "fallos": 0, "filas": 0, "bytes": 0,
+            "duraciones_ms": deque(maxlen=MAX_MUESTRAS),
+        })
+        metricas["llamadas"] += 1
+        metricas["filas"] = filas
+        metricas["bytes"] = bytes_
+        metricas["duraciones_ms"].append(segundos * 1000)
+        if acierto is not None:
+            metricas["aciertos" if acierto else "fallos"] += 1
+
+
+def medir(func=None, *, cache=None):
+    """
+    Decorador de instrumentación. Se usa como '@medir' o, en funciones cacheadas, como
+    '@medir(cache=st.cache_data(...))' en lugar del decorador de caché: así se sabe si
+    la llamada ejecutó el cuerpo (fallo) o se resolvió desde la caché (acierto), y la
+    duración incluye la (de)serialización de st.cache_data.
+    """
+    if func is None:
+        return functools.partial(medir, cache=cache)
+
+    pagina = func.__module__
+    llamada = func
+    if cache is not None:
+        @functools.wraps(func)
+        def cuerpo(*args, **kwargs):
+            _local.ejecutado = True
+            return func(*args, **kwargs)
+        llamada = cache(cuerpo)
+
+    @functools.wraps(func)
+    def envoltura(*args, **kwargs):
+        ejecutado_previo = getattr(_local, "ejecutado", False)
+        _local.ejecutado = False
+        inicio = time.perf_counter()
+        try:
+            resultado = llamada(*args, **kwargs)
+        finally:
+            ejecutado = _local.ejecutado
+            _local.ejecutado = ejecutado_previo
+        acierto = None if cache is None else not ejecutado
+        registrar(pagina, func.__name__, time.perf_counter() - inicio, resultado, acierto)
+        return resultado
+
+    if cache is not None:
+        envoltura.clear = llamada.clear
+    return envoltura
+
+
+def fragmento(func):
+    """
+    Convierte una sección de página en un st.fragment: sus widgets solo vuelven a
+    ejecutar esa sección y no la página completa. Al final muestra cuánto tardó y lo
+    registra en las métricas de la página.
+    """
+    @functools.wraps(func)
+    def envoltura(*args, **kwargs):
+        inicio = time.perf_counter()
+        resultado = func(*args, **kwargs)
+        segundos = time.perf_counter() - inicio
+        registrar(func.__module__, func.__name__, segundos)
+        st.caption(f"⏱️ {func.__name__}: {segundos * 1000:.0f} ms")
+        return resultado
+
+    return st.fragment(envoltura)
+
+
+def exportar_metricas():
+    """
+    Resumen de las métricas por página y función (llamadas, aciertos, fallos, filas y
+    bytes del último resultado, y percentiles de duración), listo para serializar a JSON.
+    """
+    registro = _registro()
+    with registro["bloqueo"]:
+        funciones = {clave: dict(m, duraciones_ms=list(m["duraciones_ms"])) for clave, m in registro["funciones"].items()}
+
+    resumen = {}
+    for (pagina, funcion), metricas in sorted(funciones.items()):
+        duraciones = np.asarray(metricas.pop("duraciones_ms"))
+        resumen.setdefault(pagina, {})[funcion] = {
+            **metricas,
+            "p50_ms": round(float(np.percentile(duraciones, 50)), 2),
+            "p95_ms": round(float(np.percentile(duraciones, 95)), 2),
+            "max_ms": round(float(duraciones.max()), 2),
+            "duraciones_ms": [round(float(d), 2) for d in duraciones],
+        }
+    return resumen
@@ -1,11 +1,19 @@
 # dashboard/main.py
 import streamlit as st
 from datetime import datetime
-
-# Importa los módulos de las páginas
-import applicants
-import credit
-import risk_level
+import importlib
+import threading
+import time
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+
+# Registro de páginas: cada módulo se importa la primera vez que se navega a él; así
+# "Inicio" no espera a pandas, plotly, sklearn ni los modelos.
+PAGINAS = {
+    "Aplicantes": "applicants",
+    "Análisis Crediticio": "credit",
+    "Modelos": "risk_level",
+    "Diagnóstico": "diagnostico",  # página oculta: sin botón en el menú, se abre con ?diagnostico
+}
 
 #Definir credenciales para levantar el streamlit de forma local, consumiendo la base de datos gold de MySQL
 
@@ -14,6 +22,9 @@ DB_PASS = "Tu_contraseña." # Reemplaza con tu contraseña
 DB_HOST = "localhost"
 DB_PORT = "3306"
 
+#Segundos entre reintentos de la precarga de la caché si la anterior no cargó todas las tablas
+REINTENTO_CALENTAMIENTO = 60
+
 # ──────────────────────────────────────────────
 # Configuración general
 st.set_page_config(page_title="Dashboard Home Credit", layout="wide", page_icon="📊")
@@ -22,6 +33,9 @@ st.set_page_config(page_title="Dashboard Home Credit", layout="wide", page_icon=
 # Configuración del estado inicial
 if "page" not in st.session_state:
     st.session_state.page = "Inicio"
+if "diagnostico" in st.query_params:
+    st.session_state.page = "Diagnóstico"
+    del st.query_params["diagnostico"]
 
 # Estilo CSS para botones bonitos
 st.markdown("""
@@ -38,6 +52,60 @@ div[data-testid="stSidebar"] button:hover {
 def navegar(pagina):
     st.session_state.page = pagina
 
+@st.cache_resource
+def tiempos_importacion():
+    """Segundos que tardó en importarse cada módulo de página (compartido por el proceso)."""
+    return {}
+
+def cargar_pagina(pagina):
+    """Importa el módulo de una página y registra cuánto tardó la primera importación."""
+    modulo = PAGINAS[pagina]
+    # Siempre por importlib: si otra sesión lo está importando, espera a que termine en
+    # lugar de recibir de sys.modules un módulo a medio inicializar
+    primera_vez = modulo not in tiempos_importacion()
+    inicio = time.perf_counter()
+    pagina_modulo = importlib.import_module(modulo)
+    if primera_vez:
+        tiempos_importacion()[modulo] = time.perf_counter() - inicio
+    return pagina_modulo
+
+@st.cache_resource(show_spinner=False)
+def _estado_calentamiento():
+    """Hilo de precarga en curso y si alguna precarga ya cargó todas las tablas (por proceso)."""
+    return {"hilo": None, "completo": False, "terminado": float("-inf"), "bloqueo": threading.Lock()}
+
+def calentar_dashboard():
+    """
+    Arranca el hilo que precarga las tablas del registro en la caché compartida, salvo que
+    ya haya uno en curso o una precarga completa. Si la anterior falló (por ejemplo, con la
+    base de datos caída al arrancar) se reintenta en una ejecución posterior, como mucho
+    cada REINTENTO_CALENTAMIENTO segundos. Solo calienta la capa de datos: los módulos de
+    página se siguen importando al abrirlos. La capa de datos se importa dentro del hilo
+    ("Inicio" no espera a pandas) y el hilo lleva el contexto de la sesión que lo arrancó,
+    que necesitan las cachés y mensajes de Streamlit.
+    """
+    estado = _estado_calentamiento()
+    with estado["bloqueo"]:
+        en_curso = estado["hilo"] is not None and estado["hilo"].is_alive()
+        if estado["completo"] or en_curso or time.monotonic() - estado["terminado"] < REINTENTO_CALENTAMIENTO:
+            return estado["hilo"]
+
+        def calentar():
+            try:
+                from data import get_db_engine, calentar_cache
+                engine = get_db_engine(DB_USER, DB_PASS, DB_HOST, DB_PORT)
+                estado["completo"] = engine is not None and calentar_cache(engine)
+            finally:
+                estado["terminado"] = time.monotonic()
+
+        hilo = threading.Thread(target=calentar, name="calentador-dashboard", daemon=True)
+        add_script_run_ctx(hilo)
+        estado["hilo"] = hilo
+        hilo.start()
+    return hilo
+
+calentar_dashboard()
+
 # ──────────────────────────────────────────────
 # Barra lateral con navegación
 with st.sidebar:
@@ -53,6 +121,13 @@ with st.sidebar:
         if st.button("Historial de Aplicantes"):
             navegar("Aplicantes")
         st.markdown("</div>", unsafe_allow_html=True)
+    with st.expander("⏱️ Tiempos de importación"):
+        tiempos = tiempos_importacion()
+        if tiempos:
+            for modulo, segundos in tiempos.items():
+                st.caption(f"{modulo}: {segundos:.2f} s")
+        else:
+            st.caption("Aún no se ha abierto ninguna página.")
 
 
 
@@ -145,10 +220,6 @@ if st.session_state.page == "Inicio":
     """, unsafe_allow_html=True)
 
     # ──────────────────────────────────────────────
-elif st.session_state.page == "Aplicantes":
-    applicants.app(DB_USER=DB_USER, DB_PASS=DB_PASS, DB_HOST=DB_HOST, DB_PORT = DB_PORT)  # Define `app()` en applicants.py
-elif st.session_state.page == "Análisis Crediticio":
-    credit.app(DB_USER=DB_USER, DB_PASS=DB_PASS, DB_HOST=DB_HOST, DB_PORT = DB_PORT)
-elif st.session_state.page == "Modelos":
-    risk_level.app(DB_USER=DB_USER, DB_PASS=DB_PASS, DB_HOST=DB_HOST, DB_PORT = DB_PORT)
-
+elif st.session_state.page in PAGINAS:
+    pagina = cargar_pagina(st.session_state.page)
+    pagina.app(DB_USER=DB_USER, DB_PASS=DB_PASS, DB_HOST=DB_HOST, DB_PORT = DB_PORT)  # Cada página define `app()`
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+
+def codificar_dummies(X, columnas_categoricas, prefix_sep='_'):
+    """
+    Aplica get_dummies columna por columna y registra de qué característica original
+    proviene cada columna resultante, para agrupar importancias sin inferir por prefijos.
+
+    El orden de las columnas es el mismo que el de pd.get_dummies(X, columns=...):
+    primero las no categóricas y luego los dummies de cada categórica.
+
+    Parámetros:
+    ----------
+    X : pd.DataFrame
+        Características de entrada.
+
+    columnas_categoricas : list
+        Columnas de X que se codifican con dummies.
+
+    prefix_sep : str
+        Separador entre el nombre de la columna y el valor en los dummies.
+
+    Retorna:
+    --------
+    tuple(pd.DataFrame, dict)
+        - X codificado.
+        - Codificación con 'columnas' (nombres de salida), 'fuentes' (características
+          originales) y 'grupos' (np.ndarray de int con el índice en 'fuentes' de cada columna).
+    """
+    columnas_categoricas = list(columnas_categoricas)
+    no_categoricas = [col for col in X.columns if col not in columnas_categoricas]
+
+    bloques = [X[no_categoricas]]
+    fuentes = list(no_categoricas)
+    grupos = [np.arange(len(no_categoricas))]
+
+    for col in columnas_categoricas:
+        dummies = pd.get_dummies(X[col], prefix=col, prefix_sep=prefix_sep)
+        bloques.append(dummies)
+        grupos.append(np.full(dummies.shape[1], len(fuentes)))
+        fuentes.append(col)
+
+    X_encoded = pd.concat(bloques, axis=1)
+    codificacion = {
+        'columnas': X_encoded.columns.tolist(),
+        'fuentes': fuentes,
+        'grupos': np.concatenate(grupos).astype(np.int64),
+    }
+    return X_encoded, codificacion
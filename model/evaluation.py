@@ -0,0 +1,104 @@
+import hashlib
+import pickle
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import classification_report, confusion_matrix, accuracy_score
+
+
+def hash_split(y_train, y_test):
+    """
+    Calcula una huella del particionado train/test a partir de los índices y etiquetas
+    de cada partición, para saber con qué datos se evaluó el modelo guardado.
+
+    Parámetros:
+    ----------
+    y_train, y_test : pd.Series
+        Etiquetas de entrenamiento y prueba, con el índice original de las filas.
+
+    Retorna:
+    --------
+    str
+        Hash SHA-256 en hexadecimal.
+    """
+    huella = hashlib.sha256()
+    for particion in (y_train, y_test):
+        huella.update(pd.util.hash_pandas_object(particion, index=True).to_numpy().tobytes())
+    return huella.hexdigest()
+
+
+def agrupar_importancias(importancias, codificacion):
+    """
+    Suma las importancias de las columnas dummy en la característica original de la que
+    provienen, usando el mapa exacto registrado por el codificador al entrenar.
+
+    Parámetros:
+    ----------
+    importancias : array-like
+        'feature_importances_' del modelo.
+
+    codificacion : dict
+        Codificación devuelta por 'codificar_dummies' ('fuentes' y 'grupos').
+
+    Retorna:
+    --------
+    pd.Series
+        Importancia acumulada por característica, ordenada de mayor a menor.
+    """
+    fuentes = codificacion['fuentes']
+    acumuladas = np.bincount(codificacion['grupos'], weights=importancias, minlength=len(fuentes))
+    return pd.Series(acumuladas, index=fuentes).sort_values(ascending=False)
+
+
+def crear_bundle_evaluacion(modelo, codificacion, y_train, y_test, y_pred, nombres_clases):
+    """
+    Reúne en un diccionario todo lo que el dashboard muestra del modelo, calculado una
+    sola vez al entrenar: matriz de confusión, reporte de clasificación, importancias
+    agrupadas y la huella del particionado.
+
+    Parámetros:
+    ----------
+    modelo : estimador entrenado con 'feature_importances_'.
+
+    codificacion : dict
+        Codificación de las columnas de entrada devuelta por 'codificar_dummies'.
+
+    y_train, y_test : pd.Series
+        Etiquetas de entrenamiento y prueba.
+
+    y_pred : array-like
+        Predicciones del modelo sobre la partición de prueba.
+
+    nombres_clases : list
+        Nombre legible de cada clase, indexado por la etiqueta.
+
+    Retorna:
+    --------
+    dict
+        Bundle de evaluación listo para guardar con 'guardar_bundle_evaluacion'.
+    """
+    etiquetas = sorted(np.unique(np.concatenate((np.asarray(y_test), np.asarray(y_pred)))))
+
+    return {
+        'etiquetas': etiquetas,
+        'nombres_clases': [nombres_clases[i] for i in etiquetas],
+        'matriz_confusion': confusion_matrix(y_test, y_pred, labels=etiquetas),
+        'reporte': classification_report(
+            y_test, y_pred, labels=etiquetas,
+            target_names=[nombres_clases[i] for i in etiquetas],
+            output_dict=True, zero_division=0
+        ),
+        'accuracy': accuracy_score(y_test, y_pred),
+        'importancias_agrupadas': agrupar_importancias(modelo.feature_importances_, codificacion),
+        'fuentes_features': codificacion['fuentes'],
+        'grupos_features': codificacion['grupos'],
+        'hash_split': hash_split(y_train, y_test),
+        'n_train': len(y_train),
+        'n_test': len(y_test),
+    }
+
+
+def guardar_bundle_evaluacion(bundle, ruta):
+    """Guarda el bundle de evaluación en un archivo pickle."""
+    with open(ruta, 'wb') as bundle_file:
+        pickle.dump(bundle, bundle_file)
@@ -1,58 +1,90 @@
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, accuracy_score
-from sqlalchemy import create_engine
 import pandas as pd
 import pickle
 from sklearn.preprocessing import StandardScaler
 import sys
+sys.path.append('..')
+from scripts.engines import crear_engine
+from encoding import codificar_dummies
+from evaluation import crear_bundle_evaluacion, guardar_bundle_evaluacion
 
-#Credenciales generales para consumir gold
+def entrenar_modelo_id(df_model_4ID):
+    """
+    Entrena el clasificador de riesgo para clientes registrados: dummies de las
+    categóricas, escalado, partición 80/20 y RandomForest con clases balanceadas.
 
-DB_USER = "root"
-DB_PASS = "Tu_contraseña." # Reemplaza con tu contraseña
-DB_HOST = "localhost"
-DB_PORT = "3306"
+    Parámetros:
+    ----------
+    df_model_4ID : pd.DataFrame
+        Tabla 'model_gold_id' con la columna TARGET.
 
-try:
-    engine_gold = create_engine(f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/gold")
-    print("Motores de base de datos configurados correctamente.")
-except Exception as e:  
-    print(f"Error al configurar los motores de base de datos: {e}")
-    sys.exit(1)
-# --------------------------------------------------------
+    Retorna:
+    --------
+    dict
+        'modelo', 'columnas' (orden de entrada del modelo), 'scaler', 'codificacion'
+        y 'y_train', 'y_test', 'y_pred' de la partición de prueba.
+    """
+    df_para_entrenamiento = df_model_4ID.copy()
 
-#Modelo para clientes registrados
+    X_ID = df_para_entrenamiento.drop(columns=['SK_ID_CURR', 'TARGET'])
 
-df_model_4ID = pd.read_sql_query("select *from model_gold_id",engine_gold)
+    y_ID = df_para_entrenamiento['TARGET']
 
-df_para_entrenamiento = df_model_4ID.copy()
+    categorical_features = X_ID.select_dtypes(include=['object']).columns
+    X_ID_encoded, codificacion_id = codificar_dummies(X_ID, categorical_features, prefix_sep='_')
+    X_ID_encoded = X_ID_encoded.astype(int)
+    model_columns_id = X_ID_encoded.columns.tolist()
+    scaler_id = StandardScaler()
+    X_scaled = scaler_id.fit_transform(X_ID_encoded)
+    X_train_ID, X_test_ID, y_train_ID, y_test_ID = train_test_split(X_scaled, y_ID, test_size=0.2, random_state=42)
+    model_ID = RandomForestClassifier(n_estimators=100, random_state=42,class_weight='balanced')
+    model_ID.fit(X_train_ID, y_train_ID)
+    y_pred_ID = model_ID.predict(X_test_ID)
+    return {
+        'modelo': model_ID, 'columnas': model_columns_id, 'scaler': scaler_id, 'codificacion': codificacion_id,
+        'y_train': y_train_ID, 'y_test': y_test_ID, 'y_pred': y_pred_ID,
+    }
 
-X_ID = df_para_entrenamiento.drop(columns=['SK_ID_CURR', 'TARGET'])
 
-y_ID = df_para_entrenamiento['TARGET']
+if __name__ == "__main__":
+    #Credenciales generales para consumir gold
 
-categorical_features = X_ID.select_dtypes(include=['object']).columns
-X_ID_encoded = pd.get_dummies(X_ID, columns=categorical_features, prefix_sep='_')
-X_ID_encoded = X_ID_encoded.astype(int)
-model_columns_id = X_ID_encoded.columns.tolist()
-scaler_id = StandardScaler()
-X_scaled = scaler_id.fit_transform(X_ID_encoded)
-X_train_ID, X_test_ID, y_train_ID, y_test_ID = train_test_split(X_scaled, y_ID, test_size=0.2, random_state=42)
-model_ID = RandomForestClassifier(n_estimators=100, random_state=42,class_weight='balanced')
-model_ID.fit(X_train_ID, y_train_ID)
-y_pred_ID = model_ID.predict(X_test_ID)
-print("Accuracy:", accuracy_score(y_test_ID, y_pred_ID))
+    DB_USER = "root"
+    DB_PASS = "Tu_contraseña." # Reemplaza con tu contraseña
+    DB_HOST = "localhost"
+    DB_PORT = "3306"
 
-mapa_riesgo = ['Riesgo Alto','Riesgo Medio','Riesgo Bajo']
+    try:
+        engine_gold = crear_engine("gold", DB_USER, DB_PASS, DB_HOST, DB_PORT)
+        print("Motores de base de datos configurados correctamente.")
+    except Exception as e:  
+        print(f"Error al configurar los motores de base de datos: {e}")
+        sys.exit(1)
+    # --------------------------------------------------------
 
-# Guardar el modelo
-with open("model_risk_4ID.pickle", "wb") as model_file:
-    pickle.dump(model_ID, model_file)
+    #Modelo para clientes registrados
 
-# Guardar el mapeo de clases (uniques)
-with open("model_risk_4ID_OUTPUT.pickle", "wb") as mapping_file:
-    pickle.dump(mapa_riesgo, mapping_file)
+    df_model_4ID = pd.read_sql_query("select *from model_gold_id",engine_gold)
 
-with open('column_risk_4ID.pickle', 'wb') as columns:
-    pickle.dump(model_columns_id, columns)
\ No newline at end of file
+    resultado = entrenar_modelo_id(df_model_4ID)
+    model_ID = resultado['modelo']
+    print("Accuracy:", accuracy_score(resultado['y_test'], resultado['y_pred']))
+
+    mapa_riesgo = ['Riesgo Alto','Riesgo Medio','Riesgo Bajo']
+
+    # Guardar el modelo
+    with open("model_risk_4ID.pickle", "wb") as model_file:
+        pickle.dump(model_ID, model_file)
+
+    # Guardar el mapeo de clases (uniques)
+    with open("model_risk_4ID_OUTPUT.pickle", "wb") as mapping_file:
+        pickle.dump(mapa_riesgo, mapping_file)
+
+    with open('column_risk_4ID.pickle', 'wb') as columns:
+        pickle.dump(resultado['columnas'], columns)
+
+    # Guardar las métricas de evaluación para que el dashboard no vuelva a predecir
+    bundle_ID = crear_bundle_evaluacion(model_ID, resultado['codificacion'], resultado['y_train'], resultado['y_test'], resultado['y_pred'], mapa_riesgo)
+    guardar_bundle_evaluacion(bundle_ID, "model_risk_4ID_evaluation.pickle")
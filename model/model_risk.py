@@ -1,57 +1,88 @@
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, accuracy_score
-from sqlalchemy import create_engine
 import pandas as pd
 import pickle
 from sklearn.preprocessing import StandardScaler
 import sys
+sys.path.append('..')
+from scripts.engines import crear_engine
+from encoding import codificar_dummies
+from evaluation import crear_bundle_evaluacion, guardar_bundle_evaluacion
 
-#Credenciales generales para consumir gold
+def entrenar_modelo_riesgo(df):
+    """
+    Entrena el clasificador de riesgo para clientes no registrados: dummies de las
+    categóricas, escalado, partición 80/20 y RandomForest con clases balanceadas.
 
-DB_USER = "root"
-DB_PASS = "Tu_contraseña." # Reemplaza con tu contraseña
-DB_HOST = "localhost"
-DB_PORT = "3306"
+    Parámetros:
+    ----------
+    df : pd.DataFrame
+        Tabla 'risk_level_data' con la columna TARGET.
 
-try:
-    engine_gold = create_engine(f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/gold")
-    print("Motores de base de datos configurados correctamente.")
-except Exception as e:  
-    print(f"Error al configurar los motores de base de datos: {e}")
-    sys.exit(1)
+    Retorna:
+    --------
+    dict
+        'modelo', 'columnas' (orden de entrada del modelo), 'scaler', 'codificacion'
+        y 'y_train', 'y_test', 'y_pred' de la partición de prueba.
+    """
+    categoricas = df.select_dtypes("object").columns
+    X, codificacion = codificar_dummies(df.drop("TARGET",axis=1), categoricas)
+    y=df["TARGET"]
+    model_columns = X.columns.tolist()
+    scaler = StandardScaler()
+    X = scaler.fit_transform(X)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-# --------------------------------------------------------
+    model = RandomForestClassifier(n_estimators=100, random_state=42,class_weight='balanced')
+    model.fit(X_train, y_train)
+    y_pred = model.predict(X_test)
+    return {
+        'modelo': model, 'columnas': model_columns, 'scaler': scaler, 'codificacion': codificacion,
+        'y_train': y_train, 'y_test': y_test, 'y_pred': y_pred,
+    }
 
-#Modelo para clientes no registrados
 
-df=pd.read_sql_query("SELECT*FROM risk_level_data",engine_gold)
-categoricas = df.select_dtypes("object").columns
-df_processed = pd.get_dummies(df, columns=categoricas)
-X=df_processed.drop("TARGET",axis=1)
-y=df["TARGET"]
-model_columns = X.columns.tolist()
-scaler = StandardScaler()
-X = scaler.fit_transform(X)
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+if __name__ == "__main__":
+    #Credenciales generales para consumir gold
 
-model = RandomForestClassifier(n_estimators=100, random_state=42,class_weight='balanced')
-model.fit(X_train, y_train)
-y_pred = model.predict(X_test)
-print("Accuracy:", accuracy_score(y_test, y_pred))
-print("\nReporte de Clasificación:")
-print(classification_report(y_test, y_pred))
+    DB_USER = "root"
+    DB_PASS = "Tu_contraseña." # Reemplaza con tu contraseña
+    DB_HOST = "localhost"
+    DB_PORT = "3306"
 
+    try:
+        engine_gold = crear_engine("gold", DB_USER, DB_PASS, DB_HOST, DB_PORT)
+        print("Motores de base de datos configurados correctamente.")
+    except Exception as e:  
+        print(f"Error al configurar los motores de base de datos: {e}")
+        sys.exit(1)
 
-mapa_riesgo = ['Riesgo Alto','Riesgo Medio','Riesgo Bajo']
+    # --------------------------------------------------------
 
-with open('risk_columns.pkl', 'wb') as columns:
-    pickle.dump(model_columns, columns)
+    #Modelo para clientes no registrados
 
-# Guardar el modelo
-with open("risk_classifer_model.pickle", "wb") as model_file:
-    pickle.dump(model, model_file)
+    df=pd.read_sql_query("SELECT*FROM risk_level_data",engine_gold)
+    resultado = entrenar_modelo_riesgo(df)
+    model = resultado['modelo']
+    print("Accuracy:", accuracy_score(resultado['y_test'], resultado['y_pred']))
+    print("\nReporte de Clasificación:")
+    print(classification_report(resultado['y_test'], resultado['y_pred']))
 
-# Guardar el mapeo de clases (uniques)
-with open("risk_classifer_output.pickle", "wb") as mapping_file:
-    pickle.dump(mapa_riesgo, mapping_file)
+
+    mapa_riesgo = ['Riesgo Alto','Riesgo Medio','Riesgo Bajo']
+
+    with open('risk_columns.pkl', 'wb') as columns:
+        pickle.dump(resultado['columnas'], columns)
+
+    # Guardar el modelo
+    with open("risk_classifer_model.pickle", "wb") as model_file:
+        pickle.dump(model, model_file)
+
+    # Guardar el mapeo de clases (uniques)
+    with open("risk_classifer_output.pickle", "wb") as mapping_file:
+        pickle.dump(mapa_riesgo, mapping_file)
+
+    # Guardar las métricas de evaluación para que el dashboard no vuelva a predecir
+    bundle = crear_bundle_evaluacion(model, resultado['codificacion'], resultado['y_train'], resultado['y_test'], resultado['y_pred'], mapa_riesgo)
+    guardar_bundle_evaluacion(bundle, "risk_classifer_evaluation.pickle")
@@ -0,0 +1,407 @@
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.cluster import KMeans
+from sklearn.preprocessing import StandardScaler
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+sys.path.insert(0, str(RAIZ / "model"))
+
+from scripts import function as fn
+from scripts.synthetic_data import ESCALA_MAX, ESCALA_MIN, generar_datos
+from model import entrenar_modelo_id
+from model_risk import entrenar_modelo_riesgo
+
+# Benchmark de punta a punta del pipeline bronze → silver → gold → entrenamiento →
+# puntuación sobre datos sintéticos (scripts/synthetic_data.py) a varias escalas.
+# Cada etapa llama a las mismas funciones que scripts/clean_EDA.py y model/*.py, pero
+# en memoria: no se mide la lectura ni la escritura en MySQL, ni las consultas de EDA.
+# Por etapa se guarda tiempo de pared, tiempo de CPU, pico de RSS y filas por segundo
+# en un JSON, y se compara contra una línea base: si alguna etapa empeora más que el
+# umbral el proceso termina con código 1 (para usarlo como control en CI). Sin línea base
+# también termina con código 1, salvo que se pase --sin-linea-base-ok. Si la línea base se
+# midió en otro entorno (CAMPOS_ENTORNO: CPU, Python, pandas, ...) no se compara y se avisa.
+#
+# Uso (desde la raíz del proyecto):
+#   python scripts/benchmark.py --guardar-linea-base   # crea la línea base (benchmarks/linea_base.json)
+#   python scripts/benchmark.py                        # compara contra ella
+
+LINEA_BASE = RAIZ / "benchmarks" / "linea_base.json"
+DIRECTORIO_RESULTADOS = RAIZ / "benchmarks" / "resultados"
+
+ESCALAS = [0.01, 0.03, 0.1]
+
+# Una etapa se marca como regresión si empeora más que UMBRAL (relativo) y además más que
+# el mínimo absoluto, para que el ruido en etapas de milisegundos no haga fallar la corrida
+UMBRAL = 0.25
+MINIMO_SEGUNDOS = 0.05
+MINIMO_MB = 25.0
+
+# Campos de 'entorno' que deben coincidir con la línea base para que la comparación tenga
+# sentido: en otra máquina o con otras versiones los tiempos y la memoria no son comparables
+CAMPOS_ENTORNO = ("python", "procesador", "cpus", "pandas", "numpy", "sklearn")
+
+# Columnas que clean_EDA.py lleva de silver a gold
+COLUMNAS_PREVIOUS_GOLD = [
+    'SK_ID_CURR', 'SK_ID_PREV', 'NAME_CONTRACT_TYPE', 'AMT_ANNUITY', 'AMT_APPLICATION', 'AMT_CREDIT',
+    'WEEKDAY_APPR_PROCESS_START', 'NAME_CONTRACT_STATUS', 'NAME_CLIENT_TYPE', 'CHANNEL_TYPE'
+]
+COLUMNAS_PREVIOUS_MODELO = ['SK_ID_CURR', 'SK_ID_PREV', 'NAME_CONTRACT_TYPE', 'AMT_APPLICATION', 'AMT_CREDIT', 'NAME_CLIENT_TYPE']
+COLUMNAS_POS_GOLD = ['SK_ID_PREV', 'SK_ID_CURR', 'MONTHS_BALANCE', 'CNT_INSTALMENT', 'CNT_INSTALMENT_FUTURE']
+COLUMNAS_BUREAU_GOLD = ['SK_ID_CURR', 'SK_ID_PREV', 'CREDIT_TYPE', 'CREDIT_ACTIVE']
+
+
+def _reiniciar_pico_rss():
+    """En Linux reinicia el pico de RSS del proceso (VmHWM) para medirlo por etapa."""
+    try:
+        with open("/proc/self/clear_refs", "w") as archivo:
+            archivo.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _pico_rss_mb():
+    """
+    Pico de RSS del proceso en MB: VmHWM en Linux, ru_maxrss en otros Unix (sin reinicio,
+    es el pico desde que arrancó el proceso) y el pico del working set en Windows.
+    """
+    try:
+        with open("/proc/self/status") as archivo:
+            for linea in archivo:
+                if linea.startswith("VmHWM:"):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico / 1024**2 if sys.platform == "darwin" else pico / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / 1024**2
+    except (ImportError, AttributeError):
+        return None
+
+
+def medir_etapa(mediciones, nombre, filas, funcion, *args, detalle=False):
+    """
+    Ejecuta 'funcion(*args)' y guarda en 'mediciones[nombre]' su tiempo de pared, tiempo
+    de CPU, pico de RSS y filas de entrada por segundo. Salvo con 'detalle', se descarta
+    lo que la etapa imprime.
+
+    Retorno: el resultado de la función.
+    """
+    gc.collect()
+    pico_por_etapa = _reiniciar_pico_rss()
+    salida = contextlib.nullcontext() if detalle else contextlib.redirect_stdout(io.StringIO())
+    inicio_pared, inicio_cpu = time.perf_counter(), time.process_time()
+    with salida:
+        resultado = funcion(*args)
+    segundos = time.perf_counter() - inicio_pared
+    cpu_segundos = time.process_time() - inicio_cpu
+
+    mediciones[nombre] = {
+        "segundos": segundos,
+        "cpu_segundos": cpu_segundos,
+        "pico_rss_mb": _pico_rss_mb(),
+        "pico_por_etapa": pico_por_etapa,
+        "filas": int(filas),
+        "filas_por_segundo": filas / segundos if segundos > 0 else None,
+    }
+    print(f"   {nombre:<32} {segundos:8.2f} s  {cpu_segundos:8.2f} s CPU  {mediciones[nombre]['pico_rss_mb'] or 0:8.0f} MB  {filas:>12,} filas")
+    return resultado
+
+
+def cargar_bronze(directorio):
+    """
+    Lee las tablas sintéticas (Parquet) como las entrega bronze a clean_EDA.py.
+
+    Retorno: diccionario nombre de tabla → DataFrame.
+    """
+    return {
+        ruta.stem: pd.read_parquet(ruta)
+        for ruta in sorted(Path(directorio).glob("*.parquet"))
+    }
+
+
+def etiquetar_clusters(df, excluir=()):
+    """
+    Asigna TARGET igual que notebooks/analysis_model.ipynb: las categorías con menos del
+    1 % de las filas se agrupan en 'Less common', se codifican con dummies, se escala y
+    se toma el clúster de KMeans(n_clusters=3) como clase de riesgo.
+
+    Retorno: copia de 'df' con la columna TARGET.
+    """
+    X = df.drop(columns=list(excluir))
+    categoricas = X.select_dtypes(include=["object", "string"]).columns
+    umbral = len(X) * 0.01
+    for columna in categoricas:
+        frecuencias = X[columna].value_counts()
+        X[columna] = X[columna].replace(frecuencias[frecuencias < umbral].index.tolist(), 'Less common')
+    X = pd.get_dummies(X, columns=categoricas).astype(float).fillna(0)
+    kmeans = KMeans(n_clusters=3, random_state=42)
+    return df.assign(TARGET=kmeans.fit_predict(StandardScaler().fit_transform(X)))
+
+
+def puntuar_lote(entrenamiento, X, enteros=False):
+    """
+    Clasifica todas las filas de 'X' con un modelo entrenado: dummies alineados con las
+    columnas del entrenamiento, el mismo escalado y predict.
+
+    Retorno: np.ndarray con la clase predicha de cada fila.
+    """
+    categoricas = X.select_dtypes(include=["object", "string"]).columns
+    X_codificado = pd.get_dummies(X, columns=categoricas).reindex(columns=entrenamiento["columnas"], fill_value=0)
+    if enteros:
+        X_codificado = X_codificado.astype(int)
+    return entrenamiento["modelo"].predict(entrenamiento["scaler"].transform(X_codificado))
+
+
+def ejecutar_pipeline(bronze, directorio_artefactos, detalle=False):
+    """
+    Corre una vez todas las etapas del pipeline sobre las tablas bronze en memoria.
+
+    Retorno: diccionario etapa → mediciones, en el orden de ejecución.
+    """
+    m = {}
+
+    # --- bronze → silver (clean_EDA.py) ---
+    app_train = medir_etapa(m, "silver_application_train", len(bronze["application_train"]),
+                            fn.clean_application_train, bronze["application_train"], detalle=detalle)
+    credit_card = medir_etapa(m, "silver_credit_card_balance", len(bronze["credit_card_balance"]),
+                              fn.clean_credit_card_balance, bronze["credit_card_balance"], detalle=detalle)
+    installments = medir_etapa(m, "silver_installments_payments", len(bronze["installments_payments"]),
+                               fn.clean_installments_payments, bronze["installments_payments"], detalle=detalle)
+    bureau = medir_etapa(m, "silver_bureau", len(bronze["bureau"]),
+                         fn.clean_bureau, bronze["bureau"], detalle=detalle)
+    # previous_application y pos_cash_balance pasan a silver sin cambios
+    previous, pos = bronze["previous_application"], bronze["POS_CASH_balance"]
+
+    # --- silver → gold ---
+    medir_etapa(m, "gold_active_customer_profile", len(installments) + len(credit_card),
+                fn.create_active_customer_gold_table, installments, credit_card, detalle=detalle)
+
+    def gold_risk_level_data():
+        df = fn.create_risk_level_data(app_train)
+        fn.create_profile_tables(df)
+        return df
+    risk_level_data = medir_etapa(m, "gold_risk_level_data", len(app_train), gold_risk_level_data, detalle=detalle)
+
+    def gold_previous_application():
+        df = previous[COLUMNAS_PREVIOUS_GOLD]
+        fn.create_previous_application_cube(df)
+        return df
+    medir_etapa(m, "gold_previous_application", len(previous), gold_previous_application, detalle=detalle)
+
+    def gold_pos_cash_balance():
+        df = pos[COLUMNAS_POS_GOLD]
+        checksum = fn.create_manifest_row(df, 'pos_cash_balance_gold')['CHECKSUM']
+        fn.save_pos_trajectories(df, directorio_artefactos / "pos_trayectorias", checksum)
+        return df
+    pos_gold = medir_etapa(m, "gold_pos_cash_balance", len(pos), gold_pos_cash_balance, detalle=detalle)
+
+    def gold_bureau():
+        df = bureau[COLUMNAS_BUREAU_GOLD].copy()
+        fn.create_bureau_summary_tables(df)
+        return df
+    bureau_gold = medir_etapa(m, "gold_bureau", len(bureau), gold_bureau, detalle=detalle)
+
+    model_gold_id = medir_etapa(
+        m, "gold_model_gold_id",
+        len(installments) + len(credit_card) + len(previous) + len(pos_gold) + len(bureau_gold),
+        fn.create_final_ml_gold_table, installments, credit_card, previous[COLUMNAS_PREVIOUS_MODELO],
+        pos_gold[['SK_ID_CURR', 'SK_ID_PREV', 'CNT_INSTALMENT_FUTURE']], bureau_gold,
+        detalle=detalle,
+    )
+
+    # --- entrenamiento (model/model_risk.py y model/model.py) ---
+    risk_level_data = medir_etapa(m, "target_risk_level_data", len(risk_level_data),
+                                  etiquetar_clusters, risk_level_data, detalle=detalle)
+    model_gold_id = medir_etapa(m, "target_model_gold_id", len(model_gold_id),
+                                etiquetar_clusters, model_gold_id, ['SK_ID_CURR'], detalle=detalle)
+    modelo_riesgo = medir_etapa(m, "entrenamiento_modelo_riesgo", len(risk_level_data),
+                                entrenar_modelo_riesgo, risk_level_data, detalle=detalle)
+    modelo_id = medir_etapa(m, "entrenamiento_modelo_id", len(model_gold_id),
+                            entrenar_modelo_id, model_gold_id, detalle=detalle)
+
+    # --- puntuación por lotes de todas las filas ---
+    medir_etapa(m, "puntuacion_modelo_riesgo", len(risk_level_data),
+                puntuar_lote, modelo_riesgo, risk_level_data.drop(columns="TARGET"), detalle=detalle)
+    medir_etapa(m, "puntuacion_modelo_id", len(model_gold_id),
+                puntuar_lote, modelo_id, model_gold_id.drop(columns=['SK_ID_CURR', 'TARGET']), True, detalle=detalle)
+    return m
+
+
+def medir_escala(escala, semilla, repeticiones, detalle=False):
+    """
+    Genera los datos sintéticos de una escala y corre el pipeline 'repeticiones' veces;
+    de cada etapa se conserva la mejor (mínima) medición de cada métrica.
+
+    Retorno: diccionario con las filas bronze por tabla y las mediciones por etapa.
+    """
+    with tempfile.TemporaryDirectory(prefix="benchmark_") as temporal:
+        temporal = Path(temporal)
+        print(f"\n=== Escala {escala} ===")
+        with contextlib.redirect_stdout(io.StringIO()):
+            filas_bronze = generar_datos(temporal / "bronze", escala, semilla, "parquet")
+        bronze = cargar_bronze(temporal / "bronze")
+
+        corridas = []
+        for repeticion in range(repeticiones):
+            if repeticiones > 1:
+                print(f"-- Repetición {repeticion + 1} de {repeticiones}")
+            corridas.append(ejecutar_pipeline(bronze, temporal / "gold_artifacts", detalle))
+
+    etapas = {}
+    for etapa, primera in corridas[0].items():
+        medidas = [corrida[etapa] for corrida in corridas]
+        etapas[etapa] = dict(primera)
+        for metrica in ("segundos", "cpu_segundos", "pico_rss_mb"):
+            valores = [medida[metrica] for medida in medidas if medida[metrica] is not None]
+            etapas[etapa][metrica] = min(valores) if valores else None
+        etapas[etapa]["filas_por_segundo"] = primera["filas"] / etapas[etapa]["segundos"] if etapas[etapa]["segundos"] else None
+    return {"filas_bronze": filas_bronze, "etapas": etapas}
+
+
+def _procesador():
+    """Modelo de CPU (de /proc/cpuinfo en Linux) o, si no está disponible, el de platform."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for linea in f:
+                if linea.startswith("model name"):
+                    return linea.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def diferencias_de_entorno(resultados, linea_base):
+    """
+    Campos de CAMPOS_ENTORNO en los que la corrida actual y la línea base difieren.
+
+    Retorno: diccionario {campo: (valor en la línea base, valor actual)}.
+    """
+    actual, base = resultados.get("entorno", {}), linea_base.get("entorno", {})
+    return {campo: (base.get(campo), actual.get(campo)) for campo in CAMPOS_ENTORNO if base.get(campo) != actual.get(campo)}
+
+
+def comparar_con_linea_base(resultados, linea_base, umbral=UMBRAL, minimo_segundos=MINIMO_SEGUNDOS, minimo_mb=MINIMO_MB):
+    """
+    Compara tiempo de pared y pico de RSS de cada etapa y escala presentes en ambas
+    corridas. Hay regresión si el valor actual supera al de la línea base en más de
+    'umbral' (relativo) y en más del mínimo absoluto de la métrica.
+
+    Retorno: lista de regresiones (diccionarios con escala, etapa, métrica, base y actual).
+    """
+    regresiones = []
+    for escala, actual_escala in resultados["escalas"].items():
+        base_escala = linea_base.get("escalas", {}).get(escala)
+        if base_escala is None:
+            print(f"Aviso: la línea base no tiene la escala {escala}; no se compara.")
+            continue
+        for etapa, actual in actual_escala["etapas"].items():
+            base = base_escala["etapas"].get(etapa)
+            if base is None:
+                continue
+            for metrica, minimo in (("segundos", minimo_segundos), ("pico_rss_mb", minimo_mb)):
+                if actual.get(metrica) is None or base.get(metrica) is None:
+                    continue
+                if actual[metrica] > base[metrica] * (1 + umbral) and actual[metrica] - base[metrica] > minimo:
+                    regresiones.append({
+                        "escala": escala, "etapa": etapa, "metrica": metrica,
+                        "base": base[metrica], "actual": actual[metrica],
+                    })
+    return regresiones
+
+
+def _escala(valor):
+    escala = float(valor)
+    if not ESCALA_MIN <= escala <= ESCALA_MAX:
+        raise argparse.ArgumentTypeError(f"debe estar entre {ESCALA_MIN} y {ESCALA_MAX}")
+    return escala
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de punta a punta del pipeline sobre datos sintéticos.")
+    parser.add_argument("--escalas", type=_escala, nargs="+", default=ESCALAS, help="escalas de los datos sintéticos")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--repeticiones", type=int, default=1, help="corridas por escala; se toma la mejor de cada etapa")
+    parser.add_argument("--linea-base", type=Path, default=LINEA_BASE, help="JSON de referencia para comparar")
+    parser.add_argument("--guardar-linea-base", action="store_true", help="guarda esta corrida como línea base y no compara")
+    parser.add_argument("--sin-linea-base-ok", action="store_true", help="no falla si no existe la línea base")
+    parser.add_argument("--umbral", type=float, default=UMBRAL, help="empeoramiento relativo tolerado (0.25 = 25 %%)")
+    parser.add_argument("--minimo-segundos", type=float, default=MINIMO_SEGUNDOS)
+    parser.add_argument("--minimo-mb", type=float, default=MINIMO_MB)
+    parser.add_argument("--salida", type=Path, default=None, help="JSON de resultados (por defecto en benchmarks/resultados/)")
+    parser.add_argument("--detalle", action="store_true", help="muestra lo que imprime cada etapa")
+    args = parser.parse_args()
+
+    fecha = pd.Timestamp.now()
+    resultados = {
+        "fecha": fecha.isoformat(),
+        "semilla": args.semilla,
+        "repeticiones": args.repeticiones,
+        "entorno": {
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "procesador": _procesador(),
+            "cpus": os.cpu_count(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "sklearn": sklearn.__version__,
+        },
+        "escalas": {
+            str(escala): medir_escala(escala, args.semilla, args.repeticiones, args.detalle)
+            for escala in args.escalas
+        },
+    }
+
+    salida = args.salida or DIRECTORIO_RESULTADOS / f"benchmark_{fecha:%Y%m%d_%H%M%S}.json"
+    salida.parent.mkdir(parents=True, exist_ok=True)
+    salida.write_text(json.dumps(resultados, indent=2))
+    print(f"\nResultados guardados en '{salida}'.")
+
+    if args.guardar_linea_base:
+        args.linea_base.parent.mkdir(parents=True, exist_ok=True)
+        args.linea_base.write_text(json.dumps(resultados, indent=2))
+        print(f"Línea base guardada en '{args.linea_base}'.")
+        sys.exit(0)
+
+    if not args.linea_base.exists():
+        print(f"No hay línea base en '{args.linea_base}'; ejecuta con --guardar-linea-base para crearla.")
+        sys.exit(0 if args.sin_linea_base_ok else 1)
+
+    linea_base = json.loads(args.linea_base.read_text())
+    diferencias = diferencias_de_entorno(resultados, linea_base)
+    if diferencias:
+        print("\nAviso: la línea base se midió en otro entorno; no se compara:")
+        for campo, (base, actual) in diferencias.items():
+            print(f"   {campo:<12} línea base {base!s:<32} actual {actual}")
+        print("Ejecuta con --guardar-linea-base en esta máquina para usarla como control.")
+        sys.exit(0)
+
+    regresiones = comparar_con_linea_base(
+        resultados, linea_base, args.umbral, args.minimo_segundos, args.minimo_mb,
+    )
+    if regresiones:
+        print(f"\n{len(regresiones)} regresión(es) respecto a la línea base (umbral {args.umbral:.0%}):")
+        for r in regresiones:
+            print(f"   escala {r['escala']:<6} {r['etapa']:<32} {r['metrica']:<12} {r['base']:10.2f} → {r['actual']:10.2f} ({r['actual'] / r['base'] - 1:+.0%})")
+        sys.exit(1)
+    print("Sin regresiones respecto a la línea base.")
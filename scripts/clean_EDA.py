@@ -1,4 +1,3 @@
-from sqlalchemy import create_engine
 from sqlalchemy import select
 from sqlalchemy import text
 from sqlalchemy import text
@@ -8,11 +7,13 @@ import matplotlib.pyplot as plt
 import sys
 sys.path.append('..')
 from scripts.function import *
+from scripts.engines import crear_engine
 import seaborn as sns
 from collections import defaultdict
 
 # Define tus credenciales locales aquí.
 # Asegúrate de que las bases de datos 'bronze', 'silver', y 'gold' existan en tu MySQL con el proceso dado en data, y load to sql.
+# Sin servidor MySQL, define HOME_CREDIT_DB=duckdb (o sqlite) y carga bronze con scripts/engines.py.
 DB_USER = "root"
 DB_PASS = "Tu_contraseña" # Reemplaza con tu contraseña
 DB_HOST = "localhost"
@@ -20,9 +21,9 @@ DB_PORT = "3306"
 
 # Motores para cada capa
 try:
-    engine_bronze = create_engine(f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/bronze")
-    engine_silver = create_engine(f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/silver")
-    engine_gold = create_engine(f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/gold")
+    engine_bronze = crear_engine("bronze", DB_USER, DB_PASS, DB_HOST, DB_PORT)
+    engine_silver = crear_engine("silver", DB_USER, DB_PASS, DB_HOST, DB_PORT)
+    engine_gold = crear_engine("gold", DB_USER, DB_PASS, DB_HOST, DB_PORT)
     print("Motores de base de datos configurados correctamente.")
 except Exception as e:  
     print(f"Error al configurar los motores de base de datos: {e}")
@@ -31,14 +32,7 @@ except Exception as e:
 # Limpieza y EDA de application_train
 
 df_train= pd.read_sql("select * from application_train", engine_bronze)
-df_train["NAME_TYPE_SUITE"].replace("", "Unaccompanied", inplace=True)
-df_train["OCCUPATION_TYPE"].replace("", "Others", inplace=True)
-variables=["FONDKAPREMONT_MODE","HOUSETYPE_MODE","WALLSMATERIAL_MODE","EMERGENCYSTATE_MODE"]
-for variable in variables:
-    df_train[variable].replace("", "not specified", inplace=True)
-df_train.DAYS_BIRTH=(df_train.DAYS_BIRTH / 365).astype(np.int64)
-df_train.rename(columns={'DAYS_BIRTH': 'YEARS_BIRTH'}, inplace=True)
-df_train.DAYS_EMPLOYED.replace({365243:0},inplace=True)
+df_train = clean_application_train(df_train)
 
 # Subir limpieza a silver
 try:
@@ -52,35 +46,19 @@ except Exception as e:
 
 df_credit_data = pd.read_sql("select * from credit_card_balance", engine_bronze)
 df_installments = pd.read_sql("select * from installments_payments", engine_bronze)
-columnas_float = df_credit_data.select_dtypes(include=['float64']).columns
-# Redondear todas las columnas float64 a 2 decimales
-df_credit_data[columnas_float] = df_credit_data[columnas_float].round(2)
-df_credit_data.drop(columns=['AMT_DRAWINGS_CURRENT', 'CNT_DRAWINGS_CURRENT', 'AMT_DRAWINGS_OTHER_CURRENT', 'SK_DPD_DEF'], inplace=True)
-df_credit_data = df_credit_data.rename(columns={'AMT_RECIVABLE': 'AMT_RECEIVABLE'})
-obtener_conteo_clientes_unicos(engine_bronze)
-# Clientes con saldo a favor
-clientes_saldo_a_favor(engine_bronze)
-# Clientes con deuda pendiente
-clientes_con_deuda(engine_bronze)
-# Casos con pagos atrasados
-casos_pagos_atrasados(engine_bronze)
-# Casos con cargos adicionales
-casos_cargos_adicionales(engine_bronze)
-# Análisis por estado de contrato
-analizar_estado_contrato(engine_bronze)
-# Análisis de perfil de clientes - TODOS los clientes
-analizar_perfil_clientes(engine_bronze)
-df_installments[['AMT_INSTALMENT', 'AMT_PAYMENT']] = df_installments[['AMT_INSTALMENT', 'AMT_PAYMENT']].round(2)
-# Convertir las columnas float64 a int
-cols_to_convert = ['NUM_INSTALMENT_VERSION', 'DAYS_INSTALMENT', 'DAYS_ENTRY_PAYMENT']
-# Asegúrate de que no hay valores nulos
-df_installments[cols_to_convert] = df_installments[cols_to_convert].fillna(0).astype(int)
-# Total de pagos realizados y promedio por cliente
-obtener_pagos_por_cliente(engine_bronze)
-# Pagos atrasados: diferencia entre DAYS_ENTRY_PAYMENT y DAYS_INSTALMENT
-obtener_resumen_atrasos(engine_bronze)
-# Distribución de pagos incompletos
-obtener_distribucion_incompletos(engine_bronze)
+df_credit_data = clean_credit_card_balance(df_credit_data)
+df_installments = clean_installments_payments(df_installments)
+# Reportes de EDA en paralelo, un solo recorrido por tabla; si las tablas de bronze no
+# cambiaron desde la última ejecución se leen de la caché en ../data/eda_cache
+# - credit_card_balance: conteo de clientes, saldo a favor, deuda, pagos atrasados,
+#   cargos adicionales, estado de contrato y perfil de clientes
+# - installments_payments: pagos por cliente, atrasos/adelantos y pagos incompletos
+reportes_eda = ejecutar_reportes_eda(engine_bronze, '../data/eda_cache')
+for nombre, reporte in reportes_eda.items():
+    if reporte is None:
+        print(f"-> Reporte de EDA '{nombre}' no disponible (la consulta falló).")
+        continue
+    print(reporte.resumen())
 # Guardar los DataFrames procesados en la base de datos 'bronze' en el esquema 'silver'
 try:
     df_credit_data.to_sql("credit_card_balance", engine_silver, if_exists='replace', index=False)
@@ -92,7 +70,7 @@ except Exception as e:
 # Limpieza y EDA de previous_application y pos_cash_balance
 df_POS = pd.read_sql_table("pos_cash_balance", engine_bronze)
 df_previous = pd.read_sql_table("previous_application", engine_bronze)
-with engine_bronze.connect() as conn:
+with engine_bronze.begin() as conn:
     conn.execute(text('ALTER TABLE previous_application MODIFY COLUMN AMT_DOWN_PAYMENT FLOAT;'))
 
 #Reemplazamos los valores vacíos en RATE_DOWN_PAYMENT por 0.0
@@ -104,7 +82,7 @@ with engine_bronze.begin() as conn:
             WHERE RATE_DOWN_PAYMENT = '';
         """)
     )
-with engine_bronze.connect() as conn:
+with engine_bronze.begin() as conn:
     conn.execute(text('ALTER TABLE previous_application MODIFY COLUMN RATE_DOWN_PAYMENT FLOAT;'))
 #Reemplazamos los valores vacíos en RATE_INTEREST_PRIMARY por 0.0
 with engine_bronze.begin() as conn:
@@ -125,16 +103,16 @@ with engine_bronze.begin() as conn:
         """)
     )
 #Modificamos el tipo de dato de RATE_INTEREST_PRIMARY y RATE_INTEREST_PRIVILEGED a FLOAT
-with engine_bronze.connect() as conn:
+with engine_bronze.begin() as conn:
     conn.execute(text('ALTER TABLE previous_application MODIFY COLUMN RATE_INTEREST_PRIMARY FLOAT;'))
-with engine_bronze.connect() as conn:
+with engine_bronze.begin() as conn:
     conn.execute(text('ALTER TABLE previous_application MODIFY COLUMN RATE_INTEREST_PRIVILEGED FLOAT;'))
 #Reemplazamos los valores vacíos en NAME_TYPE_SUITE por "Unaccompanied"
 with engine_bronze.begin() as conn:
     conn.execute(
         text("""
             UPDATE previous_application
-            SET NAME_TYPE_SUITE = "Unnancompanied"
+            SET NAME_TYPE_SUITE = 'Unnancompanied'
             WHERE NAME_TYPE_SUITE = '';
         """)
     )
@@ -143,7 +121,7 @@ with engine_bronze.begin() as conn:
     conn.execute(
         text("""
             UPDATE previous_application
-            SET PRODUCT_COMBINATION = "Cash"
+            SET PRODUCT_COMBINATION = 'Cash'
             WHERE PRODUCT_COMBINATION = '';
         """)
     )
@@ -156,7 +134,7 @@ with engine_bronze.begin() as conn:
         """)
     )
 #Modificamos el tipo de dato de DAYS_FIRST_DRAWING a FLOAT
-with engine_bronze.connect() as conn:
+with engine_bronze.begin() as conn:
     conn.execute(text('ALTER TABLE previous_application MODIFY COLUMN DAYS_FIRST_DRAWING FLOAT;'))
 #Reemplazamos los valores vacíos en DAYS_FIRST_DUE por 0.0. En este caso no se usa la cláusula WHERE porque se quiere actualizar todos los valores de la columna.
 with engine_bronze.begin() as conn:
@@ -167,7 +145,7 @@ with engine_bronze.begin() as conn:
         """)
     )
 #Modificamos el tipo de dato de DAYS_FIRST_DUE a FLOAT
-with engine_bronze.connect() as conn:
+with engine_bronze.begin() as conn:
     conn.execute(text('ALTER TABLE previous_application MODIFY COLUMN DAYS_FIRST_DUE FLOAT;'))
 #Reemplazamos los valores vacíos en DAYS_LAST_DUE_1ST_VERSION por 0.0. En este caso no se usa la cláusula WHERE porque se quiere actualizar todos los valores de la columna.
 with engine_bronze.begin() as conn:
@@ -194,13 +172,13 @@ with engine_bronze.begin() as conn:
         """)
     )
 #Modificamos el tipo de dato de DAYS_LAST_DUE_1ST_VERSION a FLOAT
-with engine_bronze.connect() as conn:
+with engine_bronze.begin() as conn:
     conn.execute(text('ALTER TABLE previous_application MODIFY COLUMN DAYS_LAST_DUE_1ST_VERSION FLOAT;'))
 #Modificamos el tipo de dato de DAYS_LAST_DUE a FLOAT
-with engine_bronze.connect() as conn:
+with engine_bronze.begin() as conn:
     conn.execute(text('ALTER TABLE previous_application MODIFY COLUMN DAYS_LAST_DUE FLOAT;'))
 #Modificamos el tipo de dato de DAYS_FIRST_DUE a FLOAT
-with engine_bronze.connect() as conn:
+with engine_bronze.begin() as conn:
     conn.execute(text('ALTER TABLE previous_application MODIFY COLUMN DAYS_TERMINATION FLOAT;'))
 #Reemplazamos los valores vacíos en NFLAG_INSURED_ON_APPROVAL por 0.0. En este caso no se usa la cláusula WHERE porque se quiere actualizar todos los valores de la columna.
 with engine_bronze.begin() as conn:
@@ -211,7 +189,7 @@ with engine_bronze.begin() as conn:
         """)
     )
 #Modificamos el tipo de dato de NFLAG_INSURED_ON_APPROVAL a FLOAT
-with engine_bronze.connect() as conn:
+with engine_bronze.begin() as conn:
     conn.execute(text('ALTER TABLE previous_application MODIFY COLUMN NFLAG_INSURED_ON_APPROVAL FLOAT;'))
 
 try:
@@ -223,62 +201,7 @@ except Exception as e:
 
 # Limpieza y EDA de bureau y bureau_balance
 df_bureau = pd.read_sql("select * from bureau", engine_bronze)
-df_bureau['CREDIT_ACTIVE'] = df_bureau['CREDIT_ACTIVE'].astype('category')
-df_bureau['CREDIT_CURRENCY'] = df_bureau['CREDIT_CURRENCY'].astype('category')
-df_bureau['CREDIT_TYPE'] = df_bureau['CREDIT_TYPE'].astype('category')
-
-# Convertir columnas numéricas que están como object a float
-float_cols = [
-    'DAYS_CREDIT_ENDDATE',
-    'DAYS_ENDDATE_FACT',
-    'AMT_CREDIT_MAX_OVERDUE',
-    'AMT_CREDIT_SUM_DEBT',
-    'AMT_CREDIT_SUM_LIMIT',
-    'AMT_ANNUITY'
-]
-
-for col in float_cols:
-    df_bureau[col] = pd.to_numeric(df_bureau[col], errors='coerce')
-
-#  ELIMINAR DUPLICADOS
-df_bureau = df_bureau.drop_duplicates()
-
-# ELIMINAR COLUMNAS CON >40% NULOS
-umbral_nulos = 0.4
-df_bureau = df_bureau.loc[:, df_bureau.isnull().mean() < umbral_nulos]
-
-#  RELLENO DE NULOS
-
-# Numéricas → Mediana
-num_cols = df_bureau.select_dtypes(include=[np.number]).columns
-df_bureau[num_cols] = df_bureau[num_cols].fillna(df_bureau[num_cols].median())
-
-# Categóricas → Moda
-cat_cols = df_bureau.select_dtypes(include='category').columns
-for col in cat_cols:
-    df_bureau[col] = df_bureau[col].fillna(df_bureau[col].mode()[0])
-
-def remove_outliers_iqr(df, col):
-    Q1 = df[col].quantile(0.25)
-    Q3 = df[col].quantile(0.75)
-    IQR = Q3 - Q1
-    return df[(df[col] >= Q1 - 1.5*IQR) & (df[col] <= Q3 + 1.5*IQR)]
-
-cols_outliers = ['CREDIT_DAY_OVERDUE', 'AMT_CREDIT_SUM', 'AMT_CREDIT_SUM_DEBT', 'AMT_CREDIT_SUM_OVERDUE']
-for col in cols_outliers:
-    if col in df_bureau.columns:
-        df_bureau = remove_outliers_iqr(df_bureau, col)
-
-columnas_a_eliminar = ['AMT_CREDIT_SUM_OVERDUE', 'AMT_CREDIT_SUM_DEBT', 'CREDIT_DAY_OVERDUE']
-
-# Elimina solo las que existen
-columnas_existentes = [col for col in columnas_a_eliminar if col in df_bureau.columns]
-
-# Aplica el drop
-df_bureau.drop(columns=columnas_existentes, inplace=True)
-
-df_bureau = df_bureau.rename(columns={"SK_ID_CURR" : "SK_ID_PREV"})
-df_bureau = df_bureau.rename(columns={"SK_ID_BUREAU" : "SK_ID_CURR"})
+df_bureau = clean_bureau(df_bureau)
 
 try:
     df_bureau.to_sql('bureau', con=engine_silver, if_exists="replace", index=False)
@@ -301,12 +224,6 @@ sns.heatmap(matriz_correlacion, annot=True, cmap='coolwarm', fmt=".2f", linewidt
 plt.title('Matriz de Correlación - Variables Numéricas')
 plt.show()
 
-# Elimina solo las que existen
-columnas_existentes = [col for col in columnas_a_eliminar if col in df_bureau.columns]
-
-# Aplica el drop
-df_bureau.drop(columns=columnas_existentes, inplace=True)
-
 # Tabla informativa de las variables
 info_tabla = pd.DataFrame({
     'Tipo de Dato': df_bureau.dtypes,
@@ -482,7 +399,7 @@ def simplificar_status(valor):
 chunk['STATUS_SIMPLIFICADO'] = chunk['STATUS'].apply(simplificar_status)
 
 chunk_size = 10_000
-query = "SELECT SK_ID_BUREAU, MONTHS_BALANCE, STATUS FROM bureau_balance"
+query = "SELECT MONTHS_BALANCE, STATUS FROM bureau_balance"
 
 status_por_mes = []
 
@@ -509,18 +426,16 @@ plt.show()
 
 # -- crear tablas GOLD con los resultados finales
 
-try:
-    print("Loading raw data from Silver layer...")
-    df_installments = pd.read_sql("SELECT * FROM installments_payments", engine_silver)
-    df_credit_balance = pd.read_sql("SELECT * FROM credit_card_balance", engine_silver)
-except Exception as e:
-    print(f"Error loading data from Silver layer: {e}")
-    raise
+# Cada tabla gold que se guarda agrega su fila al manifiesto de esta construcción
+BUILD_ID = pd.Timestamp.now().strftime('%Y%m%d%H%M%S')
+manifiesto_gold = []
 
-df_gold_final = create_active_customer_gold_table(df_inst=df_installments, df_balance=df_credit_balance)
+# Las agregaciones por cliente de cuotas y tarjetas se ejecutan dentro de la base de datos
+# (INSERT ... SELECT ... GROUP BY); solo se lee la tabla resultante para el manifiesto.
+# scripts/paridad_gold_sql.py la compara con la versión en pandas.
 try:
-    print("Saving processed data to Gold layer...")
-    df_gold_final.to_sql('gold_active_customer_profile', engine_gold, if_exists='replace', index=False)
+    df_gold_final = create_active_customer_gold_table_sql(engine_gold, schema_silver="silver")
+    manifiesto_gold.append(create_manifest_row(df_gold_final, 'gold_active_customer_profile'))
     print("Data saved successfully to Gold layer.")
     print("\nSample of the final Gold table:")
     print(df_gold_final.head().to_string())
@@ -530,23 +445,12 @@ except Exception as e:
 
 df=pd.read_sql_query("SELECT*FROM silver.application_train",engine_silver)
 
-features = [
-    "FLAG_OWN_CAR",
-    "FLAG_OWN_REALTY",
-    "CNT_CHILDREN",
-    "AMT_INCOME_TOTAL",
-    "AMT_CREDIT",
-    "NAME_INCOME_TYPE",
-    "NAME_EDUCATION_TYPE",
-    "NAME_FAMILY_STATUS",
-    "NAME_HOUSING_TYPE",
-    "YEARS_BIRTH",
-    "DAYS_EMPLOYED",
-    "OWN_CAR_AGE",
-    "OCCUPATION_TYPE",
-]
-df=df[features]
-df.to_sql("risk_level_data",engine_gold,if_exists="replace",index=False)
+df = create_risk_level_data(df)
+save_gold_table(df, "risk_level_data", engine_gold, manifiesto_gold)
+
+# Perfil (boxplots, valores atípicos y frecuencias) que lee el dashboard
+for sufijo, df_perfil in create_profile_tables(df).items():
+    save_gold_table(df_perfil, f"risk_level_data_{sufijo}", engine_gold, manifiesto_gold)
 
 #Columnas para gold
 df_previous = pd.read_sql("previous_application_silver",engine_silver)
@@ -569,12 +473,24 @@ df_previous_gold
 df_POS = pd.read_sql("pos_cash_balance_silver", engine_silver)
 df_POS_gold = df_POS[['SK_ID_PREV', 'SK_ID_CURR', 'MONTHS_BALANCE', 'CNT_INSTALMENT', 'CNT_INSTALMENT_FUTURE']]
 
-df_previous_gold.to_sql('previous_application_gold', engine_gold, if_exists='replace', index=False)
-df_POS_gold.to_sql('pos_cash_balance_gold', engine_gold, if_exists='replace', index=False)
+save_gold_table(df_previous_gold, 'previous_application_gold', engine_gold, manifiesto_gold)
+for nombre_tabla, df_cubo in create_previous_application_cube(df_previous_gold).items():
+    save_gold_table(df_cubo, nombre_tabla, engine_gold, manifiesto_gold)
+save_gold_table(df_POS_gold, 'pos_cash_balance_gold', engine_gold, manifiesto_gold)
+
+# Trayectorias de cuotas por cliente para la pestaña de pago de cuotas del dashboard
+save_pos_trajectories(df_POS_gold, '../data/gold_artifacts/pos_trayectorias', manifiesto_gold[-1]['CHECKSUM'])
 
 df_bureau_gold = df_bureau[['SK_ID_CURR', 'SK_ID_PREV', 'CREDIT_TYPE', 'CREDIT_ACTIVE']].copy()
 
-df_bureau_gold.to_sql('bureau', con=engine_gold, if_exists="replace", index=False)
+save_gold_table(df_bureau_gold, 'bureau', engine_gold, manifiesto_gold)
+
+# Índice para la consulta por cliente del dashboard y tablas resumen con las distribuciones globales
+with engine_gold.begin() as conn:
+    conn.execute(text("CREATE INDEX idx_bureau_sk_id_curr ON bureau (SK_ID_CURR);"))
+
+for nombre_tabla, df_resumen_bureau in create_bureau_summary_tables(df_bureau_gold).items():
+    save_gold_table(df_resumen_bureau, nombre_tabla, engine_gold, manifiesto_gold)
 
 df_creditos = df_bureau[['SK_ID_CURR', 'CREDIT_TYPE', 'CREDIT_ACTIVE']]
 
@@ -611,9 +527,9 @@ df_bureau_gold_model = df_bureau_gold.copy()
 #tabla para gold
 df_model_gold = create_final_ml_gold_table(df_installments=df_installments, df_credit_card=df_credit_data, df_bureau_for_model=df_bureau_gold_model, df_pos=df_POS_gold_model, df_previous=df_previous_gold_model)
 
-df_model_gold.to_sql("model_gold_ID", engine_gold, if_exists="replace", index=False)
-
-
-
+save_gold_table(df_model_gold, "model_gold_id", engine_gold, manifiesto_gold)
 
+for sufijo, df_perfil in create_profile_tables(df_model_gold).items():
+    save_gold_table(df_perfil, f"model_gold_id_{sufijo}", engine_gold, manifiesto_gold)
 
+write_gold_manifest(manifiesto_gold, engine_gold, BUILD_ID)
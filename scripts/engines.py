@@ -0,0 +1,232 @@
+import argparse
+import os
+import re
+import sys
+import types
+from functools import partial
+from pathlib import Path
+
+import pandas as pd
+from sqlalchemy import create_engine, event, text
+
+# Fábrica de engines para las capas bronze, silver, gold y dashboard. El backend se elige
+# con la variable de entorno HOME_CREDIT_DB:
+#   mysql  (por defecto) un servidor MySQL con una base de datos por capa (shema/shema_db.sql).
+#   duckdb un único archivo data/db/home_credit.duckdb con un esquema por capa; requiere
+#          'duckdb' y 'duckdb-engine'. Solo un proceso a la vez puede abrir el archivo.
+#   sqlite un archivo por capa (data/db/<capa>.db); las demás capas se adjuntan con su
+#          nombre para que las consultas 'silver.tabla' funcionen desde cualquier engine.
+# La carpeta de los archivos se puede cambiar con HOME_CREDIT_DB_DIR.
+# Las sentencias propias de MySQL que usa el pipeline se traducen al vuelo (ver _adaptar_sql),
+# así las consultas de scripts/function.py y clean_EDA.py se ejecutan sin cambios.
+#
+# Cargar bronze en un backend embebido (los CSV de Kaggle o los de scripts/synthetic_data.py):
+#   HOME_CREDIT_DB=duckdb python scripts/engines.py --cargar-bronze data/synthetic
+
+VARIABLE_BACKEND = "HOME_CREDIT_DB"
+VARIABLE_DIRECTORIO = "HOME_CREDIT_DB_DIR"
+
+BACKENDS = ("mysql", "duckdb", "sqlite")
+CAPAS = ("bronze", "silver", "gold", "dashboard")
+
+DIRECTORIO_BD = Path(__file__).resolve().parent.parent / "data" / "db"
+ARCHIVO_DUCKDB = "home_credit.duckdb"
+
+# Filas por lote al cargar bronze desde archivos
+FILAS_POR_LOTE = 500_000
+
+_MODIFICAR_COLUMNA = re.compile(r"ALTER\s+TABLE\s+(\w+)\s+MODIFY\s+COLUMN\s+(\w+)\s+(\w+)\s*;?", re.I)
+# Literales y nombres entre comillas ('...', "..." o `...`, con comillas dobladas como escape)
+_ENTRE_COMILLAS = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|`(?:[^`]|``)*`)")
+
+
+def backend_actual():
+    """Backend configurado en HOME_CREDIT_DB (mysql si no está definida)."""
+    backend = os.environ.get(VARIABLE_BACKEND, "mysql").strip().lower()
+    if backend not in BACKENDS:
+        raise ValueError(f"{VARIABLE_BACKEND}={backend!r} no es válido; usa uno de {BACKENDS}.")
+    return backend
+
+
+def directorio_bd():
+    """Carpeta de los archivos de los backends embebidos (se crea si no existe)."""
+    directorio = Path(os.environ.get(VARIABLE_DIRECTORIO, DIRECTORIO_BD))
+    directorio.mkdir(parents=True, exist_ok=True)
+    return directorio
+
+
+def _adaptar_sql(backend, capa, conn, cursor, statement, parameters, context, executemany):
+    """
+    Traduce las sentencias de MySQL del pipeline al backend embebido:
+    - ALTER TABLE t MODIFY COLUMN c TIPO: en DuckDB cambia el tipo convirtiendo con
+      TRY_CAST (los textos vacíos quedan nulos); en SQLite, que no tiene tipos por
+      columna, no hace nada.
+    - En SQLite la capa propia del engine es 'main', así que 'capa.tabla' pasa a 'tabla'
+      (solo fuera de comillas: los literales y nombres entre comillas no se tocan).
+    """
+    if backend == "duckdb":
+        statement = _MODIFICAR_COLUMNA.sub(
+            r"ALTER TABLE \1 ALTER COLUMN \2 SET DATA TYPE \3 USING TRY_CAST(\2 AS \3)", statement)
+    else:
+        if _MODIFICAR_COLUMNA.search(statement):
+            statement = "SELECT 1"
+        prefijo = re.compile(rf"\b{capa}\.(?=\w)")
+        partes = _ENTRE_COMILLAS.split(statement)
+        # split con grupo de captura: las partes entre comillas quedan en las posiciones impares
+        statement = "".join(parte if i % 2 else prefijo.sub("", parte) for i, parte in enumerate(partes))
+    return statement, parameters
+
+
+def _tabla_en_capa(capa, dialecto, connection, table_name, schema=None, **kw):
+    """
+    has_table de DuckDB limitado al esquema de la capa: el de duckdb-engine ve las tablas de
+    todos los esquemas (y schema_translate_map no se aplica aquí), así que
+    to_sql(if_exists='replace') en silver intentaría borrar una tabla homónima de bronze.
+    """
+    consulta = text("SELECT 1 FROM information_schema.tables WHERE table_schema = :esquema AND table_name = :tabla")
+    return connection.execute(consulta, {"esquema": schema or capa, "tabla": table_name}).first() is not None
+
+
+def crear_engine(capa, DB_USER=None, DB_PASS=None, DB_HOST=None, DB_PORT=None, backend=None, **opciones):
+    """
+    Crea el engine de una capa en el backend configurado.
+
+    Parámetros:
+    ----------
+    capa : str
+        'bronze', 'silver', 'gold' o 'dashboard'.
+
+    DB_USER, DB_PASS, DB_HOST, DB_PORT : str
+        Credenciales del servidor MySQL (los backends embebidos las ignoran).
+
+    backend : str, opcional
+        'mysql', 'duckdb' o 'sqlite'; por defecto el de HOME_CREDIT_DB.
+
+    **opciones :
+        Argumentos extra de create_engine para MySQL (tamaño del pool, pre_ping, ...).
+
+    Retorna:
+    --------
+    sqlalchemy.engine.Engine
+    """
+    if capa not in CAPAS:
+        raise ValueError(f"Capa desconocida: {capa!r} (usa una de {CAPAS}).")
+    backend = backend or backend_actual()
+
+    if backend == "mysql":
+        return create_engine(f"mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{capa}", **opciones)
+
+    directorio = directorio_bd()
+    if backend == "duckdb":
+        try:
+            import duckdb_engine  # noqa: F401  (registra el dialecto 'duckdb' de SQLAlchemy)
+        except ImportError:
+            raise ImportError("El backend duckdb requiere los paquetes 'duckdb' y 'duckdb-engine'.")
+        engine = create_engine(f"duckdb:///{directorio / ARCHIVO_DUCKDB}")
+
+        @event.listens_for(engine, "connect")
+        def usar_esquema_de_la_capa(conexion, _):
+            for otra in CAPAS:
+                conexion.execute(f"CREATE SCHEMA IF NOT EXISTS {otra}")
+            conexion.execute(f"SET schema = '{capa}'")
+
+        engine.dialect.has_table = types.MethodType(partial(_tabla_en_capa, capa), engine.dialect)
+    else:
+        engine = create_engine(f"sqlite:///{directorio / f'{capa}.db'}")
+
+        @event.listens_for(engine, "connect")
+        def adjuntar_capas(conexion, _):
+            for otra in CAPAS:
+                if otra != capa:
+                    conexion.execute(f"ATTACH DATABASE '{directorio / f'{otra}.db'}' AS {otra}")
+
+    event.listen(engine, "before_cursor_execute", partial(_adaptar_sql, backend, capa), retval=True)
+    if backend == "duckdb":
+        # La reflexión (to_sql, read_sql_table) de tablas sin esquema se resuelve en el de la capa
+        return engine.execution_options(schema_translate_map={None: capa})
+    return engine
+
+
+def _leer_por_lotes(ruta, columnas):
+    """
+    Lee un CSV o Parquet de bronze por lotes, con los tipos del esquema: las columnas TEXT
+    quedan como texto (los campos vacíos como ''), igual que con LOAD DATA en MySQL.
+    """
+    if ruta.suffix == ".parquet":
+        import pyarrow.parquet as pq
+        for lote in pq.ParquetFile(ruta).iter_batches(batch_size=FILAS_POR_LOTE):
+            yield lote.to_pandas()
+        return
+
+    texto = [nombre for nombre, tipo in columnas if tipo == "TEXT"]
+    yield from pd.read_csv(
+        ruta, chunksize=FILAS_POR_LOTE,
+        dtype={nombre: str for nombre in texto},
+        keep_default_na=False,
+        na_values={nombre: [""] for nombre, tipo in columnas if tipo != "TEXT"},
+    )
+
+
+def cargar_bronze(engine_bronze, directorio):
+    """
+    Carga en bronze los archivos de 'directorio' (<tabla>.csv o <tabla>.parquet con los
+    nombres de Kaggle), en tablas con el nombre en minúsculas. Reemplaza las existentes.
+
+    Parámetros:
+    ----------
+    engine_bronze : sqlalchemy.engine.Engine
+        Engine de la capa bronze (ver crear_engine).
+
+    directorio : str o Path
+        Carpeta con los archivos.
+
+    Retorna:
+    --------
+    dict
+        Filas cargadas por tabla.
+    """
+    from scripts.synthetic_data import leer_esquema
+
+    filas = {}
+    for tabla, columnas in leer_esquema().items():
+        rutas = [Path(directorio) / f"{tabla}.{formato}" for formato in ("parquet", "csv")]
+        ruta = next((ruta for ruta in rutas if ruta.exists()), None)
+        if ruta is None:
+            print(f"-> {tabla}: no se encontró el archivo, se omite.")
+            continue
+
+        nombre = tabla.lower()
+        filas[nombre] = 0
+        for numero, lote in enumerate(_leer_por_lotes(ruta, columnas)):
+            if engine_bronze.dialect.name == "duckdb":
+                # DuckDB lee el DataFrame directamente, sin insertar fila por fila
+                conexion = engine_bronze.raw_connection()
+                try:
+                    duck = conexion.driver_connection
+                    duck.register("lote_bronze", lote)
+                    if numero == 0:
+                        duck.execute(f"CREATE OR REPLACE TABLE {nombre} AS SELECT * FROM lote_bronze")
+                    else:
+                        duck.execute(f"INSERT INTO {nombre} SELECT * FROM lote_bronze")
+                    duck.unregister("lote_bronze")
+                finally:
+                    conexion.close()
+            else:
+                lote.to_sql(nombre, engine_bronze, if_exists="replace" if numero == 0 else "append", index=False)
+            filas[nombre] += len(lote)
+        print(f"-> {nombre}: {filas[nombre]:,} filas")
+    return filas
+
+
+if __name__ == "__main__":
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+    parser = argparse.ArgumentParser(description="Carga los archivos de bronze en el backend configurado en HOME_CREDIT_DB.")
+    parser.add_argument("--cargar-bronze", type=Path, required=True, metavar="DIRECTORIO",
+                        help="carpeta con los CSV o Parquet (p. ej. data/synthetic)")
+    args = parser.parse_args()
+
+    if backend_actual() == "mysql":
+        print("Para MySQL usa data/load_to_data.sql; este cargador es para los backends embebidos (HOME_CREDIT_DB=duckdb o sqlite).")
+        sys.exit(1)
+    cargar_bronze(crear_engine("bronze"), args.cargar_bronze)
@@ -1,6 +1,15 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 import pandas as pd
 import numpy as np
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 
 def prepare_features_for_modeling(df_balance, df_inst, 
                                   umbral_pago=0.0, umbral_cargo=0.0, umbral_balance=0.0):
@@ -224,7 +233,7 @@ def obtener_conteo_clientes_unicos(engine):
     SELECT 
         COUNT(DISTINCT SK_ID_CURR) as total_clientes_unicos,
         COUNT(*) as total_registros,
-        COUNT(*) / COUNT(DISTINCT SK_ID_CURR) as promedio_registros_por_cliente
+        COUNT(*) * 1.0 / COUNT(DISTINCT SK_ID_CURR) as promedio_registros_por_cliente
     FROM credit_card_balance
     """
 
@@ -462,6 +471,569 @@ def obtener_distribucion_incompletos(engine):
         print(f"Error al obtener distribución de pagos incompletos: {e}")
         return None
 
+# Reportes combinados de EDA: cada tabla se recorre una sola vez con una consulta GROUP BY que
+# calcula todos los conteos y sumas condicionales; las métricas de las funciones individuales
+# de arriba se derivan en pandas a partir de ese resultado (una fila por grupo, no por registro).
+
+@dataclass(frozen=True)
+class ReporteCreditCardBalance:
+    """Resultados de las siete consultas de EDA de 'credit_card_balance', con las mismas columnas."""
+    conteo_clientes: pd.DataFrame     # obtener_conteo_clientes_unicos
+    saldo_a_favor: pd.DataFrame       # clientes_saldo_a_favor
+    deuda: pd.DataFrame               # clientes_con_deuda
+    pagos_atrasados: pd.DataFrame     # casos_pagos_atrasados
+    cargos_adicionales: pd.DataFrame  # casos_cargos_adicionales
+    estado_contrato: pd.DataFrame     # analizar_estado_contrato
+    perfil_clientes: pd.DataFrame     # analizar_perfil_clientes
+
+    def resumen(self):
+        conteo = {col: self.conteo_clientes[col].iloc[0] for col in self.conteo_clientes.columns}
+        perfil = self.perfil_clientes
+        lineas = [
+            "=== EDA credit_card_balance ===",
+            f"Total de clientes únicos: {conteo['total_clientes_unicos']:,}",
+            f"Total de registros: {conteo['total_registros']:,}",
+            f"Promedio de registros por cliente: {conteo['promedio_registros_por_cliente']:.1f}",
+        ]
+        for etiqueta, df in [("Clientes con saldo a favor", self.saldo_a_favor), ("Clientes con deuda pendiente", self.deuda),
+                             ("Casos con pagos atrasados", self.pagos_atrasados), ("Casos con cargos adicionales", self.cargos_adicionales)]:
+            lineas.append(f"{etiqueta}: {df.iloc[0, 0]:,} ({df['porcentaje'].iloc[0]:.2f}%)")
+        lineas += ["\n=== ANÁLISIS POR ESTADO DE CONTRATO ===", self.estado_contrato.to_string(index=False)]
+        sin_atrasos = (perfil['meses_con_atraso'] == 0).sum()
+        con_atrasos = (perfil['meses_con_atraso'] > 0).sum()
+        lineas += [
+            "\n=== ANÁLISIS DE PERFIL DE CLIENTES - DATASET COMPLETO ===",
+            f"Total de clientes analizados: {len(perfil):,}",
+            f"Promedio de límite de crédito: ${perfil['promedio_limite_credito'].mean():,.2f}",
+            f"Promedio de días de atraso: {perfil['promedio_dias_atraso'].mean():.1f}",
+            f"Clientes sin atrasos: {sin_atrasos:,}",
+            f"Clientes con atrasos: {con_atrasos:,}",
+            "\n=== TOP 5 CLIENTES CON MAYOR RECEIVABLE ===",
+            perfil[['SK_ID_CURR', 'promedio_receivable', 'promedio_limite_credito',
+                    'promedio_dias_atraso', 'ratio_utilizacion']].head().to_string(index=False),
+            "\n=== TOP 5 CLIENTES CON MAYOR ATRASO ===",
+            perfil[['SK_ID_CURR', 'promedio_receivable', 'promedio_limite_credito', 'promedio_dias_atraso', 'max_dias_atraso']]
+                .sort_values('promedio_dias_atraso', ascending=False).head().to_string(index=False),
+        ]
+        clientes_vip = perfil[(perfil['promedio_receivable'] > 50000) & (perfil['meses_con_atraso'] == 0)][
+            ['SK_ID_CURR', 'promedio_receivable', 'promedio_limite_credito', 'ratio_utilizacion']]
+        clientes_riesgo = perfil[(perfil['promedio_receivable'] > 50000) & (perfil['meses_con_atraso'] > 0)][
+            ['SK_ID_CURR', 'promedio_receivable', 'promedio_dias_atraso', 'max_dias_atraso']]
+        for titulo, etiqueta, clientes in [("CLIENTES VIP (Alto receivable, sin atrasos)", "clientes VIP", clientes_vip),
+                                           ("CLIENTES DE ALTO RIESGO (Alto receivable, con atrasos)", "clientes de alto riesgo", clientes_riesgo)]:
+            lineas += [f"\n=== {titulo} ===", f"Total {etiqueta}: {len(clientes):,}"]
+            if len(clientes) > 0:
+                lineas += [f"TOP 5 {etiqueta}:", clientes.head().to_string(index=False)]
+        if len(perfil) > 0:
+            lineas += [
+                "\n=== RESUMEN ESTADÍSTICO ===",
+                f"Porcentaje de clientes sin atrasos: {sin_atrasos / len(perfil) * 100:.1f}%",
+                f"Porcentaje de clientes con atrasos: {con_atrasos / len(perfil) * 100:.1f}%",
+                f"Porcentaje de clientes VIP: {len(clientes_vip) / len(perfil) * 100:.1f}%",
+                f"Porcentaje de clientes de alto riesgo: {len(clientes_riesgo) / len(perfil) * 100:.1f}%",
+            ]
+        return "\n".join(lineas)
+
+
+@dataclass(frozen=True)
+class ReporteInstallmentsPayments:
+    """Resultados de las tres consultas de EDA de 'installments_payments', con las mismas columnas."""
+    pagos_por_cliente: pd.DataFrame         # obtener_pagos_por_cliente
+    resumen_atrasos: pd.DataFrame           # obtener_resumen_atrasos
+    distribucion_incompletos: pd.DataFrame  # obtener_distribucion_incompletos
+
+    def resumen(self):
+        return "\n".join([
+            "=== TOP 10 CLIENTES CON MÁS PAGOS ===", self.pagos_por_cliente.to_string(index=False),
+            "\n=== RESUMEN DE PAGOS ATRASADOS Y ADELANTADOS ===", self.resumen_atrasos.to_string(index=False),
+            "\n=== DISTRIBUCIÓN DE PAGOS INCOMPLETOS ===", self.distribucion_incompletos.to_string(index=False),
+        ])
+
+
+def _a_numerico(df, columnas_texto=()):
+    """MySQL devuelve SUM de enteros como DECIMAL; se pasa todo a float o int de numpy."""
+    for col in df.columns.difference(list(columnas_texto)):
+        df[col] = pd.to_numeric(df[col])
+    return df
+
+def reporte_eda_credit_card(engine):
+    """
+    Calcula en un solo recorrido de `credit_card_balance` las métricas de
+    `obtener_conteo_clientes_unicos`, `clientes_saldo_a_favor`, `clientes_con_deuda`,
+    `casos_pagos_atrasados`, `casos_cargos_adicionales`, `analizar_estado_contrato` y
+    `analizar_perfil_clientes`, sin imprimir.
+
+    La consulta agrupa por (SK_ID_CURR, NAME_CONTRACT_STATUS), el grano más fino que piden los
+    reportes, con sumas y conteos condicionales; los promedios se reconstruyen como suma / conteo
+    para respetar los nulos igual que AVG.
+
+    Parámetros:
+    ----------
+    engine : sqlalchemy.engine.base.Engine
+        Conexión activa a la base de datos.
+
+    Retorna:
+    --------
+    ReporteCreditCardBalance
+        Reporte con un DataFrame por consulta original (None si la consulta falla).
+    """
+    query = """
+    SELECT
+        SK_ID_CURR,
+        NAME_CONTRACT_STATUS,
+        COUNT(*) AS n,
+        SUM(CASE WHEN AMT_RECIVABLE < 0 THEN 1 ELSE 0 END) AS n_saldo_a_favor,
+        SUM(CASE WHEN AMT_RECIVABLE > 0 THEN 1 ELSE 0 END) AS n_deuda,
+        SUM(CASE WHEN AMT_PAYMENT_TOTAL_CURRENT > AMT_PAYMENT_CURRENT THEN 1 ELSE 0 END) AS n_pagos_atrasados,
+        SUM(CASE WHEN AMT_TOTAL_RECEIVABLE > AMT_RECIVABLE THEN 1 ELSE 0 END) AS n_cargos_adicionales,
+        SUM(AMT_RECIVABLE * 1e0) AS suma_receivable,
+        COUNT(AMT_RECIVABLE) AS n_receivable,
+        -- Filas con límite de crédito > 0 (analizar_perfil_clientes)
+        SUM(CASE WHEN AMT_CREDIT_LIMIT_ACTUAL > 0 THEN 1 ELSE 0 END) AS n_limite,
+        SUM(CASE WHEN AMT_CREDIT_LIMIT_ACTUAL > 0 THEN AMT_RECIVABLE * 1e0 END) AS suma_receivable_limite,
+        COUNT(CASE WHEN AMT_CREDIT_LIMIT_ACTUAL > 0 THEN AMT_RECIVABLE END) AS n_receivable_limite,
+        SUM(CASE WHEN AMT_CREDIT_LIMIT_ACTUAL > 0 THEN AMT_CREDIT_LIMIT_ACTUAL * 1e0 END) AS suma_limite,
+        SUM(CASE WHEN AMT_CREDIT_LIMIT_ACTUAL > 0 THEN SK_DPD * 1e0 END) AS suma_dpd,
+        COUNT(CASE WHEN AMT_CREDIT_LIMIT_ACTUAL > 0 THEN SK_DPD END) AS n_dpd,
+        MAX(CASE WHEN AMT_CREDIT_LIMIT_ACTUAL > 0 THEN SK_DPD END) AS max_dias_atraso,
+        SUM(CASE WHEN AMT_CREDIT_LIMIT_ACTUAL > 0 AND SK_DPD = 0 THEN 1 ELSE 0 END) AS meses_sin_atraso,
+        SUM(CASE WHEN AMT_CREDIT_LIMIT_ACTUAL > 0 AND SK_DPD > 0 THEN 1 ELSE 0 END) AS meses_con_atraso,
+        SUM(CASE WHEN AMT_CREDIT_LIMIT_ACTUAL > 0 THEN AMT_PAYMENT_CURRENT * 1e0 END) AS suma_pagos,
+        COUNT(CASE WHEN AMT_CREDIT_LIMIT_ACTUAL > 0 THEN AMT_PAYMENT_CURRENT END) AS n_pagos,
+        SUM(CASE WHEN AMT_CREDIT_LIMIT_ACTUAL > 0 THEN AMT_RECIVABLE * 1e0 / AMT_CREDIT_LIMIT_ACTUAL END) AS suma_ratio
+    FROM credit_card_balance
+    GROUP BY SK_ID_CURR, NAME_CONTRACT_STATUS
+    """
+    try:
+        grupos = _a_numerico(pd.read_sql(query, engine), columnas_texto=["NAME_CONTRACT_STATUS"])
+    except Exception as e:
+        print(f"Error en la consulta: {e}")
+        return None
+
+    total = grupos['n'].sum()
+    conteo_clientes = pd.DataFrame([{
+        'total_clientes_unicos': grupos['SK_ID_CURR'].nunique(),
+        'total_registros': total,
+        'promedio_registros_por_cliente': total / grupos['SK_ID_CURR'].nunique(),
+    }])
+
+    def _casos(columna, nombre):
+        casos = grupos[columna].sum()
+        return pd.DataFrame([{nombre: casos, 'porcentaje': casos * 100.0 / total}])
+
+    estado = grupos.groupby('NAME_CONTRACT_STATUS', dropna=False)[
+        ['n', 'n_saldo_a_favor', 'n_deuda', 'suma_receivable', 'n_receivable']].sum(min_count=1).reset_index()
+    estado_contrato = pd.DataFrame({
+        'NAME_CONTRACT_STATUS': estado['NAME_CONTRACT_STATUS'],
+        'total_registros': estado['n'],
+        'con_credito': estado['n_saldo_a_favor'],
+        'con_deuda': estado['n_deuda'],
+        'promedio_receivable': estado['suma_receivable'] / estado['n_receivable'],
+    }).sort_values('total_registros', ascending=False, kind='stable').reset_index(drop=True)
+
+    # WHERE AMT_CREDIT_LIMIT_ACTUAL > 0 ... HAVING COUNT(*) > 3
+    perfil = grupos[grupos['n_limite'] > 3]
+    perfil_clientes = pd.DataFrame({
+        'SK_ID_CURR': perfil['SK_ID_CURR'],
+        'total_registros': perfil['n_limite'],
+        'promedio_receivable': perfil['suma_receivable_limite'] / perfil['n_receivable_limite'],
+        'promedio_limite_credito': perfil['suma_limite'] / perfil['n_limite'],
+        'promedio_dias_atraso': perfil['suma_dpd'] / perfil['n_dpd'],
+        'max_dias_atraso': perfil['max_dias_atraso'],
+        'meses_sin_atraso': perfil['meses_sin_atraso'],
+        'meses_con_atraso': perfil['meses_con_atraso'],
+        'promedio_pagos': perfil['suma_pagos'] / perfil['n_pagos'],
+        'ratio_utilizacion': perfil['suma_ratio'] / perfil['n_receivable_limite'],
+        'NAME_CONTRACT_STATUS': perfil['NAME_CONTRACT_STATUS'],
+    }).sort_values('promedio_receivable', ascending=False, kind='stable').reset_index(drop=True)
+
+    return ReporteCreditCardBalance(
+        conteo_clientes=conteo_clientes,
+        saldo_a_favor=_casos('n_saldo_a_favor', 'total_clientes_credito'),
+        deuda=_casos('n_deuda', 'total_clientes_deuda'),
+        pagos_atrasados=_casos('n_pagos_atrasados', 'total_pagos_atrasados'),
+        cargos_adicionales=_casos('n_cargos_adicionales', 'total_cargos_adicionales'),
+        estado_contrato=estado_contrato,
+        perfil_clientes=perfil_clientes,
+    )
+
+def reporte_eda_installments(engine, top=10):
+    """
+    Calcula en un solo recorrido de `installments_payments` las métricas de
+    `obtener_pagos_por_cliente`, `obtener_resumen_atrasos` y `obtener_distribucion_incompletos`,
+    sin imprimir. La consulta agrupa por SK_ID_CURR; los totales generales se suman en pandas.
+
+    Parámetros:
+    ----------
+    engine : sqlalchemy.engine.base.Engine
+        Conexión activa a la base de datos.
+
+    top : int
+        Cantidad de clientes con más pagos a reportar.
+
+    Retorna:
+    --------
+    ReporteInstallmentsPayments
+        Reporte con un DataFrame por consulta original (None si la consulta falla).
+    """
+    query = """
+    SELECT
+        SK_ID_CURR,
+        COUNT(*) AS total_pagos,
+        SUM(AMT_INSTALMENT * 1e0) AS suma_instalment,
+        COUNT(AMT_INSTALMENT) AS n_instalment,
+        SUM(AMT_PAYMENT * 1e0) AS suma_payment,
+        COUNT(AMT_PAYMENT) AS n_payment,
+        SUM(CASE WHEN AMT_PAYMENT < AMT_INSTALMENT THEN 1 ELSE 0 END) AS pagos_incompletos,
+        SUM(CASE WHEN AMT_PAYMENT > AMT_INSTALMENT THEN 1 ELSE 0 END) AS pagos_excedidos,
+        SUM(CASE WHEN AMT_PAYMENT < AMT_INSTALMENT THEN (AMT_INSTALMENT - AMT_PAYMENT) * 1e0 END) AS suma_diferencia_incompletos,
+        SUM(CASE WHEN DAYS_ENTRY_PAYMENT > DAYS_INSTALMENT THEN 1 ELSE 0 END) AS pagos_atrasados,
+        SUM(CASE WHEN DAYS_ENTRY_PAYMENT < DAYS_INSTALMENT THEN 1 ELSE 0 END) AS pagos_adelantados,
+        SUM((DAYS_ENTRY_PAYMENT - DAYS_INSTALMENT) * 1e0) AS suma_dias_diferencia,
+        COUNT(DAYS_ENTRY_PAYMENT - DAYS_INSTALMENT) AS n_dias_diferencia
+    FROM installments_payments
+    GROUP BY SK_ID_CURR
+    """
+    try:
+        clientes = _a_numerico(pd.read_sql(query, engine))
+    except Exception as e:
+        print(f"Error al obtener el reporte de installments_payments: {e}")
+        return None
+
+    top_clientes = clientes.sort_values('total_pagos', ascending=False, kind='stable').head(top)
+    pagos_por_cliente = pd.DataFrame({
+        'SK_ID_CURR': top_clientes['SK_ID_CURR'],
+        'total_pagos': top_clientes['total_pagos'],
+        'promedio_instalment': top_clientes['suma_instalment'] / top_clientes['n_instalment'],
+        'promedio_payment': top_clientes['suma_payment'] / top_clientes['n_payment'],
+        'pagos_incompletos': top_clientes['pagos_incompletos'],
+        'pagos_excedidos': top_clientes['pagos_excedidos'],
+    }).reset_index(drop=True)
+
+    totales = {col: clientes[col].sum(min_count=1) for col in clientes.columns.drop('SK_ID_CURR')}
+    resumen_atrasos = pd.DataFrame([{
+        'total_registros': totales['total_pagos'],
+        'pagos_atrasados': totales['pagos_atrasados'],
+        'pagos_adelantados': totales['pagos_adelantados'],
+        'promedio_dias_diferencia': totales['suma_dias_diferencia'] / totales['n_dias_diferencia'],
+    }])
+    distribucion_incompletos = pd.DataFrame([{
+        'total_incompletos': totales['pagos_incompletos'],
+        'promedio_diferencia': totales['suma_diferencia_incompletos'] / totales['pagos_incompletos'],
+    }])
+
+    return ReporteInstallmentsPayments(
+        pagos_por_cliente=pagos_por_cliente,
+        resumen_atrasos=resumen_atrasos,
+        distribucion_incompletos=distribucion_incompletos,
+    )
+
+# Reportes de EDA que ejecuta 'ejecutar_reportes_eda': nombre -> (tabla que recorre, función)
+REPORTES_EDA = {
+    'credit_card_balance': ('credit_card_balance', reporte_eda_credit_card),
+    'installments_payments': ('installments_payments', reporte_eda_installments),
+}
+
+class _HashFilas:
+    """
+    Agregado de SQLite: suma módulo 2**64 de un hash (BLAKE2b de 8 bytes) de cada fila.
+    No depende del orden de las filas, pero sí de qué valores van juntos en cada fila.
+    """
+    def __init__(self):
+        self.total = 0
+
+    def step(self, *valores):
+        digest = hashlib.blake2b(repr(valores).encode(), digest_size=8).digest()
+        self.total = (self.total + int.from_bytes(digest, 'little')) % 2**64
+
+    def finalize(self):
+        return str(self.total)
+
+def huella_tabla(engine, tabla):
+    """
+    Huella de una tabla para la caché de reportes, calculada solo sobre esa tabla y en un solo
+    recorrido:
+    - MySQL: CHECKSUM TABLE (exacto; cambia con el número de filas y con cualquier valor).
+    - DuckDB: cantidad de filas y suma de hash por fila.
+    - SQLite: cantidad de filas y suma de un hash por fila (agregado '_HashFilas').
+
+    Parámetros:
+    ----------
+    engine : sqlalchemy.engine.base.Engine
+        Conexión activa a la base de datos.
+
+    tabla : str
+        Nombre de la tabla.
+
+    Retorna:
+    --------
+    str o None
+        Huella que cambia cuando cambia el contenido de la tabla; None si no se pudo calcular
+        (el reporte se recalcula siempre).
+    """
+    dialecto = engine.dialect.name
+    with engine.connect() as conn:
+        if dialecto == 'mysql':
+            huella = conn.execute(text(f"CHECKSUM TABLE {tabla}")).fetchone()[1:]
+        elif dialecto == 'duckdb':
+            huella = conn.execute(text(f"SELECT COUNT(*), COALESCE(SUM(hash(t)), 0) FROM {tabla} t")).fetchone()
+        else:
+            conn.connection.dbapi_connection.create_aggregate("hash_filas", -1, _HashFilas)
+            columnas = ", ".join(f'"{fila[1]}"' for fila in conn.execute(text(f"PRAGMA table_info({tabla})")))
+            huella = conn.execute(text(f"SELECT COUNT(*), hash_filas({columnas}) FROM {tabla}")).fetchone()
+    if any(valor is None for valor in huella):
+        return None
+    return f"{dialecto}:{tabla}:" + ":".join(str(valor) for valor in huella)
+
+def _ejecutar_reporte_en_cache(engine, nombre, tabla, funcion, directorio_cache):
+    """Devuelve (reporte, desde_cache) de un reporte; lo calcula y guarda si la huella cambió."""
+    huella = huella_tabla(engine, tabla)
+    if huella is None:
+        return funcion(engine), False
+    # La clave incluye el código de la función para invalidar la caché si cambia el reporte
+    clave = hashlib.sha256(f"{huella}\n{inspect.getsource(funcion)}".encode()).hexdigest()[:16]
+    archivo = os.path.join(directorio_cache, f"{nombre}_{clave}.pkl")
+    if os.path.exists(archivo):
+        with open(archivo, 'rb') as f:
+            return pickle.load(f), True
+
+    reporte = funcion(engine)
+    if reporte is not None:
+        temporal = f"{archivo}.{threading.get_ident()}.tmp"
+        with open(temporal, 'wb') as f:
+            pickle.dump(reporte, f)
+        os.replace(temporal, archivo)
+        # Entradas anteriores del mismo reporte
+        for viejo in os.listdir(directorio_cache):
+            if viejo.startswith(f"{nombre}_") and viejo.endswith('.pkl') and viejo != os.path.basename(archivo):
+                os.remove(os.path.join(directorio_cache, viejo))
+    return reporte, False
+
+def ejecutar_reportes_eda(engine, directorio_cache, reportes=None, max_workers=4):
+    """
+    Ejecuta los reportes de EDA en paralelo y guarda cada resultado en disco con la huella de
+    su tabla: si la tabla no cambió desde la última ejecución, el reporte se lee de la caché
+    sin consultar la base de datos.
+
+    Cada reporte corre en un hilo del pool y toma su propia conexión del pool del engine, así
+    que 'max_workers' no debería superar pool_size + max_overflow del engine.
+
+    Parámetros:
+    ----------
+    engine : sqlalchemy.engine.base.Engine
+        Conexión activa a la base de datos.
+
+    directorio_cache : str o Path
+        Carpeta de la caché (se crea si no existe).
+
+    reportes : dict, opcional
+        nombre -> (tabla, función(engine)); por defecto REPORTES_EDA.
+
+    max_workers : int
+        Hilos del pool.
+
+    Retorna:
+    --------
+    dict
+        nombre -> reporte (None si su consulta falló).
+    """
+    reportes = REPORTES_EDA if reportes is None else reportes
+    directorio_cache = str(directorio_cache)
+    os.makedirs(directorio_cache, exist_ok=True)
+
+    resultados = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futuros = {
+            pool.submit(_ejecutar_reporte_en_cache, engine, nombre, tabla, funcion, directorio_cache): nombre
+            for nombre, (tabla, funcion) in reportes.items()
+        }
+        for futuro in as_completed(futuros):
+            nombre = futuros[futuro]
+            resultados[nombre], desde_cache = futuro.result()
+            print(f"-> Reporte EDA '{nombre}': {'desde caché' if desde_cache else 'calculado'}")
+    return {nombre: resultados[nombre] for nombre in reportes}
+
+def clean_application_train(df_train):
+    """
+    Limpieza bronze → silver de 'application_train': rellena los textos vacíos de las
+    categóricas, pasa DAYS_BIRTH a años (YEARS_BIRTH) y reemplaza el centinela 365243
+    de DAYS_EMPLOYED por 0.
+
+    Parámetros:
+    ----------
+    df_train : pd.DataFrame
+        Tabla 'application_train' tal como se lee de bronze.
+
+    Retorna:
+    --------
+    pd.DataFrame
+        Tabla limpia para silver.
+    """
+    df_train = df_train.copy()
+    df_train["NAME_TYPE_SUITE"] = df_train["NAME_TYPE_SUITE"].replace("", "Unaccompanied")
+    df_train["OCCUPATION_TYPE"] = df_train["OCCUPATION_TYPE"].replace("", "Others")
+    variables = ["FONDKAPREMONT_MODE", "HOUSETYPE_MODE", "WALLSMATERIAL_MODE", "EMERGENCYSTATE_MODE"]
+    for variable in variables:
+        df_train[variable] = df_train[variable].replace("", "not specified")
+    df_train["DAYS_BIRTH"] = (df_train["DAYS_BIRTH"] / 365).astype(np.int64)
+    df_train = df_train.rename(columns={'DAYS_BIRTH': 'YEARS_BIRTH'})
+    df_train["DAYS_EMPLOYED"] = df_train["DAYS_EMPLOYED"].replace({365243: 0})
+    return df_train
+
+def clean_credit_card_balance(df_credit_data):
+    """
+    Limpieza bronze → silver de 'credit_card_balance': redondea los montos a 2 decimales,
+    elimina las columnas de disposiciones y SK_DPD_DEF y corrige el nombre AMT_RECIVABLE.
+
+    Parámetros:
+    ----------
+    df_credit_data : pd.DataFrame
+        Tabla 'credit_card_balance' tal como se lee de bronze.
+
+    Retorna:
+    --------
+    pd.DataFrame
+        Tabla limpia para silver.
+    """
+    df_credit_data = df_credit_data.copy()
+    columnas_float = df_credit_data.select_dtypes(include=['float64']).columns
+    # Redondear todas las columnas float64 a 2 decimales
+    df_credit_data[columnas_float] = df_credit_data[columnas_float].round(2)
+    df_credit_data = df_credit_data.drop(columns=['AMT_DRAWINGS_CURRENT', 'CNT_DRAWINGS_CURRENT', 'AMT_DRAWINGS_OTHER_CURRENT', 'SK_DPD_DEF'])
+    return df_credit_data.rename(columns={'AMT_RECIVABLE': 'AMT_RECEIVABLE'})
+
+def clean_installments_payments(df_installments):
+    """
+    Limpieza bronze → silver de 'installments_payments': redondea los montos a 2 decimales
+    y pasa a entero la versión y los días de cada cuota (los nulos quedan en 0).
+
+    Parámetros:
+    ----------
+    df_installments : pd.DataFrame
+        Tabla 'installments_payments' tal como se lee de bronze.
+
+    Retorna:
+    --------
+    pd.DataFrame
+        Tabla limpia para silver.
+    """
+    df_installments = df_installments.copy()
+    df_installments[['AMT_INSTALMENT', 'AMT_PAYMENT']] = df_installments[['AMT_INSTALMENT', 'AMT_PAYMENT']].round(2)
+    cols_to_convert = ['NUM_INSTALMENT_VERSION', 'DAYS_INSTALMENT', 'DAYS_ENTRY_PAYMENT']
+    df_installments[cols_to_convert] = df_installments[cols_to_convert].fillna(0).astype(int)
+    return df_installments
+
+def _remove_outliers_iqr(df, col):
+    Q1 = df[col].quantile(0.25)
+    Q3 = df[col].quantile(0.75)
+    IQR = Q3 - Q1
+    return df[(df[col] >= Q1 - 1.5*IQR) & (df[col] <= Q3 + 1.5*IQR)]
+
+def clean_bureau(df_bureau, umbral_nulos=0.4):
+    """
+    Limpieza bronze → silver de 'bureau': tipa las columnas, elimina duplicados y columnas
+    con demasiados nulos, imputa (mediana en numéricas, moda en categóricas), filtra
+    atípicos por IQR y renombra los identificadores como los usa gold
+    (SK_ID_CURR → SK_ID_PREV, SK_ID_BUREAU → SK_ID_CURR).
+
+    Parámetros:
+    ----------
+    df_bureau : pd.DataFrame
+        Tabla 'bureau' tal como se lee de bronze.
+
+    umbral_nulos : float
+        Fracción de nulos a partir de la cual se elimina una columna.
+
+    Retorna:
+    --------
+    pd.DataFrame
+        Tabla limpia para silver.
+    """
+    df_bureau = df_bureau.copy()
+    for col in ['CREDIT_ACTIVE', 'CREDIT_CURRENCY', 'CREDIT_TYPE']:
+        df_bureau[col] = df_bureau[col].astype('category')
+
+    # Convertir columnas numéricas que están como texto a float
+    float_cols = [
+        'DAYS_CREDIT_ENDDATE',
+        'DAYS_ENDDATE_FACT',
+        'AMT_CREDIT_MAX_OVERDUE',
+        'AMT_CREDIT_SUM_DEBT',
+        'AMT_CREDIT_SUM_LIMIT',
+        'AMT_ANNUITY'
+    ]
+    for col in float_cols:
+        df_bureau[col] = pd.to_numeric(df_bureau[col], errors='coerce')
+
+    df_bureau = df_bureau.drop_duplicates()
+    df_bureau = df_bureau.loc[:, df_bureau.isnull().mean() < umbral_nulos]
+
+    # Numéricas → Mediana
+    num_cols = df_bureau.select_dtypes(include=[np.number]).columns
+    df_bureau[num_cols] = df_bureau[num_cols].fillna(df_bureau[num_cols].median())
+
+    # Categóricas → Moda
+    cat_cols = df_bureau.select_dtypes(include='category').columns
+    for col in cat_cols:
+        df_bureau[col] = df_bureau[col].fillna(df_bureau[col].mode()[0])
+
+    cols_outliers = ['CREDIT_DAY_OVERDUE', 'AMT_CREDIT_SUM', 'AMT_CREDIT_SUM_DEBT', 'AMT_CREDIT_SUM_OVERDUE']
+    for col in cols_outliers:
+        if col in df_bureau.columns:
+            df_bureau = _remove_outliers_iqr(df_bureau, col)
+
+    # Elimina solo las que existen
+    columnas_a_eliminar = ['AMT_CREDIT_SUM_OVERDUE', 'AMT_CREDIT_SUM_DEBT', 'CREDIT_DAY_OVERDUE']
+    df_bureau = df_bureau.drop(columns=[col for col in columnas_a_eliminar if col in df_bureau.columns])
+
+    return df_bureau.rename(columns={"SK_ID_CURR": "SK_ID_PREV", "SK_ID_BUREAU": "SK_ID_CURR"})
+
+def create_risk_level_data(df_train):
+    """
+    Selecciona de 'application_train' (silver) las variables del formulario de solicitud
+    con las que se entrena el modelo de riesgo para clientes no registrados.
+
+    Parámetros:
+    ----------
+    df_train : pd.DataFrame
+        Tabla 'application_train' de silver.
+
+    Retorna:
+    --------
+    pd.DataFrame
+        Tabla 'risk_level_data' de gold (sin TARGET).
+    """
+    features = [
+        "FLAG_OWN_CAR",
+        "FLAG_OWN_REALTY",
+        "CNT_CHILDREN",
+        "AMT_INCOME_TOTAL",
+        "AMT_CREDIT",
+        "NAME_INCOME_TYPE",
+        "NAME_EDUCATION_TYPE",
+        "NAME_FAMILY_STATUS",
+        "NAME_HOUSING_TYPE",
+        "YEARS_BIRTH",
+        "DAYS_EMPLOYED",
+        "OWN_CAR_AGE",
+        "OCCUPATION_TYPE",
+    ]
+    return df_train[features]
+
+# Valores por defecto de 'gold_active_customer_profile' para los clientes que no aparecen en
+# una de las dos fuentes, en el orden de las columnas de la tabla
+_DEFAULTS_INSTALLMENTS = {
+    'AVG_DAYS_LATE': 0, 'MAX_DAYS_LATE': 0, 'FRAC_LATE_INSTALLMENTS': 0,
+    'AVG_PAYMENT_RATIO': 0, 'FRAC_UNDERPAID_INSTALLMENTS': 0,
+    'TOTAL_INSTALLMENTS_PAID': 0, 'TOTAL_LOANS_WITH_INSTALLMENTS': 0,
+    'DAYS_SINCE_LAST_PAYMENT': 9999,
+}
+_DEFAULTS_CREDIT_CARD = {
+    'AVG_BALANCE_TDC': 0, 'MAX_BALANCE_TDC': 0, 'AVG_CREDIT_LIMIT_TDC': 0,
+    'AVG_UTILIZATION_RATIO_TDC': 0, 'AVG_DPD_TDC': 0, 'MAX_DPD_TDC': 0,
+    'TOTAL_MONTHS_WITH_DPD_TDC': 0,
+}
+
 def _aggregate_installments_by_customer(df_inst):
     """
     Agrega los datos de pago de cuotas a nivel de cliente (SK_ID_CURR).
@@ -589,22 +1161,176 @@ def create_active_customer_gold_table(df_inst, df_balance):
     
     # Limpieza final: la unión externa crea NaNs para clientes que están en una
     # tabla pero no en la otra. Los rellenamos con valores por defecto con sentido de negocio.
-    df_gold.fillna({
-        # Columnas de cuotas
-        'AVG_DAYS_LATE': 0, 'MAX_DAYS_LATE': 0, 'FRAC_LATE_INSTALLMENTS': 0,
-        'AVG_PAYMENT_RATIO': 0, 'FRAC_UNDERPAID_INSTALLMENTS': 0,
-        'TOTAL_INSTALLMENTS_PAID': 0, 'TOTAL_LOANS_WITH_INSTALLMENTS': 0,
-        'DAYS_SINCE_LAST_PAYMENT': 9999,
-        # Columnas de tarjeta de crédito
-        'AVG_BALANCE_TDC': 0, 'MAX_BALANCE_TDC': 0, 'AVG_CREDIT_LIMIT_TDC': 0,
-        'AVG_UTILIZATION_RATIO_TDC': 0, 'AVG_DPD_TDC': 0, 'MAX_DPD_TDC': 0,
-        'TOTAL_MONTHS_WITH_DPD_TDC': 0
-    }, inplace=True)
+    df_gold.fillna({**_DEFAULTS_INSTALLMENTS, **_DEFAULTS_CREDIT_CARD}, inplace=True)
     
     print("--- Gold Table Creation Complete ---")
     return df_gold
 
 
+# En las consultas, '* 1e0' fuerza aritmética de coma flotante: en MySQL AVG de enteros o
+# decimales se redondea a 4 decimales y en SQLite la división entre enteros trunca.
+
+def _aggregate_installments_by_customer_sql(schema):
+    """
+    Versión SQL de '_aggregate_installments_by_customer': consulta GROUP BY SK_ID_CURR sobre
+    'installments_payments' con las mismas métricas (sin rellenar los clientes faltantes).
+
+    Parámetros:
+    ----------
+    schema : str
+        Esquema (o base de datos) donde está 'installments_payments', normalmente 'silver'.
+
+    Retorna:
+    --------
+    str
+        Consulta SELECT con una fila por SK_ID_CURR.
+    """
+    return f"""
+        SELECT SK_ID_CURR,
+               COALESCE(AVG(CASE WHEN DAYS_LATE > 0 THEN DAYS_LATE END), 0) AS AVG_DAYS_LATE,
+               MAX(DAYS_LATE) AS MAX_DAYS_LATE,
+               AVG(CASE WHEN DAYS_LATE > 0 THEN 1e0 ELSE 0e0 END) AS FRAC_LATE_INSTALLMENTS,
+               AVG(AMT_PAYMENT * 1e0 / NULLIF(AMT_INSTALMENT, 0)) AS AVG_PAYMENT_RATIO,
+               AVG(CASE WHEN AMT_PAYMENT < AMT_INSTALMENT THEN 1e0 ELSE 0e0 END) AS FRAC_UNDERPAID_INSTALLMENTS,
+               COUNT(SK_ID_PREV) AS TOTAL_INSTALLMENTS_PAID,
+               COUNT(DISTINCT SK_ID_PREV) AS TOTAL_LOANS_WITH_INSTALLMENTS,
+               -MAX(DAYS_ENTRY_PAYMENT) AS DAYS_SINCE_LAST_PAYMENT
+        FROM (
+            SELECT SK_ID_CURR, SK_ID_PREV, AMT_PAYMENT, AMT_INSTALMENT, DAYS_ENTRY_PAYMENT,
+                   (DAYS_ENTRY_PAYMENT - DAYS_INSTALMENT) * 1e0 AS DAYS_LATE
+            FROM {schema}.installments_payments
+        ) inst
+        GROUP BY SK_ID_CURR
+    """
+
+def _aggregate_credit_card_by_customer_sql(schema):
+    """
+    Versión SQL de '_aggregate_credit_card_by_customer': consulta GROUP BY SK_ID_CURR sobre
+    'credit_card_balance' con las mismas métricas.
+
+    Parámetros:
+    ----------
+    schema : str
+        Esquema (o base de datos) donde está 'credit_card_balance', normalmente 'silver'.
+
+    Retorna:
+    --------
+    str
+        Consulta SELECT con una fila por SK_ID_CURR.
+    """
+    return f"""
+        SELECT SK_ID_CURR,
+               AVG(AMT_BALANCE * 1e0) AS AVG_BALANCE_TDC,
+               MAX(AMT_BALANCE) AS MAX_BALANCE_TDC,
+               AVG(AMT_CREDIT_LIMIT_ACTUAL * 1e0) AS AVG_CREDIT_LIMIT_TDC,
+               AVG(AMT_BALANCE * 1e0 / NULLIF(AMT_CREDIT_LIMIT_ACTUAL, 0)) AS AVG_UTILIZATION_RATIO_TDC,
+               AVG(SK_DPD * 1e0) AS AVG_DPD_TDC,
+               MAX(SK_DPD) AS MAX_DPD_TDC,
+               SUM(CASE WHEN SK_DPD > 0 THEN 1 ELSE 0 END) AS TOTAL_MONTHS_WITH_DPD_TDC
+        FROM {schema}.credit_card_balance
+        GROUP BY SK_ID_CURR
+    """
+
+def create_active_customer_gold_table_sql(engine_gold, schema_silver="silver", nombre_tabla="gold_active_customer_profile"):
+    """
+    Construye 'gold_active_customer_profile' dentro de la base de datos, con el mismo
+    resultado que 'create_active_customer_gold_table'.
+
+    Las agregaciones por cliente se ejecutan como INSERT ... SELECT ... GROUP BY SK_ID_CURR
+    sobre las tablas de silver, así que las filas crudas de cuotas y tarjetas no salen del
+    servidor (o del backend embebido); solo se lee la tabla resultante, una fila por cliente.
+    La unión externa se arma con la lista de clientes de ambas fuentes y dos LEFT JOIN,
+    porque MySQL no tiene FULL OUTER JOIN.
+
+    Parámetros:
+    ----------
+    engine_gold : sqlalchemy.engine.Engine
+        Conexión a la base de datos gold; debe poder leer las tablas de 'schema_silver'.
+
+    schema_silver : str
+        Esquema de 'installments_payments' y 'credit_card_balance'.
+
+    nombre_tabla : str
+        Tabla de gold a crear (se reemplaza si existe).
+
+    Retorna:
+    --------
+    df_gold : pd.DataFrame
+        La tabla creada, ordenada por SK_ID_CURR.
+    """
+    print("--- Starting Gold Table Creation for Active Customers (SQL) ---")
+
+    columnas = ["SK_ID_CURR"] + list(_DEFAULTS_INSTALLMENTS) + list(_DEFAULTS_CREDIT_CARD)
+    seleccion = ["clientes.SK_ID_CURR"]
+    for alias, defaults in (("inst", _DEFAULTS_INSTALLMENTS), ("tdc", _DEFAULTS_CREDIT_CARD)):
+        seleccion += [f"COALESCE({alias}.{col}, {valor})" for col, valor in defaults.items()]
+
+    insercion = f"""
+        INSERT INTO {nombre_tabla} ({", ".join(columnas)})
+        SELECT {", ".join(seleccion)}
+        FROM (
+            SELECT SK_ID_CURR FROM {schema_silver}.installments_payments WHERE SK_ID_CURR IS NOT NULL
+            UNION
+            SELECT SK_ID_CURR FROM {schema_silver}.credit_card_balance WHERE SK_ID_CURR IS NOT NULL
+        ) clientes
+        LEFT JOIN ({_aggregate_installments_by_customer_sql(schema_silver)}) inst ON inst.SK_ID_CURR = clientes.SK_ID_CURR
+        LEFT JOIN ({_aggregate_credit_card_by_customer_sql(schema_silver)}) tdc ON tdc.SK_ID_CURR = clientes.SK_ID_CURR
+    """
+
+    # Mismos tipos que deja to_sql con el resultado de pandas (las métricas quedan en float
+    # tras la unión externa)
+    definicion = ", ".join(["SK_ID_CURR BIGINT"] + [f"{col} DOUBLE" for col in columnas[1:]])
+    print("Step 1: Aggregating 'installments_payments' and 'credit_card_balance' in the database...")
+    with engine_gold.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {nombre_tabla}"))
+        conn.execute(text(f"CREATE TABLE {nombre_tabla} ({definicion})"))
+        conn.execute(text(insercion))
+
+    print("Step 2: Reading the aggregated table...")
+    df_gold = pd.read_sql(f"SELECT * FROM {nombre_tabla} ORDER BY SK_ID_CURR", engine_gold)
+
+    print("--- Gold Table Creation Complete ---")
+    return df_gold
+
+def compare_active_customer_gold_tables(df_sql, df_pandas, rtol=1e-9):
+    """
+    Compara la tabla de clientes activos construida en SQL con la de pandas.
+
+    Parámetros:
+    ----------
+    df_sql : pd.DataFrame
+        Resultado de 'create_active_customer_gold_table_sql'.
+
+    df_pandas : pd.DataFrame
+        Resultado de 'create_active_customer_gold_table' sobre las mismas tablas de silver.
+
+    rtol : float
+        Tolerancia relativa para las métricas (los promedios pueden diferir en el último
+        decimal por el orden de la suma).
+
+    Retorna:
+    --------
+    pd.DataFrame
+        Una fila por columna con la diferencia absoluta máxima y si está dentro de la
+        tolerancia; si los clientes no coinciden, todas las columnas quedan fuera.
+    """
+    df_sql = df_sql.sort_values('SK_ID_CURR').reset_index(drop=True)
+    df_pandas = df_pandas[df_sql.columns].sort_values('SK_ID_CURR').reset_index(drop=True)
+    mismos_clientes = df_sql['SK_ID_CURR'].astype('int64').equals(df_pandas['SK_ID_CURR'].astype('int64'))
+
+    filas = []
+    for col in df_sql.columns:
+        a = df_sql[col].astype(float).to_numpy()
+        b = df_pandas[col].astype(float).to_numpy()
+        if mismos_clientes:
+            diferencia = float(np.nanmax(np.abs(a - b), initial=0.0))
+            coincide = bool(np.allclose(a, b, rtol=rtol, atol=0, equal_nan=True))
+        else:
+            diferencia, coincide = np.nan, False
+        filas.append({'COLUMNA': col, 'DIFERENCIA_MAXIMA': diferencia, 'COINCIDE': coincide})
+    return pd.DataFrame(filas)
+
+
 def aggregate_previous_applications(df_previous):
     """
     Agrega los datos de solicitudes de crédito anteriores a nivel de cliente (SK_ID_CURR).
@@ -782,3 +1508,465 @@ def create_final_ml_gold_table(df_installments, df_credit_card, df_previous, df_
     
     return df_final_model
 
+def create_bureau_summary_tables(df_bureau_gold):
+    """
+    Materializa las distribuciones globales de la tabla 'bureau' que consume el
+    dashboard, para que no sea necesario transferir la tabla completa en cada consulta.
+
+    Parámetros:
+    ----------
+    df_bureau_gold : pd.DataFrame
+        DataFrame de la tabla 'bureau' de la capa Gold.
+        Debe contener: 'SK_ID_CURR', 'CREDIT_TYPE', 'CREDIT_ACTIVE'.
+
+    Retorna:
+    --------
+    dict[str, pd.DataFrame]
+        Diccionario {nombre_tabla: DataFrame} con:
+        - bureau_estado_resumen : frecuencia de cada estado de crédito (CREDIT_ACTIVE).
+        - bureau_tipo_resumen : frecuencia de cada tipo de crédito (CREDIT_TYPE), de mayor a menor.
+    """
+    print("Generando tablas resumen de 'bureau'...")
+
+    # Los valores faltantes quedan fuera de los conteos, como con value_counts() en el dashboard
+    credit_active = df_bureau_gold['CREDIT_ACTIVE']
+    credit_type = df_bureau_gold['CREDIT_TYPE']
+
+    estado_resumen = credit_active.value_counts().rename_axis('CREDIT_ACTIVE').reset_index(name='FRECUENCIA')
+    tipo_resumen = credit_type.value_counts().rename_axis('CREDIT_TYPE').reset_index(name='FRECUENCIA')
+
+    print("-> Tablas resumen de 'bureau' completadas.")
+    return {
+        'bureau_estado_resumen': estado_resumen,
+        'bureau_tipo_resumen': tipo_resumen,
+    }
+
+def create_previous_application_cube(df_previous_gold, n_bins=100):
+    """
+    Materializa las tablas compactas de 'previous_application' para la pestaña de métricas
+    generales del dashboard, de modo que las tasas de aprobación y distribuciones de
+    montos se calculen sobre ellas y no sobre las solicitudes individuales.
+
+    Parámetros:
+    ----------
+    df_previous_gold : pd.DataFrame
+        DataFrame de la tabla 'previous_application_gold'.
+        Debe contener: 'NAME_CLIENT_TYPE', 'CHANNEL_TYPE', 'WEEKDAY_APPR_PROCESS_START',
+        'NAME_CONTRACT_STATUS', 'NAME_CONTRACT_TYPE', 'AMT_APPLICATION'.
+
+    n_bins : int
+        Número máximo de intervalos del histograma de AMT_APPLICATION.
+
+    Retorna:
+    --------
+    dict[str, pd.DataFrame]
+        Diccionario {nombre_tabla: DataFrame} con:
+        - previous_application_cubo : una fila por combinación de las cinco dimensiones, con
+          N_SOLICITUDES (cantidad de solicitudes), N_MONTO (solicitudes con monto informado)
+          y SUMA_MONTO (suma de AMT_APPLICATION). Alimenta los conteos y tasas.
+        - previous_application_histograma : histograma de AMT_APPLICATION por estado del
+          contrato, con intervalos por cuantiles (AMT_BIN, AMT_BIN_INF, AMT_BIN_SUP y N_MONTO).
+    """
+    print("Generando cubo de 'previous_application'...")
+
+    dimensiones = [
+        'NAME_CLIENT_TYPE',
+        'CHANNEL_TYPE',
+        'WEEKDAY_APPR_PROCESS_START',
+        'NAME_CONTRACT_STATUS',
+        'NAME_CONTRACT_TYPE'
+    ]
+    monto = df_previous_gold['AMT_APPLICATION']
+
+    cubo = (
+        df_previous_gold[dimensiones + ['AMT_APPLICATION']]
+        .assign(N_MONTO=monto.notna().astype(int))
+        .groupby(dimensiones, dropna=False)
+        .agg(
+            N_SOLICITUDES=('N_MONTO', 'size'),
+            N_MONTO=('N_MONTO', 'sum'),
+            SUMA_MONTO=('AMT_APPLICATION', 'sum')
+        )
+        .reset_index()
+    )
+
+    # El monto está muy sesgado a la derecha: con intervalos de igual ancho casi todas las
+    # solicitudes caen en los primeros. Los límites por cuantiles reparten las solicitudes
+    # de forma pareja (los cuantiles repetidos, p. ej. muchos montos en 0, se unen)
+    con_monto = df_previous_gold.loc[monto.notna(), ['NAME_CONTRACT_STATUS', 'AMT_APPLICATION']]
+    limites = np.unique(np.quantile(con_monto['AMT_APPLICATION'], np.linspace(0, 1, n_bins + 1))) if len(con_monto) else np.zeros(1)
+    n_intervalos = max(len(limites) - 1, 1)
+    amt_bin = np.clip(np.searchsorted(limites, con_monto['AMT_APPLICATION'], side='right') - 1, 0, n_intervalos - 1)
+
+    histograma = (
+        con_monto.assign(AMT_BIN=amt_bin)
+        .groupby(['NAME_CONTRACT_STATUS', 'AMT_BIN'], dropna=False)
+        .size()
+        .reset_index(name='N_MONTO')
+    )
+    histograma['AMT_BIN_INF'] = limites[histograma['AMT_BIN']]
+    histograma['AMT_BIN_SUP'] = limites[np.minimum(histograma['AMT_BIN'] + 1, len(limites) - 1)]
+
+    print(f"-> Cubo de 'previous_application' completado ({len(cubo):,} filas; histograma de {n_intervalos} intervalos).")
+    return {
+        'previous_application_cubo': cubo,
+        'previous_application_histograma': histograma,
+    }
+
+def save_pos_trajectories(df_pos_gold, directorio, checksum):
+    """
+    Guarda las trayectorias de cuotas de 'pos_cash_balance_gold' como un almacén de
+    arreglos irregulares (.npy) que el dashboard abre con memory-map: las trayectorias
+    de un cliente quedan como rebanadas contiguas y no hace falta cargar la tabla.
+
+    Archivos generados (ordenados por SK_ID_CURR, SK_ID_PREV y MONTHS_BALANCE):
+    - curr_ids.npy (int64) y curr_offsets.npy (int64): clientes y, para cada uno, el
+      rango de sus créditos en prev_ids [curr_offsets[i], curr_offsets[i + 1]).
+    - prev_ids.npy (int64) y prev_offsets.npy (int64): créditos y, para cada uno, el
+      rango de sus meses en los arreglos de valores.
+    - months_balance.npy (int16) y cnt_instalment_future.npy (float32): valores.
+    - manifiesto.json: TABLA, FILAS y CHECKSUM de la tabla gold de origen.
+
+    Parámetros:
+    ----------
+    df_pos_gold : pd.DataFrame
+        DataFrame de la tabla 'pos_cash_balance_gold'.
+        Debe contener: 'SK_ID_CURR', 'SK_ID_PREV', 'MONTHS_BALANCE', 'CNT_INSTALMENT_FUTURE'.
+
+    directorio : str o Path
+        Carpeta del almacén; se reemplaza completa.
+
+    checksum : str
+        CHECKSUM de 'pos_cash_balance_gold' en el manifiesto de gold, con el que el
+        dashboard comprueba que el almacén corresponde a la tabla vigente.
+
+    Retorna:
+    --------
+    dict
+        Cantidad de clientes, créditos y filas guardadas.
+    """
+    print("Generando trayectorias de cuotas de 'pos_cash_balance'...")
+
+    df = df_pos_gold[['SK_ID_CURR', 'SK_ID_PREV', 'MONTHS_BALANCE', 'CNT_INSTALMENT_FUTURE']].sort_values(
+        ['SK_ID_CURR', 'SK_ID_PREV', 'MONTHS_BALANCE'], kind='stable'
+    )
+    curr = df['SK_ID_CURR'].to_numpy(dtype=np.int64)
+    prev = df['SK_ID_PREV'].to_numpy(dtype=np.int64)
+
+    # Primera fila de cada crédito y primer crédito de cada cliente (ninguno si la tabla está vacía)
+    inicio_credito = np.flatnonzero(np.r_[True, (curr[1:] != curr[:-1]) | (prev[1:] != prev[:-1])][:len(df)])
+    curr_por_credito = curr[inicio_credito]
+    inicio_cliente = np.flatnonzero(np.r_[True, curr_por_credito[1:] != curr_por_credito[:-1]][:len(curr_por_credito)])
+
+    arreglos = {
+        'curr_ids': curr_por_credito[inicio_cliente],
+        'curr_offsets': np.r_[inicio_cliente, len(inicio_credito)].astype(np.int64),
+        'prev_ids': prev[inicio_credito],
+        'prev_offsets': np.r_[inicio_credito, len(df)].astype(np.int64),
+        'months_balance': df['MONTHS_BALANCE'].to_numpy(dtype=np.int16),
+        'cnt_instalment_future': df['CNT_INSTALMENT_FUTURE'].to_numpy(dtype=np.float32),
+    }
+
+    # Se escribe en una carpeta temporal y se reemplaza la anterior al terminar
+    directorio = str(directorio)
+    temporal = directorio + '.tmp'
+    shutil.rmtree(temporal, ignore_errors=True)
+    os.makedirs(temporal)
+    for nombre, arreglo in arreglos.items():
+        np.save(os.path.join(temporal, f'{nombre}.npy'), arreglo)
+    with open(os.path.join(temporal, 'manifiesto.json'), 'w') as f:
+        json.dump({'TABLA': 'pos_cash_balance_gold', 'FILAS': len(df), 'CHECKSUM': checksum}, f)
+    shutil.rmtree(directorio, ignore_errors=True)
+    os.replace(temporal, directorio)
+
+    resumen = {
+        'clientes': len(arreglos['curr_ids']),
+        'creditos': len(arreglos['prev_ids']),
+        'filas': len(df),
+    }
+    print(f"-> Trayectorias guardadas en '{directorio}' ({resumen['clientes']:,} clientes, {resumen['creditos']:,} créditos).")
+    return resumen
+
+
+def create_box_stats_tables(df, max_outliers=500, random_state=42):
+    """
+    Calcula las estadísticas de boxplot (cuartiles, bigotes, media y una muestra acotada
+    de valores atípicos) de todas las columnas numéricas en una sola pasada vectorizada,
+    para que el dashboard dibuje los boxplots sin enviar las columnas completas al navegador.
+
+    Parámetros:
+    ----------
+    df : pd.DataFrame
+        Tabla gold de la que se calculan las estadísticas.
+
+    max_outliers : int
+        Máximo de valores atípicos que se guardan por columna (muestra aleatoria).
+
+    random_state : int
+        Semilla de la muestra de valores atípicos.
+
+    Retorna:
+    --------
+    tuple(pd.DataFrame, pd.DataFrame)
+        - Estadísticas: una fila por columna numérica con COLUMNA, N, MEDIA, Q1, MEDIANA, Q3,
+          BIGOTE_INF, BIGOTE_SUP (valores extremos dentro de 1.5*IQR) y N_OUTLIERS.
+        - Valores atípicos: COLUMNA y VALOR, con a lo sumo 'max_outliers' filas por columna.
+    """
+    print("Calculando estadísticas de boxplot...")
+
+    valores = df.select_dtypes(include='number').astype(float)
+    columnas = valores.columns
+
+    # Cuartiles de todas las columnas en una sola llamada
+    cuartiles = valores.quantile([0.25, 0.5, 0.75])
+    q1, mediana, q3 = cuartiles.loc[0.25], cuartiles.loc[0.5], cuartiles.loc[0.75]
+    iqr = q3 - q1
+    lim_inf = q1 - 1.5 * iqr
+    lim_sup = q3 + 1.5 * iqr
+
+    # Máscaras por columna (los nulos no caen en ninguna de las dos)
+    dentro = valores.ge(lim_inf, axis=1) & valores.le(lim_sup, axis=1)
+    fuera = valores.lt(lim_inf, axis=1) | valores.gt(lim_sup, axis=1)
+
+    df_stats = pd.DataFrame({
+        'COLUMNA': columnas,
+        'N': valores.count().to_numpy(),
+        'MEDIA': valores.mean().to_numpy(),
+        'Q1': q1.to_numpy(),
+        'MEDIANA': mediana.to_numpy(),
+        'Q3': q3.to_numpy(),
+        'BIGOTE_INF': valores.where(dentro).min().to_numpy(),
+        'BIGOTE_SUP': valores.where(dentro).max().to_numpy(),
+        'N_OUTLIERS': fuera.sum().to_numpy()
+    })
+
+    # Muestra aleatoria acotada de valores atípicos por columna
+    filas, cols = np.nonzero(fuera.to_numpy())
+    orden = np.random.default_rng(random_state).permutation(len(filas))
+    df_outliers = (
+        pd.DataFrame({
+            'COLUMNA': columnas.to_numpy()[cols[orden]],
+            'VALOR': valores.to_numpy()[filas[orden], cols[orden]]
+        })
+        .groupby('COLUMNA', sort=False).head(max_outliers)
+        .sort_values(['COLUMNA', 'VALOR'], ignore_index=True)
+    )
+
+    print(f"-> Estadísticas de {len(columnas)} columnas y {len(df_outliers):,} valores atípicos guardados.")
+    return df_stats, df_outliers
+
+def create_category_frequency_table(df):
+    """
+    Calcula la frecuencia de cada valor de todas las columnas categóricas en una sola pasada.
+
+    Parámetros:
+    ----------
+    df : pd.DataFrame
+        Tabla gold de la que se calculan las frecuencias.
+
+    Retorna:
+    --------
+    pd.DataFrame
+        Columnas COLUMNA, VALOR y FRECUENCIA, ordenado por columna (en el orden de 'df')
+        y por frecuencia descendente. Los nulos no se cuentan.
+    """
+    columnas_categoricas = df.select_dtypes(include='object').columns
+
+    df_frecuencias = (
+        df[columnas_categoricas]
+        .melt(var_name='COLUMNA', value_name='VALOR')
+        .value_counts()
+        .reset_index(name='FRECUENCIA')
+    )
+    df_frecuencias['COLUMNA'] = pd.Categorical(df_frecuencias['COLUMNA'], categories=columnas_categoricas, ordered=True)
+    df_frecuencias = df_frecuencias.sort_values(['COLUMNA', 'FRECUENCIA'], ascending=[True, False], kind='stable', ignore_index=True)
+    df_frecuencias['COLUMNA'] = df_frecuencias['COLUMNA'].astype(str)
+    return df_frecuencias
+
+def create_profile_tables(df, max_outliers=500):
+    """
+    Genera el perfil de una tabla gold que consume el dashboard: estadísticas de boxplot
+    y conteo de valores atípicos de las columnas numéricas, y frecuencias de las categóricas.
+
+    Parámetros:
+    ----------
+    df : pd.DataFrame
+        Tabla gold a perfilar.
+
+    max_outliers : int
+        Máximo de valores atípicos guardados por columna.
+
+    Retorna:
+    --------
+    dict
+        Diccionario {sufijo: DataFrame} con 'box_stats', 'box_outliers' y 'frecuencias';
+        cada tabla se guarda en gold como '<tabla>_<sufijo>'.
+    """
+    df_stats, df_outliers = create_box_stats_tables(df, max_outliers=max_outliers)
+    return {
+        'box_stats': df_stats,
+        'box_outliers': df_outliers,
+        'frecuencias': create_category_frequency_table(df)
+    }
+
+def calculate_risk_score(df):
+    """
+    Calcula la puntuación de riesgo compuesta de cada cliente a partir de los
+    percentiles de sus métricas de atraso y utilización sobre toda la cartera.
+
+    Parámetros:
+    ----------
+    df : pd.DataFrame
+        Perfil de clientes activos (gold_active_customer_profile).
+
+    Retorna:
+    --------
+    pd.Series
+        RISK_SCORE de cada cliente, entre 0 y 1.
+    """
+    return (
+        (df['FRAC_LATE_INSTALLMENTS'].rank(pct=True) * 0.20) +
+        (df['AVG_UTILIZATION_RATIO_TDC'].rank(pct=True) * 0.30) +
+        (df['MAX_DAYS_LATE'].rank(pct=True) * 0.25) +
+        (df['MAX_DPD_TDC'].rank(pct=True) * 0.25)
+    )
+
+def create_risk_profile_table(df_profile):
+    """
+    Construye la tabla del esquema 'dashboard' que usa la página de Análisis Crediticio:
+    el perfil de cada cliente activo con su RISK_SCORE y las categorías de morosidad en
+    TDC y de antigüedad ya asignadas, para que el dashboard no las calcule al abrirse.
+
+    Parámetros:
+    ----------
+    df_profile : pd.DataFrame
+        Perfil de clientes activos (gold_active_customer_profile).
+
+    Retorna:
+    --------
+    pd.DataFrame
+        Perfil con las columnas 'RISK_SCORE', 'DPD_CATEGORY' y 'TENURE_CATEGORY'
+        (las categorías como texto; nulas fuera de los rangos definidos).
+    """
+    df_riesgo = df_profile.copy()
+    df_riesgo['RISK_SCORE'] = calculate_risk_score(df_riesgo)
+    df_riesgo['DPD_CATEGORY'] = pd.cut(
+        df_riesgo['TOTAL_MONTHS_WITH_DPD_TDC'],
+        bins=[-1, 0, 2, 5, 100],
+        labels=['Puntual (0 meses)', 'Ocasional (1-2)', 'Recurrente (3-5)', 'Crónico (5+)']
+    ).astype(object)
+    df_riesgo['TENURE_CATEGORY'] = pd.cut(
+        df_riesgo['TOTAL_LOANS_WITH_INSTALLMENTS'],
+        bins=[0, 1, 3, 5, 10, 100],
+        labels=['Nuevo (1 Préstamo)', 'Principiante (2-3)', 'Intermedio (4-5)', 'Experimentado (6-10)', 'Veterano (10+)'],
+        right=True
+    ).astype(object)
+    return df_riesgo
+
+def create_manifest_row(df, nombre_tabla):
+    """
+    Calcula la fila de manifiesto de una tabla gold: cantidad de filas y una huella del
+    contenido, que solo cambia si cambian los datos de la tabla.
+
+    Parámetros:
+    ----------
+    df : pd.DataFrame
+        Contenido de la tabla tal como se guardó en gold.
+
+    nombre_tabla : str
+        Nombre de la tabla en gold.
+
+    Retorna:
+    --------
+    dict
+        Diccionario con 'TABLA', 'FILAS' y 'CHECKSUM' (SHA-256 en hexadecimal).
+    """
+    huella = hashlib.sha256(",".join(map(str, df.columns)).encode())
+    huella.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return {'TABLA': nombre_tabla, 'FILAS': len(df), 'CHECKSUM': huella.hexdigest()}
+
+def save_gold_table(df, nombre_tabla, engine_gold, manifiesto):
+    """
+    Guarda una tabla en gold (reemplazándola) y agrega su fila a la lista del manifiesto
+    de la construcción en curso.
+
+    Parámetros:
+    ----------
+    df : pd.DataFrame
+        Tabla a guardar.
+
+    nombre_tabla : str
+        Nombre de la tabla en gold.
+
+    engine_gold : sqlalchemy.engine.Engine
+        Conexión a la base de datos gold.
+
+    manifiesto : list
+        Filas de manifiesto acumuladas; se escribe al final con 'write_gold_manifest'.
+    """
+    df.to_sql(nombre_tabla, engine_gold, if_exists='replace', index=False)
+    manifiesto.append(create_manifest_row(df, nombre_tabla))
+
+def write_gold_manifest(manifiesto, engine_gold, build_id):
+    """
+    Escribe la tabla 'gold_manifest' con una fila por tabla gold (TABLA, BUILD_ID, FILAS,
+    CHECKSUM, FECHA). El dashboard la consulta para saber qué tablas cambiaron.
+
+    Parámetros:
+    ----------
+    manifiesto : list
+        Filas acumuladas con 'save_gold_table'.
+
+    engine_gold : sqlalchemy.engine.Engine
+        Conexión a la base de datos gold.
+
+    build_id : str
+        Identificador de la construcción de gold.
+
+    Retorna:
+    --------
+    pd.DataFrame
+        El manifiesto escrito.
+    """
+    df_manifiesto = pd.DataFrame(manifiesto, columns=['TABLA', 'FILAS', 'CHECKSUM'])
+    df_manifiesto.insert(1, 'BUILD_ID', build_id)
+    df_manifiesto['FECHA'] = pd.Timestamp.now()
+    df_manifiesto.to_sql('gold_manifest', engine_gold, if_exists='replace', index=False)
+    print(f"-> Manifiesto de gold escrito ({len(df_manifiesto)} tablas, build {build_id}).")
+    return df_manifiesto
+
+def update_gold_manifest(manifiesto, engine_gold, build_id):
+    """
+    Reemplaza en 'gold_manifest' solo las filas de las tablas indicadas y conserva las demás.
+    Lo usan las construcciones parciales de gold, como las tablas con TARGET que escribe el
+    notebook de modelos, para que el dashboard detecte la nueva versión de esas tablas.
+
+    Parámetros:
+    ----------
+    manifiesto : list
+        Filas acumuladas con 'save_gold_table'.
+
+    engine_gold : sqlalchemy.engine.Engine
+        Conexión a la base de datos gold.
+
+    build_id : str
+        Identificador de la construcción parcial.
+
+    Retorna:
+    --------
+    pd.DataFrame
+        El manifiesto completo escrito.
+    """
+    df_nuevo = pd.DataFrame(manifiesto, columns=['TABLA', 'FILAS', 'CHECKSUM'])
+    df_nuevo.insert(1, 'BUILD_ID', build_id)
+    df_nuevo['FECHA'] = pd.Timestamp.now()
+    try:
+        df_actual = pd.read_sql('SELECT TABLA, BUILD_ID, FILAS, CHECKSUM, FECHA FROM gold_manifest', engine_gold)
+        df_actual['FECHA'] = pd.to_datetime(df_actual['FECHA'])  # SQLite la devuelve como texto
+        df_manifiesto = pd.concat([df_actual[~df_actual['TABLA'].isin(df_nuevo['TABLA'])], df_nuevo], ignore_index=True)
+    except Exception:
+        # Sin manifiesto previo (gold sin construir con clean_EDA.py) se escriben solo estas filas
+        df_manifiesto = df_nuevo
+    df_manifiesto.to_sql('gold_manifest', engine_gold, if_exists='replace', index=False)
+    print(f"-> Manifiesto de gold actualizado ({len(df_nuevo)} de {len(df_manifiesto)} tablas, build {build_id}).")
+    return df_manifiesto
@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'dashboard'))
+from scripts.engines import crear_engine
+from credit import COLUMNAS_CORRELACION, COLUMNAS_KPI, preparar_estadisticas_suficientes, resumir_estadisticas
+
+# Verificación de las estadísticas suficientes de la página 'Análisis Crediticio': para varias
+# posiciones de los sliders de la barra lateral compara n, medias, varianzas y la matriz de
+# correlación ensambladas desde los bins con las de pandas sobre 'credit_perfil_riesgo' filtrado.
+# Se ejecuta después de precompute_dashboard.py; termina con código 1 si algún filtro no coincide.
+DB_USER = "root"
+DB_PASS = "Tu_contraseña" # Reemplaza con tu contraseña
+DB_HOST = "localhost"
+DB_PORT = "3306"
+
+FILTROS_ALEATORIOS = 20
+TOLERANCIA = 1e-8
+
+try:
+    engine_dashboard = crear_engine("dashboard", DB_USER, DB_PASS, DB_HOST, DB_PORT)
+    print("Motor de base de datos configurado correctamente.")
+except Exception as e:
+    print(f"Error al configurar el motor de base de datos: {e}")
+    sys.exit(1)
+
+df = pd.read_sql("SELECT * FROM credit_perfil_riesgo", engine_dashboard)
+df['CON_ATRASOS'] = (df['FRAC_LATE_INSTALLMENTS'] > 0).astype(float)
+estadisticas = preparar_estadisticas_suficientes(df, "paridad")
+paso = estadisticas['paso']
+print(f"Clientes: {len(df):,} | bins: {len(estadisticas['sumas']):,} | paso del saldo: {paso:,}")
+
+# Rango completo, extremos en el borde de la rejilla y posiciones aleatorias de los sliders
+max_saldo = int(np.ceil(df['AVG_BALANCE_TDC'].max() / paso)) * paso
+max_prestamos = int(df['TOTAL_LOANS_WITH_INSTALLMENTS'].max())
+rng = np.random.default_rng(42)
+filtros = [((0, max_saldo), (0, max_prestamos)), ((paso, paso), (0, max_prestamos)), ((0, 0), (1, 1))]
+for _ in range(FILTROS_ALEATORIOS):
+    saldo = tuple(sorted(int(v) * paso for v in rng.integers(0, max_saldo // paso + 1, size=2)))
+    prestamos = tuple(sorted(int(v) for v in rng.integers(0, max_prestamos + 1, size=2)))
+    filtros.append((saldo, prestamos))
+
+columnas = COLUMNAS_CORRELACION + COLUMNAS_KPI
+errores = []
+for (saldo_min, saldo_max), (prestamos_min, prestamos_max) in filtros:
+    resumen = resumir_estadisticas(estadisticas, "paridad", ((saldo_min, saldo_max), (prestamos_min, prestamos_max)))
+    df_filtrado = df.loc[
+        df['AVG_BALANCE_TDC'].between(saldo_min, saldo_max) &
+        df['TOTAL_LOANS_WITH_INSTALLMENTS'].between(prestamos_min, prestamos_max), columnas
+    ]
+    coincide = (
+        resumen['n'] == len(df_filtrado)
+        and np.allclose(resumen['media'], df_filtrado.mean(), rtol=TOLERANCIA, atol=TOLERANCIA, equal_nan=True)
+        and np.allclose(resumen['varianza'], df_filtrado.var(), rtol=TOLERANCIA, atol=TOLERANCIA, equal_nan=True)
+        and np.allclose(resumen['correlacion'], df_filtrado.corr(), rtol=1e-6, atol=1e-6, equal_nan=True)
+    )
+    print(f"   saldo {saldo_min:>12,}-{saldo_max:<12,} préstamos {prestamos_min:>3}-{prestamos_max:<3} "
+          f"clientes {len(df_filtrado):>8,}  {'OK' if coincide else 'DIFIERE'}")
+    if not coincide:
+        errores.append((saldo_min, saldo_max, prestamos_min, prestamos_max))
+
+if errores:
+    print(f"\n{len(errores)} filtro(s) no coinciden con pandas.")
+    sys.exit(1)
+print("\nParidad verificada: las estadísticas suficientes coinciden con pandas.")
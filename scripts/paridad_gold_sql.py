@@ -0,0 +1,44 @@
+import sys
+import pandas as pd
+from sqlalchemy import text
+sys.path.append('..')
+from scripts.function import *
+from scripts.engines import crear_engine
+
+# Verificación de paridad de 'gold_active_customer_profile': construye la tabla con las
+# agregaciones en SQL (la ruta que usa clean_EDA.py) en una tabla temporal de gold y la compara,
+# columna por columna, con la versión en pandas sobre las mismas tablas de silver.
+# Se ejecuta después de clean_EDA.py; termina con código 1 si alguna columna no coincide.
+DB_USER = "root"
+DB_PASS = "Tu_contraseña" # Reemplaza con tu contraseña
+DB_HOST = "localhost"
+DB_PORT = "3306"
+
+TABLA_PARIDAD = "gold_active_customer_profile_paridad"
+
+try:
+    engine_silver = crear_engine("silver", DB_USER, DB_PASS, DB_HOST, DB_PORT)
+    engine_gold = crear_engine("gold", DB_USER, DB_PASS, DB_HOST, DB_PORT)
+    print("Motores de base de datos configurados correctamente.")
+except Exception as e:
+    print(f"Error al configurar los motores de base de datos: {e}")
+    sys.exit(1)
+
+try:
+    df_sql = create_active_customer_gold_table_sql(engine_gold, schema_silver="silver", nombre_tabla=TABLA_PARIDAD)
+finally:
+    with engine_gold.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {TABLA_PARIDAD}"))
+
+df_installments = pd.read_sql("SELECT * FROM installments_payments", engine_silver)
+df_credit_balance = pd.read_sql("SELECT * FROM credit_card_balance", engine_silver)
+df_pandas = create_active_customer_gold_table(df_inst=df_installments, df_balance=df_credit_balance)
+
+print(f"\nClientes: SQL {len(df_sql):,} | pandas {len(df_pandas):,}")
+df_comparacion = compare_active_customer_gold_tables(df_sql, df_pandas)
+print(df_comparacion.to_string(index=False))
+
+if not df_comparacion['COINCIDE'].all():
+    print("\nLa tabla construida en SQL no coincide con la de pandas.")
+    sys.exit(1)
+print("\nParidad verificada: SQL y pandas producen la misma tabla.")
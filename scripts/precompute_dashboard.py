@@ -0,0 +1,38 @@
+import pandas as pd
+import sys
+sys.path.append('..')
+from scripts.function import *
+from scripts.engines import crear_engine
+
+# Precálculo del esquema 'dashboard': se ejecuta después de construir gold (clean_EDA.py)
+# y guarda los agregados que el dashboard mostraría calculándolos sobre filas de gold.
+# Asegúrate de que la base de datos 'dashboard' exista (ver shema/shema_db.sql).
+DB_USER = "root"
+DB_PASS = "Tu_contraseña" # Reemplaza con tu contraseña
+DB_HOST = "localhost"
+DB_PORT = "3306"
+
+try:
+    engine_gold = crear_engine("gold", DB_USER, DB_PASS, DB_HOST, DB_PORT)
+    engine_dashboard = crear_engine("dashboard", DB_USER, DB_PASS, DB_HOST, DB_PORT)
+    print("Motores de base de datos configurados correctamente.")
+except Exception as e:
+    print(f"Error al configurar los motores de base de datos: {e}")
+    sys.exit(1)
+
+# El esquema 'dashboard' hereda el BUILD_ID de la construcción de gold de la que se derivó
+try:
+    BUILD_ID = str(pd.read_sql("SELECT MAX(BUILD_ID) AS BUILD_ID FROM gold_manifest", engine_gold)['BUILD_ID'].iloc[0])
+except Exception as e:
+    print(f"No se encontró gold_manifest; ejecuta primero clean_EDA.py. Error: {e}")
+    sys.exit(1)
+
+manifiesto_dashboard = []
+
+# Análisis Crediticio: perfil de riesgo con RISK_SCORE y categorías de morosidad y antigüedad
+df_active_profile = pd.read_sql("gold_active_customer_profile", engine_gold)
+df_risk_profile = create_risk_profile_table(df_active_profile)
+save_gold_table(df_risk_profile, "credit_perfil_riesgo", engine_dashboard, manifiesto_dashboard)
+print(f"-> Perfil de riesgo precalculado para {len(df_risk_profile)} clientes.")
+
+write_gold_manifest(manifiesto_dashboard, engine_dashboard, BUILD_ID)
@@ -0,0 +1,845 @@
+import argparse
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+# Generador de datos sintéticos con la forma de Home Credit Default Risk para medir el
+# pipeline de forma reproducible sin los CSV de Kaggle ni datos reales.
+# Las tablas y columnas salen de shema/shema_db.sql (esquema bronze); la cantidad de filas
+# de cada tabla por cliente, las tasas de nulos, las mezclas de STATUS y los textos vacíos
+# imitan los de los CSV originales. Se genera por bloques de clientes, así que la memoria
+# no depende de la escala, y cada bloque usa su propia semilla derivada de la global.
+#
+# Uso (desde la raíz del proyecto):
+#   python scripts/synthetic_data.py --escala 0.1 --semilla 42 --formato csv
+# Los CSV se cargan en bronze igual que los de Kaggle (data/load_to_data.sql).
+
+RUTA_ESQUEMA = Path(__file__).resolve().parent.parent / "shema" / "shema_db.sql"
+DIRECTORIO_SALIDA = Path(__file__).resolve().parent.parent / "data" / "synthetic"
+
+#Rango de escalas admitido (1 = tamaño de los CSV de Kaggle)
+ESCALA_MIN = 0.01
+ESCALA_MAX = 100
+
+#Clientes por bloque: acota la memoria y fija la secuencia aleatoria de cada bloque
+CLIENTES_POR_BLOQUE = 10_000
+
+#Clientes en escala 1 (application_train + application_test) y fracción de test
+CLIENTES_BASE = 307_511 + 48_744
+FRACCION_TEST = 48_744 / CLIENTES_BASE
+
+#Primeros identificadores, como en los datos originales
+PRIMER_SK_ID_CURR = 100_002
+PRIMER_SK_ID_PREV = 1_000_001
+PRIMER_SK_ID_BUREAU = 5_000_000
+
+#Valor centinela de "sin fecha" que usa Home Credit en las columnas DAYS_*
+DIAS_CENTINELA = 365_243
+
+TABLAS = [
+    "application_train", "application_test", "bureau", "bureau_balance",
+    "previous_application", "POS_CASH_balance", "credit_card_balance", "installments_payments",
+]
+
+# Tablas por cliente o por contrato: probabilidad de tener filas y promedio entre quienes tienen
+ABANICO = {
+    "bureau": (0.86, 5.6),                  # por cliente
+    "bureau_balance": (0.48, 33.4),         # meses por crédito de bureau
+    "previous_application": (0.95, 4.9),    # por cliente
+    "POS_CASH_balance": (0.98, 10.7),       # meses por préstamo en efectivo o de consumo aprobado
+    "credit_card_balance": (0.87, 36.8),    # meses por crédito rotativo aprobado
+    "installments_payments": (0.96, 13.6),  # cuotas por solicitud aprobada
+}
+
+# Categorías y frecuencias aproximadas de los CSV originales
+
+DIAS_SEMANA = {
+    "TUESDAY": 0.175, "WEDNESDAY": 0.169, "MONDAY": 0.165, "THURSDAY": 0.164,
+    "FRIDAY": 0.164, "SATURDAY": 0.110, "SUNDAY": 0.053,
+}
+
+CATEGORIAS_APPLICATION = {
+    "NAME_CONTRACT_TYPE": {"Cash loans": 0.905, "Revolving loans": 0.095},
+    "CODE_GENDER": {"F": 0.658, "M": 0.342, "XNA": 0.00001},
+    "FLAG_OWN_CAR": {"N": 0.66, "Y": 0.34},
+    "FLAG_OWN_REALTY": {"Y": 0.69, "N": 0.31},
+    "NAME_TYPE_SUITE": {
+        "Unaccompanied": 0.81, "Family": 0.13, "Spouse, partner": 0.037, "Children": 0.011,
+        "Other_B": 0.006, "Other_A": 0.003, "Group of people": 0.001,
+    },
+    "NAME_INCOME_TYPE": {
+        "Working": 0.516, "Commercial associate": 0.233, "Pensioner": 0.18, "State servant": 0.07,
+        "Unemployed": 0.0001, "Student": 0.0001, "Businessman": 0.00003, "Maternity leave": 0.00002,
+    },
+    "NAME_EDUCATION_TYPE": {
+        "Secondary / secondary special": 0.71, "Higher education": 0.243, "Incomplete higher": 0.033,
+        "Lower secondary": 0.012, "Academic degree": 0.0005,
+    },
+    "NAME_FAMILY_STATUS": {
+        "Married": 0.639, "Single / not married": 0.148, "Civil marriage": 0.097,
+        "Separated": 0.064, "Widow": 0.052,
+    },
+    "NAME_HOUSING_TYPE": {
+        "House / apartment": 0.887, "With parents": 0.048, "Municipal apartment": 0.036,
+        "Rented apartment": 0.016, "Office apartment": 0.009, "Co-op apartment": 0.004,
+    },
+    "OCCUPATION_TYPE": {
+        "Laborers": 0.26, "Sales staff": 0.15, "Core staff": 0.13, "Managers": 0.10, "Drivers": 0.09,
+        "High skill tech staff": 0.055, "Accountants": 0.047, "Medicine staff": 0.04,
+        "Security staff": 0.032, "Cooking staff": 0.028, "Cleaning staff": 0.022,
+        "Private service staff": 0.012, "Low-skill Laborers": 0.01, "Waiters/barmen staff": 0.006,
+        "Secretaries": 0.006, "Realty agents": 0.0035, "HR staff": 0.0027, "IT staff": 0.0025,
+    },
+    "WEEKDAY_APPR_PROCESS_START": DIAS_SEMANA,
+    "ORGANIZATION_TYPE": {
+        "Business Entity Type 3": 0.27, "Self-employed": 0.15, "Other": 0.066, "Medicine": 0.044,
+        "Business Entity Type 2": 0.042, "Government": 0.042, "School": 0.035, "Trade: type 7": 0.031,
+        "Kindergarten": 0.027, "Construction": 0.027, "Business Entity Type 1": 0.024,
+        "Transport: type 4": 0.022, "Trade: type 3": 0.014, "Industry: type 9": 0.013,
+        "Industry: type 3": 0.013, "Security": 0.013, "Housing": 0.012, "Industry: type 11": 0.011,
+        "Military": 0.011, "Bank": 0.01, "Agriculture": 0.01, "Police": 0.009, "Transport: type 2": 0.009,
+        "Postal": 0.009, "Security Ministries": 0.008, "Trade: type 2": 0.008, "Restaurant": 0.007,
+        "Services": 0.006, "University": 0.005, "Industry: type 7": 0.005, "Transport: type 3": 0.004,
+    },
+    "FONDKAPREMONT_MODE": {
+        "reg oper account": 0.76, "reg oper spec account": 0.127,
+        "not specified": 0.058, "org spec account": 0.055,
+    },
+    "HOUSETYPE_MODE": {"block of flats": 0.98, "specific housing": 0.01, "terraced house": 0.008},
+    "WALLSMATERIAL_MODE": {
+        "Panel": 0.44, "Stone, brick": 0.43, "Block": 0.061, "Wooden": 0.035,
+        "Mixed": 0.015, "Monolithic": 0.012, "Others": 0.011,
+    },
+    "EMERGENCYSTATE_MODE": {"No": 0.985, "Yes": 0.015},
+}
+
+CATEGORIAS_BUREAU = {
+    "CREDIT_ACTIVE": {"Closed": 0.629, "Active": 0.367, "Sold": 0.004, "Bad debt": 0.00001},
+    "CREDIT_CURRENCY": {"currency 1": 0.9992, "currency 2": 0.0007, "currency 3": 0.00009, "currency 4": 0.00001},
+    "CREDIT_TYPE": {
+        "Consumer credit": 0.729, "Credit card": 0.234, "Car loan": 0.016, "Mortgage": 0.011,
+        "Microloan": 0.0072, "Loan for business development": 0.0012, "Another type of loan": 0.0006,
+        "Cash loan (non-earmarked)": 0.00033, "Unknown type of loan": 0.00032,
+        "Loan for working capital replenishment": 0.00027, "Real estate loan": 0.00016,
+        "Loan for the purchase of equipment": 0.00011, "Loan for purchase of shares (margin lending)": 0.00001,
+        "Interbank credit": 0.000001, "Mobile operator loan": 0.000001,
+    },
+}
+
+# STATUS de bureau_balance en los meses que no son 'C' (cerrado): 'X' desconocido, 0 al día, 1-5 atraso
+STATUS_BUREAU = {"0": 0.55, "X": 0.42, "1": 0.018, "2": 0.002, "3": 0.0006, "4": 0.0004, "5": 0.0046}
+
+CATEGORIAS_PREVIOUS = {
+    "NAME_CONTRACT_TYPE": {"Cash loans": 0.447, "Consumer loans": 0.437, "Revolving loans": 0.116, "XNA": 0.0002},
+    "WEEKDAY_APPR_PROCESS_START": DIAS_SEMANA,
+    "FLAG_LAST_APPL_PER_CONTRACT": {"Y": 0.995, "N": 0.005},
+    "NAME_CASH_LOAN_PURPOSE": {
+        "XAP": 0.552, "XNA": 0.406, "Repairs": 0.014, "Other": 0.0093, "Urgent needs": 0.005,
+        "Buying a used car": 0.0017, "Building a house or an annex": 0.0016, "Everyday expenses": 0.0014,
+        "Medicine": 0.0013, "Payments on other loans": 0.0011, "Education": 0.001, "Journey": 0.0007,
+        "Purchase of electronic equipment": 0.0006, "Buying a new car": 0.0006,
+        "Wedding / gift / holiday": 0.0006, "Buying a home": 0.0005, "Car repairs": 0.0005,
+        "Furniture": 0.0005, "Buying a holiday home / land": 0.0003, "Business development": 0.0003,
+        "Gasification / water supply": 0.0002, "Buying a garage": 0.0001, "Hobby": 0.00003,
+        "Money for a third person": 0.00001, "Refusal to name the goal": 0.00001,
+    },
+    "NAME_CONTRACT_STATUS": {"Approved": 0.621, "Canceled": 0.189, "Refused": 0.174, "Unused offer": 0.016},
+    "NAME_PAYMENT_TYPE": {
+        "Cash through the bank": 0.619, "XNA": 0.376, "Non-cash from your account": 0.005,
+        "Cashless from the account of the employer": 0.0006,
+    },
+    "NAME_TYPE_SUITE": {
+        "Unaccompanied": 0.59, "Family": 0.25, "Spouse, partner": 0.079, "Children": 0.037,
+        "Other_B": 0.021, "Other_A": 0.011, "Group of people": 0.002,
+    },
+    "NAME_CLIENT_TYPE": {"Repeater": 0.737, "New": 0.18, "Refreshed": 0.081, "XNA": 0.001},
+    "NAME_GOODS_CATEGORY": {
+        "XNA": 0.569, "Mobile": 0.134, "Consumer Electronics": 0.073, "Computers": 0.063,
+        "Audio/Video": 0.06, "Furniture": 0.032, "Photo / Cinema Equipment": 0.015,
+        "Construction Materials": 0.015, "Clothing and Accessories": 0.014, "Auto Accessories": 0.0044,
+        "Jewelry": 0.0038, "Homewares": 0.003, "Medical Supplies": 0.0023, "Vehicles": 0.002,
+        "Sport and Leisure": 0.0018, "Gardening": 0.0016, "Other": 0.0016, "Office Appliances": 0.0014,
+        "Tourism": 0.001, "Medicine": 0.001, "Direct Sales": 0.0003, "Fitness": 0.0001,
+        "Additional Service": 0.0001, "Education": 0.0001, "Weapon": 0.00004, "Insurance": 0.00004,
+    },
+    "NAME_PORTFOLIO": {"POS": 0.414, "Cash": 0.276, "XNA": 0.222, "Cards": 0.086, "Cars": 0.0003},
+    "NAME_PRODUCT_TYPE": {"XNA": 0.637, "x-sell": 0.274, "walk-in": 0.09},
+    "CHANNEL_TYPE": {
+        "Credit and cash offices": 0.43, "Country-wide": 0.296, "Stone": 0.127, "Regional / Local": 0.065,
+        "Contact center": 0.043, "AP+ (Cash loan)": 0.034, "Channel of corporate sales": 0.0043,
+        "Car dealer": 0.0003,
+    },
+    "NAME_SELLER_INDUSTRY": {
+        "XNA": 0.512, "Consumer electronics": 0.239, "Connectivity": 0.165, "Furniture": 0.035,
+        "Construction": 0.018, "Clothing": 0.014, "Industry": 0.012, "Auto technology": 0.003,
+        "Jewelry": 0.0016, "MLM partners": 0.0007, "Tourism": 0.0003,
+    },
+    "NAME_YIELD_GROUP": {"XNA": 0.31, "middle": 0.23, "high": 0.21, "low_normal": 0.19, "low_action": 0.056},
+    "PRODUCT_COMBINATION": {
+        "Cash": 0.17, "POS household with interest": 0.158, "POS mobile with interest": 0.132,
+        "Cash X-Sell: middle": 0.086, "Cash X-Sell: low": 0.078, "Card Street": 0.068,
+        "POS industry with interest": 0.059, "POS household without interest": 0.05, "Card X-Sell": 0.048,
+        "Cash Street: high": 0.036, "Cash X-Sell: high": 0.035, "Cash Street: middle": 0.021,
+        "Cash Street: low": 0.02, "POS mobile without interest": 0.014, "POS other with interest": 0.014,
+        "POS industry without interest": 0.0075, "POS others without interest": 0.0015,
+    },
+}
+
+# Motivo de rechazo de las solicitudes rechazadas (las demás tienen 'XAP' o 'CLIENT')
+MOTIVOS_RECHAZO = {"HC": 0.55, "LIMIT": 0.18, "SCO": 0.12, "SCOFR": 0.04, "XNA": 0.02, "VERIF": 0.01, "SYSTEM": 0.002}
+
+ESTADOS_POS = {
+    "Returned to the store": 0.4, "Demand": 0.3, "Approved": 0.2,
+    "Amortized debt": 0.05, "Canceled": 0.03, "XNA": 0.02,
+}
+ESTADOS_TARJETA = {"Active": 0.963, "Completed": 0.033, "Signed": 0.003, "Demand": 0.0003, "Sent proposal": 0.0001}
+
+# Proporción de nulos (textos vacíos en las columnas TEXT) por columna, como en los CSV originales
+NULOS = {
+    "application": {
+        "AMT_ANNUITY": 0.00004, "AMT_GOODS_PRICE": 0.0009, "NAME_TYPE_SUITE": 0.0042,
+        "OCCUPATION_TYPE": 0.16,  # más los pensionados: ~31% en total
+        "CNT_FAM_MEMBERS": 0.00001, "EXT_SOURCE_1": 0.564,
+        "EXT_SOURCE_2": 0.0021, "EXT_SOURCE_3": 0.198, "FONDKAPREMONT_MODE": 0.684,
+        "HOUSETYPE_MODE": 0.502, "WALLSMATERIAL_MODE": 0.508, "EMERGENCYSTATE_MODE": 0.474,
+        "OBS_30_CNT_SOCIAL_CIRCLE": 0.0033, "DEF_30_CNT_SOCIAL_CIRCLE": 0.0033,
+        "OBS_60_CNT_SOCIAL_CIRCLE": 0.0033, "DEF_60_CNT_SOCIAL_CIRCLE": 0.0033,
+        "DAYS_LAST_PHONE_CHANGE": 0.000003,
+    },
+    "bureau": {
+        "DAYS_CREDIT_ENDDATE": 0.0615, "AMT_CREDIT_MAX_OVERDUE": 0.655, "AMT_CREDIT_SUM": 0.000008,
+        "AMT_CREDIT_SUM_DEBT": 0.15, "AMT_CREDIT_SUM_LIMIT": 0.345, "AMT_ANNUITY": 0.714,
+    },
+    "previous_application": {
+        "AMT_CREDIT": 0.0000006, "NAME_TYPE_SUITE": 0.491, "PRODUCT_COMBINATION": 0.0002,
+    },
+    "POS_CASH_balance": {"CNT_INSTALMENT": 0.0026, "CNT_INSTALMENT_FUTURE": 0.0026},
+    "installments_payments": {},
+    "credit_card_balance": {},
+}
+
+# Columnas de la vivienda (*_AVG, *_MODE, *_MEDI): nulas juntas en ~48% de los clientes y,
+# algunas, con nulos adicionales hasta su tasa original
+NULOS_VIVIENDA_BASE = 0.48
+NULOS_VIVIENDA = {
+    "COMMONAREA": 0.70, "NONLIVINGAPARTMENTS": 0.69, "LIVINGAPARTMENTS": 0.68, "FLOORSMIN": 0.68,
+    "YEARS_BUILD": 0.665, "LANDAREA": 0.59, "BASEMENTAREA": 0.585, "NONLIVINGAREA": 0.55,
+    "ELEVATORS": 0.53, "APARTMENTS": 0.51, "ENTRANCES": 0.50, "LIVINGAREA": 0.50, "FLOORSMAX": 0.50,
+}
+
+# Frecuencia de los FLAG_DOCUMENT_* (las no listadas son casi siempre 0)
+TASAS_DOCUMENTOS = {
+    "FLAG_DOCUMENT_3": 0.71, "FLAG_DOCUMENT_6": 0.088, "FLAG_DOCUMENT_8": 0.081,
+    "FLAG_DOCUMENT_5": 0.015, "FLAG_DOCUMENT_16": 0.0099, "FLAG_DOCUMENT_18": 0.008,
+    "FLAG_DOCUMENT_11": 0.004, "FLAG_DOCUMENT_9": 0.004, "FLAG_DOCUMENT_13": 0.0035,
+    "FLAG_DOCUMENT_14": 0.0029, "FLAG_DOCUMENT_15": 0.0012,
+}
+
+
+def leer_esquema(ruta=RUTA_ESQUEMA):
+    """
+    Lee las sentencias CREATE TABLE de shema_db.sql (incluidas las de la forma
+    'CREATE TABLE x LIKE y').
+
+    Parámetros:
+    ----------
+    ruta : str o Path
+        Archivo SQL con el esquema bronze.
+
+    Retorna:
+    --------
+    dict
+        Nombre de tabla -> lista de (columna, tipo SQL en mayúsculas), en el orden del archivo.
+    """
+    sql = Path(ruta).read_text(encoding="utf-8")
+    esquema = {}
+    for nombre, cuerpo in re.findall(r"CREATE TABLE\s+(\w+)\s*\((.*?)\);", sql, flags=re.S):
+        columnas = []
+        for linea in cuerpo.splitlines():
+            partes = linea.strip().rstrip(",").split()
+            if len(partes) >= 2:
+                columnas.append((partes[0], partes[1].upper()))
+        esquema[nombre] = columnas
+    for nombre, original in re.findall(r"CREATE TABLE\s+(\w+)\s+LIKE\s+(\w+)\s*;", sql):
+        esquema[nombre] = list(esquema[original])
+    return esquema
+
+
+# --- Utilidades aleatorias ---
+
+def _categoria(rng, n, frecuencias):
+    """Muestra n valores de un diccionario valor -> frecuencia (se normaliza)."""
+    valores = np.array(list(frecuencias.keys()), dtype=object)
+    p = np.array(list(frecuencias.values()), dtype=float)
+    return valores[rng.choice(len(valores), size=n, p=p / p.sum())]
+
+
+def _lognormal(rng, n, mediana, sigma):
+    return np.round(mediana * np.exp(sigma * rng.standard_normal(n)), 2)
+
+
+def _bandera(rng, n, p):
+    return (rng.random(n) < p).astype(np.int64)
+
+
+def _anular(rng, valores, tasa):
+    """Vuelve nulos (NaN o None) una proporción 'tasa' de los valores."""
+    mascara = rng.random(len(valores)) < tasa
+    if not mascara.any():
+        return valores
+    valores = valores.astype(object) if valores.dtype == object else valores.astype(float)
+    valores[mascara] = None if valores.dtype == object else np.nan
+    return valores
+
+
+def _conteos(rng, n, probabilidad, media, maximo=None):
+    """
+    Cantidad de filas hijas por fila padre: 0 con probabilidad 1 - 'probabilidad' y, si no,
+    1 + binomial negativa con la media indicada (cola larga como en los datos originales).
+    """
+    exito = 2 / (2 + max(media - 1, 1e-9))
+    conteos = 1 + rng.negative_binomial(2, exito, size=n)
+    conteos[rng.random(n) >= probabilidad] = 0
+    if maximo is not None:
+        conteos = np.minimum(conteos, maximo)
+    return conteos
+
+
+def _expandir(conteos):
+    """Índice del padre y posición (0, 1, ...) de cada fila hija dados los conteos por padre."""
+    padre = np.repeat(np.arange(len(conteos)), conteos)
+    inicio = np.repeat(np.cumsum(conteos) - conteos, conteos)
+    return padre, np.arange(len(padre)) - inicio
+
+
+def _columna_por_defecto(rng, nombre, n):
+    """Valores para una columna del esquema sin generador propio, según su nombre."""
+    if nombre.startswith("FLAG_DOCUMENT_"):
+        return _bandera(rng, n, TASAS_DOCUMENTOS.get(nombre, 0.0005))
+    if nombre.startswith("YEARS_BEGINEXPLUATATION"):
+        return np.round(rng.uniform(0.95, 1.0, n), 4)
+    if nombre.startswith("YEARS_BUILD"):
+        return np.round(rng.beta(6, 2, n), 4)
+    if nombre.endswith(("_AVG", "_MODE", "_MEDI")):
+        return np.round(rng.beta(1.5, 8, n), 4)
+    if nombre.startswith("FLAG_"):
+        return _bandera(rng, n, 0.1)
+    if nombre.startswith("DAYS_"):
+        return -rng.integers(0, 3000, n)
+    if nombre.startswith("AMT_"):
+        return _lognormal(rng, n, 100_000, 1.0)
+    if nombre.startswith("CNT_"):
+        return rng.poisson(1.0, n)
+    return rng.integers(0, 2, n)
+
+
+def _completar(rng, datos, columnas, n):
+    """
+    Ordena las columnas como en el esquema y genera por nombre las que no tienen generador
+    propio, de modo que una columna nueva en shema_db.sql aparezca sin tocar este script.
+    """
+    sobrantes = set(datos) - {nombre for nombre, _ in columnas}
+    if sobrantes:
+        raise ValueError(f"Columnas generadas que no están en el esquema: {sorted(sobrantes)}")
+    return pd.DataFrame({
+        nombre: datos[nombre] if nombre in datos else _columna_por_defecto(rng, nombre, n)
+        for nombre, _ in columnas
+    })
+
+
+def _aplicar_nulos(rng, df, tasas):
+    for columna, tasa in tasas.items():
+        if columna in df:
+            df[columna] = _anular(rng, df[columna].to_numpy(), tasa)
+    return df
+
+
+# --- Generadores por tabla ---
+
+def generar_application(rng, ids, columnas):
+    """Filas de application_train/test para los SK_ID_CURR dados."""
+    n = len(ids)
+    d = {"SK_ID_CURR": ids, "TARGET": _bandera(rng, n, 0.0807)}
+    for columna, frecuencias in CATEGORIAS_APPLICATION.items():
+        d[columna] = _categoria(rng, n, frecuencias)
+
+    d["CNT_CHILDREN"] = _categoria(rng, n, {0: 0.70, 1: 0.20, 2: 0.087, 3: 0.012, 4: 0.001}).astype(np.int64)
+    d["AMT_INCOME_TOTAL"] = _lognormal(rng, n, 147_150, 0.5)
+    d["AMT_CREDIT"] = _lognormal(rng, n, 513_531, 0.6)
+    d["AMT_ANNUITY"] = np.round(d["AMT_CREDIT"] / rng.uniform(10, 40, n), 1)
+    d["AMT_GOODS_PRICE"] = np.round(d["AMT_CREDIT"] * rng.uniform(0.8, 1.0, n), -3)
+    d["REGION_POPULATION_RELATIVE"] = np.round(rng.uniform(0.00029, 0.0725, n), 6)
+    d["DAYS_BIRTH"] = -rng.integers(7489, 25230, n)
+    d["DAYS_EMPLOYED"] = -rng.integers(0, 17913, n)
+    d["DAYS_REGISTRATION"] = -rng.integers(0, 24673, n).astype(float)
+    d["DAYS_ID_PUBLISH"] = -rng.integers(0, 7198, n)
+    d["OWN_CAR_AGE"] = rng.integers(0, 66, n).astype(float)
+    d["FLAG_MOBIL"] = _bandera(rng, n, 0.99999)
+    d["FLAG_EMP_PHONE"] = _bandera(rng, n, 0.82)
+    d["FLAG_WORK_PHONE"] = _bandera(rng, n, 0.2)
+    d["FLAG_CONT_MOBILE"] = _bandera(rng, n, 0.998).astype(float)
+    d["FLAG_PHONE"] = _bandera(rng, n, 0.28)
+    d["FLAG_EMAIL"] = _bandera(rng, n, 0.057)
+    d["CNT_FAM_MEMBERS"] = (d["CNT_CHILDREN"] + 1 + (d["NAME_FAMILY_STATUS"] == "Married")).astype(float)
+    d["REGION_RATING_CLIENT"] = _categoria(rng, n, {1: 0.105, 2: 0.738, 3: 0.157}).astype(np.int64)
+    d["REGION_RATING_CLIENT_W_CITY"] = np.clip(d["REGION_RATING_CLIENT"] + rng.choice([-1, 0, 0, 0, 0, 1], n), 1, 3)
+    d["HOUR_APPR_PROCESS_START"] = np.clip(np.round(rng.normal(12, 3.3, n)), 0, 23).astype(np.int64)
+    for columna, p in [
+        ("REG_REGION_NOT_LIVE_REGION", 0.015), ("REG_REGION_NOT_WORK_REGION", 0.05),
+        ("LIVE_REGION_NOT_WORK_REGION", 0.04), ("REG_CITY_NOT_LIVE_CITY", 0.078),
+        ("REG_CITY_NOT_WORK_CITY", 0.23), ("LIVE_CITY_NOT_WORK_CITY", 0.18),
+    ]:
+        d[columna] = _bandera(rng, n, p)
+    d["EXT_SOURCE_1"] = np.round(rng.beta(3, 3, n), 6)
+    d["EXT_SOURCE_2"] = np.round(rng.beta(4, 2.5, n), 6)
+    d["EXT_SOURCE_3"] = np.round(rng.beta(3.5, 2.5, n), 6)
+    d["OBS_30_CNT_SOCIAL_CIRCLE"] = rng.poisson(1.4, n).astype(float)
+    d["DEF_30_CNT_SOCIAL_CIRCLE"] = rng.poisson(0.14, n).astype(float)
+    d["OBS_60_CNT_SOCIAL_CIRCLE"] = d["OBS_30_CNT_SOCIAL_CIRCLE"] + rng.poisson(0.01, n)
+    d["DEF_60_CNT_SOCIAL_CIRCLE"] = np.minimum(d["DEF_30_CNT_SOCIAL_CIRCLE"], rng.poisson(0.1, n))
+    d["DAYS_LAST_PHONE_CHANGE"] = np.where(rng.random(n) < 0.12, 0, -rng.integers(0, 4293, n)).astype(float)
+    for columna, media in [
+        ("AMT_REQ_CREDIT_BUREAU_HOUR", 0.006), ("AMT_REQ_CREDIT_BUREAU_DAY", 0.007),
+        ("AMT_REQ_CREDIT_BUREAU_WEEK", 0.034), ("AMT_REQ_CREDIT_BUREAU_MON", 0.27),
+        ("AMT_REQ_CREDIT_BUREAU_QRT", 0.27), ("AMT_REQ_CREDIT_BUREAU_YEAR", 1.9),
+    ]:
+        d[columna] = _anular(rng, rng.poisson(media, n).astype(float), 0.135)
+
+    # Reglas entre columnas de los datos originales
+    pensionado = np.isin(d["NAME_INCOME_TYPE"], ["Pensioner", "Unemployed"])
+    d["DAYS_EMPLOYED"] = np.where(pensionado, DIAS_CENTINELA, d["DAYS_EMPLOYED"])
+    d["ORGANIZATION_TYPE"] = np.where(pensionado, "XNA", d["ORGANIZATION_TYPE"])
+    d["OCCUPATION_TYPE"] = np.where(pensionado, None, d["OCCUPATION_TYPE"])
+    d["FLAG_EMP_PHONE"] = np.where(pensionado, 0, d["FLAG_EMP_PHONE"])
+    d["OWN_CAR_AGE"] = np.where(d["FLAG_OWN_CAR"] == "Y", d["OWN_CAR_AGE"], np.nan)
+    d["AMT_GOODS_PRICE"] = np.where(
+        (d["NAME_CONTRACT_TYPE"] == "Revolving loans") & (rng.random(n) < 0.01), np.nan, d["AMT_GOODS_PRICE"]
+    )
+
+    df = _completar(rng, d, columnas, n)
+
+    # Columnas de la vivienda: nulas juntas para buena parte de los clientes
+    sin_vivienda = rng.random(n) < NULOS_VIVIENDA_BASE
+    for columna in df.columns:
+        if columna.endswith(("_AVG", "_MODE", "_MEDI")) and columna not in CATEGORIAS_APPLICATION:
+            prefijo = columna.rsplit("_", 1)[0]
+            extra = (NULOS_VIVIENDA.get(prefijo, NULOS_VIVIENDA_BASE) - NULOS_VIVIENDA_BASE) / (1 - NULOS_VIVIENDA_BASE)
+            df.loc[sin_vivienda | (rng.random(n) < extra), columna] = np.nan
+    return _aplicar_nulos(rng, df, NULOS["application"])
+
+
+def generar_bureau(rng, ids_curr, primer_id, columnas):
+    """Créditos en otras entidades (bureau) de los clientes dados; devuelve (df, próximo SK_ID_BUREAU)."""
+    probabilidad, media = ABANICO["bureau"]
+    padre, _ = _expandir(_conteos(rng, len(ids_curr), probabilidad, media, maximo=116))
+    n = len(padre)
+    d = {
+        "SK_ID_BUREAU": primer_id + np.arange(n),
+        "SK_ID_CURR": ids_curr[padre],
+    }
+    for columna, frecuencias in CATEGORIAS_BUREAU.items():
+        d[columna] = _categoria(rng, n, frecuencias)
+
+    activo = d["CREDIT_ACTIVE"] == "Active"
+    d["DAYS_CREDIT"] = -rng.integers(0, 2923, n)
+    d["CREDIT_DAY_OVERDUE"] = np.where(rng.random(n) < 0.0025, rng.integers(1, 2793, n), 0)
+    d["DAYS_CREDIT_ENDDATE"] = (d["DAYS_CREDIT"] + rng.integers(0, 3650, n)).astype(float)
+    # Fechas posteriores a la apertura y no futuras: entre DAYS_CREDIT y 0
+    d["DAYS_ENDDATE_FACT"] = np.where(
+        activo, np.nan, d["DAYS_CREDIT"] - np.floor(rng.random(n) * d["DAYS_CREDIT"])
+    ).astype(float)
+    d["AMT_CREDIT_MAX_OVERDUE"] = np.where(rng.random(n) < 0.75, 0.0, _lognormal(rng, n, 5_000, 1.5))
+    d["CNT_CREDIT_PROLONG"] = _categoria(rng, n, {0: 0.9947, 1: 0.005, 2: 0.0003}).astype(np.int64)
+    d["AMT_CREDIT_SUM"] = _lognormal(rng, n, 125_000, 1.1)
+    d["AMT_CREDIT_SUM_DEBT"] = np.where(activo, np.round(d["AMT_CREDIT_SUM"] * rng.random(n), 2), 0.0)
+    d["AMT_CREDIT_SUM_LIMIT"] = np.where(
+        (d["CREDIT_TYPE"] == "Credit card") & (rng.random(n) < 0.3), _lognormal(rng, n, 45_000, 1.0), 0.0
+    )
+    d["AMT_CREDIT_SUM_OVERDUE"] = np.where(rng.random(n) < 0.0025, _lognormal(rng, n, 10_000, 1.5), 0.0)
+    d["DAYS_CREDIT_UPDATE"] = (d["DAYS_CREDIT"] - np.floor(rng.random(n) * d["DAYS_CREDIT"])).astype(np.int64)
+    d["AMT_ANNUITY"] = np.where(rng.random(n) < 0.7, 0.0, _lognormal(rng, n, 13_500, 1.0))
+
+    df = _aplicar_nulos(rng, _completar(rng, d, columnas, n), NULOS["bureau"])
+    return df, primer_id + n
+
+
+def generar_bureau_balance(rng, df_bureau, columnas):
+    """Historia mensual (STATUS) de los créditos de bureau: 0 es el mes actual y los negativos, los anteriores."""
+    probabilidad, media = ABANICO["bureau_balance"]
+    conteos = _conteos(rng, len(df_bureau), probabilidad, media, maximo=97)
+    padre, mes = _expandir(conteos)
+
+    # Los créditos cerrados tienen 'C' en los meses más recientes
+    cerrado = (df_bureau["CREDIT_ACTIVE"] == "Closed").to_numpy()
+    meses_cerrado = np.where(cerrado, conteos - rng.integers(0, conteos // 2 + 1), 0)
+    status = np.where(mes < meses_cerrado[padre], "C", _categoria(rng, len(padre), STATUS_BUREAU))
+
+    d = {
+        "SK_ID_BUREAU": df_bureau["SK_ID_BUREAU"].to_numpy()[padre],
+        "MONTHS_BALANCE": -mes,
+        "STATUS": status.astype(object),
+    }
+    return _completar(rng, d, columnas, len(padre))
+
+
+def generar_previous_application(rng, ids_curr, primer_id, columnas):
+    """Solicitudes anteriores en Home Credit de los clientes dados; devuelve (df, próximo SK_ID_PREV)."""
+    probabilidad, media = ABANICO["previous_application"]
+    padre, _ = _expandir(_conteos(rng, len(ids_curr), probabilidad, media, maximo=77))
+    n = len(padre)
+    d = {
+        "SK_ID_PREV": primer_id + rng.permutation(n),
+        "SK_ID_CURR": ids_curr[padre],
+    }
+    for columna, frecuencias in CATEGORIAS_PREVIOUS.items():
+        d[columna] = _categoria(rng, n, frecuencias)
+
+    aprobado = d["NAME_CONTRACT_STATUS"] == "Approved"
+    cuotas = _categoria(rng, n, {12: 0.3, 6: 0.2, 0: 0.14, 10: 0.09, 24: 0.08, 18: 0.05, 36: 0.04,
+                                 60: 0.03, 48: 0.03, 30: 0.02, 8: 0.01, 4: 0.01}).astype(float)
+    monto = np.where(rng.random(n) < 0.22, 0.0, _lognormal(rng, n, 71_000, 1.3))
+    d["AMT_APPLICATION"] = monto
+    d["AMT_CREDIT"] = np.round(monto * rng.uniform(0.9, 1.2, n), 2)
+    d["AMT_ANNUITY"] = np.where(
+        (monto > 0) & (cuotas > 0), np.round(d["AMT_CREDIT"] / np.maximum(cuotas, 1) * 1.1, 3), np.nan
+    )
+    d["CNT_PAYMENT"] = np.where(np.isnan(d["AMT_ANNUITY"]) & (rng.random(n) < 0.9), np.nan, cuotas)
+    con_pie = (d["NAME_CONTRACT_TYPE"] == "Consumer loans") & (rng.random(n) < 0.9)
+    pie = np.where(rng.random(n) < 0.6, 0.0, np.round(monto * rng.uniform(0, 0.3, n), 2))
+    d["AMT_DOWN_PAYMENT"] = np.where(con_pie, pie, np.nan)
+    d["RATE_DOWN_PAYMENT"] = np.where(con_pie, np.round(pie / np.maximum(monto, 1), 6), np.nan)
+    d["AMT_GOODS_PRICE"] = np.where(monto > 0, np.round(monto), np.nan)
+    d["HOUR_APPR_PROCESS_START"] = np.clip(np.round(rng.normal(12.5, 3.3, n)), 0, 23).astype(np.int64)
+    d["NFLAG_LAST_APPL_IN_DAY"] = _bandera(rng, n, 0.996)
+    con_tasa = rng.random(n) < 0.0036
+    d["RATE_INTEREST_PRIMARY"] = np.where(con_tasa, np.round(rng.uniform(0.03, 1.0, n), 6), np.nan)
+    d["RATE_INTEREST_PRIVILEGED"] = np.where(con_tasa, np.round(rng.uniform(0.37, 1.0, n), 6), np.nan)
+    d["DAYS_DECISION"] = -rng.integers(1, 2923, n)
+    d["CODE_REJECT_REASON"] = np.where(
+        d["NAME_CONTRACT_STATUS"] == "Refused", _categoria(rng, n, MOTIVOS_RECHAZO),
+        np.where(d["NAME_CONTRACT_STATUS"] == "Unused offer", "CLIENT", "XAP"),
+    ).astype(object)
+    d["SELLERPLACE_AREA"] = np.where(rng.random(n) < 0.45, -1, np.round(np.exp(rng.normal(4, 1.5, n)))).astype(np.int64)
+
+    # Fechas del contrato: solo en las aprobadas, con el centinela 365243 frecuente
+    decision = d["DAYS_DECISION"]
+    primer_pago = decision + rng.integers(0, 60, n)
+    ultimo_pago = primer_pago + 30 * np.maximum(cuotas, 1)
+    d["DAYS_FIRST_DRAWING"] = np.where(rng.random(n) < 0.96, DIAS_CENTINELA, decision + rng.integers(0, 30, n))
+    d["DAYS_FIRST_DUE"] = np.where(rng.random(n) < 0.025, DIAS_CENTINELA, primer_pago)
+    d["DAYS_LAST_DUE_1ST_VERSION"] = np.where(rng.random(n) < 0.06, DIAS_CENTINELA, ultimo_pago)
+    d["DAYS_LAST_DUE"] = np.where(rng.random(n) < 0.53, DIAS_CENTINELA, ultimo_pago)
+    d["DAYS_TERMINATION"] = np.where(rng.random(n) < 0.56, DIAS_CENTINELA, ultimo_pago + rng.integers(0, 10, n))
+    d["NFLAG_INSURED_ON_APPROVAL"] = _bandera(rng, n, 0.33)
+    for columna in ["DAYS_FIRST_DRAWING", "DAYS_FIRST_DUE", "DAYS_LAST_DUE_1ST_VERSION",
+                    "DAYS_LAST_DUE", "DAYS_TERMINATION", "NFLAG_INSURED_ON_APPROVAL"]:
+        d[columna] = np.where(aprobado, d[columna], np.nan)
+
+    df = _aplicar_nulos(rng, _completar(rng, d, columnas, n), NULOS["previous_application"])
+    return df, primer_id + n
+
+
+def generar_pos_cash_balance(rng, df_previous, columnas):
+    """Meses de los préstamos en efectivo y de consumo aprobados (POS_CASH_balance)."""
+    elegibles = df_previous[
+        (df_previous["NAME_CONTRACT_STATUS"] == "Approved")
+        & df_previous["NAME_CONTRACT_TYPE"].isin(["Cash loans", "Consumer loans"])
+    ]
+    probabilidad, media = ABANICO["POS_CASH_balance"]
+    conteos = _conteos(rng, len(elegibles), probabilidad, media, maximo=96)
+    padre, k = _expandir(conteos)
+    n = len(padre)
+
+    # Cada contrato cubre meses consecutivos que terminan entre -1 y -96
+    fin = -rng.integers(1, 97 - conteos + 1) if len(conteos) else conteos
+    cuotas_contrato = elegibles["CNT_PAYMENT"].fillna(0).to_numpy()
+    cuotas_contrato = np.where(cuotas_contrato > 0, cuotas_contrato, np.maximum(conteos, 1)).astype(float)
+    cuotas = cuotas_contrato[padre]
+    futuras = np.maximum(cuotas - k, 0)
+
+    estado = np.full(n, "Active", dtype=object)
+    ultimo = k == conteos[padre] - 1
+    estado[ultimo & (futuras <= 1) & (rng.random(n) < 0.8)] = "Completed"
+    estado[(k == 0) & (rng.random(n) < 0.1)] = "Signed"
+    otros = rng.random(n) < 0.003
+    estado[otros] = _categoria(rng, int(otros.sum()), ESTADOS_POS)
+
+    atraso = np.where(rng.random(n) < 0.028, rng.geometric(0.05, n), 0)
+    d = {
+        "SK_ID_PREV": elegibles["SK_ID_PREV"].to_numpy()[padre],
+        "SK_ID_CURR": elegibles["SK_ID_CURR"].to_numpy()[padre],
+        "MONTHS_BALANCE": (fin - conteos + 1)[padre] + k,
+        "CNT_INSTALMENT": cuotas,
+        "CNT_INSTALMENT_FUTURE": futuras,
+        "NAME_CONTRACT_STATUS": estado,
+        "SK_DPD": atraso,
+        "SK_DPD_DEF": np.where(rng.random(n) < 0.3, atraso, 0),
+    }
+    return _aplicar_nulos(rng, _completar(rng, d, columnas, n), NULOS["POS_CASH_balance"])
+
+
+def generar_credit_card_balance(rng, df_previous, columnas):
+    """Meses de los créditos rotativos aprobados (credit_card_balance)."""
+    elegibles = df_previous[
+        (df_previous["NAME_CONTRACT_STATUS"] == "Approved")
+        & (df_previous["NAME_CONTRACT_TYPE"] == "Revolving loans")
+    ]
+    probabilidad, media = ABANICO["credit_card_balance"]
+    conteos = _conteos(rng, len(elegibles), probabilidad, media, maximo=96)
+    padre, k = _expandir(conteos)
+    n = len(padre)
+
+    fin = -rng.integers(1, 97 - conteos + 1) if len(conteos) else conteos
+    limite = _categoria(rng, len(elegibles), {
+        0: 0.06, 45_000: 0.25, 90_000: 0.12, 135_000: 0.12, 180_000: 0.1,
+        225_000: 0.1, 270_000: 0.1, 450_000: 0.07, 675_000: 0.05, 900_000: 0.03,
+    }).astype(np.int64)[padre]
+    uso = np.where(rng.random(n) < 0.5, 0.0, rng.beta(0.7, 1.5, n))
+    saldo = np.round(limite * uso, 3)
+
+    retiros_atm = np.where(rng.random(n) < 0.85, 0.0, 4_500.0 * rng.integers(1, 20, n))
+    retiros_pos = np.where(rng.random(n) < 0.7, 0.0, _lognormal(rng, n, 15_000, 1.0))
+    retiros_otros = np.where(rng.random(n) < 0.99, 0.0, _lognormal(rng, n, 20_000, 1.0))
+    cantidad_pos = np.where(retiros_pos > 0, rng.integers(1, 10, n), 0)
+    minimo = np.round(saldo * 0.05, 3)
+    pago = np.round(minimo * rng.uniform(1, 3, n), 3)
+
+    # Sin movimientos informados: los retiros y sus cantidades son nulos juntos
+    sin_retiros = rng.random(n) < 0.195
+    sin_minimo = rng.random(n) < 0.0795
+    sin_pago = sin_retiros | (rng.random(n) < 0.006)
+
+    d = {
+        "SK_ID_PREV": elegibles["SK_ID_PREV"].to_numpy()[padre],
+        "SK_ID_CURR": elegibles["SK_ID_CURR"].to_numpy()[padre],
+        "MONTHS_BALANCE": (fin - conteos + 1)[padre] + k,
+        "AMT_BALANCE": saldo,
+        "AMT_CREDIT_LIMIT_ACTUAL": limite,
+        "AMT_DRAWINGS_ATM_CURRENT": np.where(sin_retiros, np.nan, retiros_atm),
+        "AMT_DRAWINGS_CURRENT": retiros_atm + retiros_pos + retiros_otros,
+        "AMT_DRAWINGS_OTHER_CURRENT": np.where(sin_retiros, np.nan, retiros_otros),
+        "AMT_DRAWINGS_POS_CURRENT": np.where(sin_retiros, np.nan, retiros_pos),
+        "AMT_INST_MIN_REGULARITY": np.where(sin_minimo, np.nan, minimo),
+        "AMT_PAYMENT_CURRENT": np.where(sin_pago, np.nan, pago),
+        "AMT_PAYMENT_TOTAL_CURRENT": np.where(sin_pago, 0.0, pago),
+        "AMT_RECEIVABLE_PRINCIPAL": np.round(saldo * 0.95, 3),
+        "AMT_RECIVABLE": saldo,
+        "AMT_TOTAL_RECEIVABLE": saldo,
+        "CNT_DRAWINGS_ATM_CURRENT": np.where(sin_retiros, np.nan, retiros_atm / 4_500),
+        "CNT_DRAWINGS_CURRENT": (retiros_atm / 4_500 + cantidad_pos + (retiros_otros > 0)).astype(np.int64),
+        "CNT_DRAWINGS_OTHER_CURRENT": np.where(sin_retiros, np.nan, (retiros_otros > 0).astype(float)),
+        "CNT_DRAWINGS_POS_CURRENT": np.where(sin_retiros, np.nan, cantidad_pos.astype(float)),
+        "CNT_INSTALMENT_MATURE_CUM": np.where(sin_minimo, np.nan, k.astype(float)),
+        "NAME_CONTRACT_STATUS": _categoria(rng, n, ESTADOS_TARJETA),
+        "SK_DPD": np.where(rng.random(n) < 0.04, rng.geometric(0.05, n), 0),
+    }
+    d["SK_DPD_DEF"] = np.where(rng.random(n) < 0.5, d["SK_DPD"], 0)
+    return _aplicar_nulos(rng, _completar(rng, d, columnas, n), NULOS["credit_card_balance"])
+
+
+def generar_installments_payments(rng, df_previous, columnas):
+    """Cuotas programadas y pagos de las solicitudes aprobadas (installments_payments)."""
+    elegibles = df_previous[df_previous["NAME_CONTRACT_STATUS"] == "Approved"]
+    probabilidad, media = ABANICO["installments_payments"]
+    conteos = _conteos(rng, len(elegibles), probabilidad, media, maximo=277)
+    padre, k = _expandir(conteos)
+    n = len(padre)
+
+    inicio = -rng.integers(30 * conteos + 1, 30 * conteos + 2923) if len(conteos) else conteos
+    dias_cuota = (inicio[padre] + 30 * k).astype(float)
+    # Diferencia entre pago y vencimiento: la mayoría paga antes o el mismo día y ~9% paga tarde
+    tipo_pago = rng.random(n)
+    diferencia = np.where(
+        tipo_pago < 0.09, rng.geometric(0.1, n), np.where(tipo_pago < 0.44, 0, -rng.geometric(1 / 15, n))
+    )
+    monto_cuota = _lognormal(rng, len(elegibles), 8_900, 1.0)[padre]
+    tipo_monto = rng.random(n)
+    pago = np.where(
+        tipo_monto < 0.09, np.round(monto_cuota * rng.random(n), 3),
+        np.where(tipo_monto < 0.11, np.round(monto_cuota * rng.uniform(1, 2, n), 3), monto_cuota),
+    )
+    sin_pago = rng.random(n) < 0.0002
+
+    d = {
+        "SK_ID_PREV": elegibles["SK_ID_PREV"].to_numpy()[padre],
+        "SK_ID_CURR": elegibles["SK_ID_CURR"].to_numpy()[padre],
+        "NUM_INSTALMENT_VERSION": _categoria(rng, n, {1: 0.64, 0: 0.3, 2: 0.04, 3: 0.014, 4: 0.004, 5: 0.002}).astype(float),
+        "NUM_INSTALMENT_NUMBER": k + 1,
+        "DAYS_INSTALMENT": dias_cuota,
+        "DAYS_ENTRY_PAYMENT": np.where(sin_pago, np.nan, dias_cuota + diferencia),
+        "AMT_INSTALMENT": monto_cuota,
+        "AMT_PAYMENT": np.where(sin_pago, np.nan, pago),
+    }
+    return _aplicar_nulos(rng, _completar(rng, d, columnas, n), NULOS["installments_payments"])
+
+
+# --- Escritura por bloques ---
+
+def _tipo_arrow(serie, tipo_sql):
+    """Tipo de la columna en Parquet: texto para TEXT y para las categorías, y numérico según el tipo SQL."""
+    if tipo_sql == "TEXT" or not pd.api.types.is_numeric_dtype(serie):
+        return pa.string()
+    if tipo_sql == "DOUBLE":
+        return pa.float64()
+    return pa.int64()
+
+
+def _a_esquema_bronze(df, columnas):
+    """
+    Convierte cada columna a como queda en bronze: en las TEXT los números se guardan como
+    texto y los nulos como texto vacío (así llegan desde los CSV); en las INT los nulos se
+    conservan como NA.
+    """
+    df = df.copy()
+    for nombre, tipo_sql in columnas:
+        serie = df[nombre]
+        numerica = pd.api.types.is_numeric_dtype(serie)
+        if tipo_sql == "TEXT":
+            if not numerica:
+                df[nombre] = serie.where(serie.notna(), "")
+                continue
+            valores = serie.to_numpy(dtype=float)
+            nulo = np.isnan(valores)
+            valores = np.where(nulo, 0.0, valores)
+            entero = valores == np.round(valores)
+            texto = np.where(entero, valores.astype(np.int64).astype(str), valores.astype(str))
+            df[nombre] = np.where(nulo, "", texto).astype(object)
+        elif tipo_sql in ("INT", "BIGINT") and numerica:
+            df[nombre] = serie.round().astype("Int64") if serie.dtype.kind == "f" else serie.astype("Int64")
+        elif tipo_sql == "DOUBLE" and numerica:
+            df[nombre] = serie.astype(float)
+    return df
+
+
+class EscritorTabla:
+    """Escribe una tabla por bloques en CSV o Parquet, sin acumular las filas en memoria."""
+
+    def __init__(self, directorio, tabla, columnas, formato):
+        self.tabla = tabla
+        self.columnas = columnas
+        self.formato = formato
+        self.filas = 0
+        self.ruta = Path(directorio) / f"{tabla}.{formato}"
+        self._escritor = None
+        self._esquema = None
+
+    def escribir(self, df):
+        df = _a_esquema_bronze(df, self.columnas)
+        if self._escritor is None:
+            # El esquema se fija con el primer bloque; los nulos del CSV quedan como campos vacíos
+            self._esquema = pa.schema([(nombre, _tipo_arrow(df[nombre], tipo)) for nombre, tipo in self.columnas])
+            if self.formato == "csv":
+                self._escritor = pa_csv.CSVWriter(self.ruta, self._esquema)
+            else:
+                self._escritor = pq.ParquetWriter(self.ruta, self._esquema)
+        self._escritor.write_table(pa.Table.from_pandas(df, schema=self._esquema, preserve_index=False))
+        self.filas += len(df)
+
+    def cerrar(self):
+        if self._escritor is not None:
+            self._escritor.close()
+
+
+def generar_datos(directorio=DIRECTORIO_SALIDA, escala=1.0, semilla=42, formato="csv", ruta_esquema=RUTA_ESQUEMA):
+    """
+    Genera las tablas bronze sintéticas en 'directorio', un archivo por tabla con el mismo
+    nombre que los CSV de Kaggle (application_train.csv, POS_CASH_balance.csv, ...).
+
+    Parámetros:
+    ----------
+    directorio : str o Path
+        Carpeta de salida (se crea si no existe).
+
+    escala : float
+        Tamaño relativo a los datos originales, entre 0.01 y 100 (1 = ~356 mil clientes).
+
+    semilla : int
+        Semilla global; la misma semilla y escala producen los mismos archivos.
+
+    formato : str
+        'csv' o 'parquet'.
+
+    ruta_esquema : str o Path
+        Archivo SQL del que se leen tablas, columnas y tipos.
+
+    Retorna:
+    --------
+    dict
+        Cantidad de filas escritas por tabla.
+    """
+    if not ESCALA_MIN <= escala <= ESCALA_MAX:
+        raise ValueError(f"La escala debe estar entre {ESCALA_MIN} y {ESCALA_MAX} (se recibió {escala}).")
+    if formato not in ("csv", "parquet"):
+        raise ValueError(f"Formato no soportado: {formato!r} (usa 'csv' o 'parquet').")
+
+    esquema = leer_esquema(ruta_esquema)
+    faltantes = [tabla for tabla in TABLAS if tabla not in esquema]
+    if faltantes:
+        raise ValueError(f"El esquema no define las tablas: {faltantes}")
+
+    directorio = Path(directorio)
+    directorio.mkdir(parents=True, exist_ok=True)
+    escritores = {tabla: EscritorTabla(directorio, tabla, esquema[tabla], formato) for tabla in TABLAS}
+
+    total_clientes = max(1, round(CLIENTES_BASE * escala))
+    siguiente_prev, siguiente_bureau = PRIMER_SK_ID_PREV, PRIMER_SK_ID_BUREAU
+    print(f"Generando {total_clientes:,} clientes sintéticos (escala {escala}, semilla {semilla}) en '{directorio}'...")
+
+    try:
+        for bloque, inicio in enumerate(range(0, total_clientes, CLIENTES_POR_BLOQUE)):
+            rng = np.random.default_rng([semilla, bloque])
+            ids = PRIMER_SK_ID_CURR + np.arange(inicio, min(inicio + CLIENTES_POR_BLOQUE, total_clientes))
+
+            df_app = generar_application(rng, ids, esquema["application_train"])
+            es_test = rng.random(len(ids)) < FRACCION_TEST
+            escritores["application_train"].escribir(df_app[~es_test])
+            # application_test no trae TARGET en los datos originales
+            escritores["application_test"].escribir(df_app[es_test].assign(TARGET=np.nan))
+
+            df_bureau, siguiente_bureau = generar_bureau(rng, ids, siguiente_bureau, esquema["bureau"])
+            escritores["bureau_balance"].escribir(generar_bureau_balance(rng, df_bureau, esquema["bureau_balance"]))
+            escritores["bureau"].escribir(df_bureau)
+
+            df_previous, siguiente_prev = generar_previous_application(rng, ids, siguiente_prev, esquema["previous_application"])
+            escritores["POS_CASH_balance"].escribir(generar_pos_cash_balance(rng, df_previous, esquema["POS_CASH_balance"]))
+            escritores["credit_card_balance"].escribir(generar_credit_card_balance(rng, df_previous, esquema["credit_card_balance"]))
+            escritores["installments_payments"].escribir(generar_installments_payments(rng, df_previous, esquema["installments_payments"]))
+            escritores["previous_application"].escribir(df_previous)
+
+            print(f"-> Bloque {bloque + 1}: {ids[-1] - PRIMER_SK_ID_CURR + 1:,} de {total_clientes:,} clientes.")
+    finally:
+        for escritor in escritores.values():
+            escritor.cerrar()
+
+    filas = {tabla: escritor.filas for tabla, escritor in escritores.items()}
+    for tabla, cantidad in filas.items():
+        print(f"   {tabla}: {cantidad:,} filas")
+    return filas
+
+
+def _escala(valor):
+    escala = float(valor)
+    if not ESCALA_MIN <= escala <= ESCALA_MAX:
+        raise argparse.ArgumentTypeError(f"debe estar entre {ESCALA_MIN} y {ESCALA_MAX}")
+    return escala
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera tablas bronze sintéticas con la forma de Home Credit.")
+    parser.add_argument("--escala", type=_escala, default=1.0, help="tamaño relativo a los datos originales (0.01 a 100)")
+    parser.add_argument("--semilla", type=int, default=42, help="semilla para resultados reproducibles")
+    parser.add_argument("--formato", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--salida", type=Path, default=DIRECTORIO_SALIDA, help="carpeta de salida")
+    args = parser.parse_args()
+
+    try:
+        generar_datos(args.salida, args.escala, args.semilla, args.formato)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
@@ -1,6 +1,7 @@
 CREATE DATABASE bronze;
 CREATE DATABASE silver;
 CREATE DATABASE gold;
+CREATE DATABASE dashboard;
 
 USE bronze;
 -- crear el esquema en silver una vez que se hayan cargado los datos en bronze y crear las claves primarias y foraneas